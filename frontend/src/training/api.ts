@@ -4,7 +4,7 @@ import {
   TrainingStringify
 } from "./types/training";
 import {TrainingTemplate, NewTrainingTemplateStringify} from "./types/trainingTemplate"
-import {PaginatedResponse} from "../types/api";
+import {CursorPaginatedResponse, PaginatedResponse} from "../types/api";
 import {
   ExerciseTemplate,
   ExerciseTemplateTag,
@@ -142,11 +142,15 @@ export function getSingleTraining(
 
 
 export function getTrainings(
-  page: number = 1
-): Promise<PaginatedResponse<TrainingStringify>> {
+  cursor?: string
+): Promise<CursorPaginatedResponse<TrainingStringify>> {
+  const params = new URLSearchParams({count: 'false'});
+  if (cursor) {
+    params.append('cursor', cursor);
+  }
   return request(
     'GET',
-    URLs['TRAININGS'] + '?page=' + page,
+    URLs['TRAININGS'] + '?' + params.toString(),
   )
 }
 
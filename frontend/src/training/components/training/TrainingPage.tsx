@@ -29,27 +29,30 @@ import DeleteIcon from "@mui/icons-material/Delete";
 
 export default function TrainingPage() {
   const [trainings, setTrainings] = useState<TrainingStringify[]>([]);
-  const [page, setPage] = useState(1);
+  const [cursor, setCursor] = useState<string | undefined>(undefined);
   const [hasMore, setHasMore] = useState(true);
   const [loading, setLoading] = useState(false);
   const loadMoreRef = useRef<HTMLDivElement>(null);
   const navigate = useNavigate();
 
-  const fetchTrainings = (pg: number, append = false) => {
+  const fetchTrainings = (pageCursor?: string, append = false) => {
     setLoading(true);
-    getTrainings(pg)
+    getTrainings(pageCursor)
       .then(({ results, next }) => {
         setTrainings(prev =>
           append ? [...prev, ...results] : results
         );
-        setPage(pg + 1);
-        setHasMore(Boolean(next));
+        const nextCursor = next
+          ? new URL(next).searchParams.get("cursor") ?? undefined
+          : undefined;
+        setCursor(nextCursor);
+        setHasMore(Boolean(nextCursor));
       })
       .finally(() => setLoading(false));
   };
 
   useEffect(() => {
-    fetchTrainings(1, false);
+    fetchTrainings(undefined, false);
   }, []);
 
   useEffect(() => {
@@ -60,7 +63,7 @@ export default function TrainingPage() {
         hasMore &&
         !loading
       ) {
-        fetchTrainings(page, true);
+        fetchTrainings(cursor, true);
       }
     }, { threshold: 1 });
     const el = loadMoreRef.current;
@@ -68,14 +71,14 @@ export default function TrainingPage() {
     return () => {
       if (el) observer.unobserve(el);
     };
-  }, [page, hasMore, loading]);
+  }, [cursor, hasMore, loading]);
 
   const handleDelete = (id: number) => {
     setTrainings(prev => prev.filter(t => t.id !== id));
 
     deleteTraining(id).catch(err => {
       console.error("Error deleting training:", err);
-      fetchTrainings(1, false);
+      fetchTrainings(undefined, false);
     });
   };
 
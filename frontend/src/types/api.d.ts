@@ -3,4 +3,11 @@ export interface PaginatedResponse<T> {
   results: T[];
   next?: string;
   previous?: string;
+}
+
+export interface CursorPaginatedResponse<T> {
+  count?: number;
+  results: T[];
+  next: string | null;
+  previous: string | null;
 }
\ No newline at end of file
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BodyMetricsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "body_metrics"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,39 @@
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Metric
+
+METRIC_IDS_CACHE_TIMEOUT = 60 * 60
+ADMIN_METRIC_IDS_KEY = "metrics:ids:admin"
+
+
+def get_user_metric_ids_key(user_id: int) -> str:
+    return f"metrics:ids:user:{user_id}"
+
+
+def get_accessible_metric_ids(user) -> set[int]:
+    """Ids of admin metrics, shared by all users, and of user metrics."""
+    user_key = get_user_metric_ids_key(user.pk)
+    cached = cache.get_many([ADMIN_METRIC_IDS_KEY, user_key])
+    to_cache = {}
+    if ADMIN_METRIC_IDS_KEY not in cached:
+        to_cache[ADMIN_METRIC_IDS_KEY] = list(
+            Metric.objects.filter(admin=True).values_list("pk", flat=True)
+        )
+    if user_key not in cached:
+        to_cache[user_key] = list(
+            Metric.objects.filter(owner=user).values_list("pk", flat=True)
+        )
+    if to_cache:
+        cache.set_many(to_cache, METRIC_IDS_CACHE_TIMEOUT)
+        cached.update(to_cache)
+    return {*cached[ADMIN_METRIC_IDS_KEY], *cached[user_key]}
+
+
+def invalidate_metric_ids(metric: Metric):
+    # The admin flag may have just changed, so both sets are dropped.
+    # They are dropped again after commit, so ids that concurrent requests
+    # read before the change do not stay cached.
+    keys = [ADMIN_METRIC_IDS_KEY, get_user_metric_ids_key(metric.owner_id)]
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
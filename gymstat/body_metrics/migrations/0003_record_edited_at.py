@@ -0,0 +1,25 @@
+# Generated by Django 5.1.4 on 2026-10-17 12:46
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def fill_edited_at(apps, schema_editor):
+    Record = apps.get_model("body_metrics", "Record")
+    Record.objects.update(edited_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("body_metrics", "0002_alter_record_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="record",
+            name="edited_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(fill_edited_at, migrations.RunPython.noop),
+    ]
@@ -40,6 +40,7 @@ class Record(models.Model):
     value = models.FloatField()
     datetime = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
+    edited_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         indexes = [models.Index(fields=["-datetime"])]
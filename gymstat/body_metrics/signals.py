@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_metric_ids
+from .models import Metric
+
+
+@receiver(post_save, sender=Metric)
+@receiver(post_delete, sender=Metric)
+def invalidate_accessible_metrics(sender, instance, **kwargs):
+    invalidate_metric_ids(instance)
@@ -1,5 +1,11 @@
+import time
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils.http import http_date
 from rest_framework.test import APITestCase
 
 from user.tests import login_data, other_user_data, user_data
@@ -23,6 +29,7 @@ def get_details_url(record: Record):
 
 class RecordAPITests(APITestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(**user_data)
         self.other_user = User.objects.create_user(**other_user_data)
 
@@ -230,3 +237,67 @@ class RecordAPITests(APITestCase):
             get_details_url(self.admin_metric_other_user_record)
         )
         self.assertEqual(response.status_code, 403)
+
+    def test_list_records_not_modified(self):
+        response = self.client.get(get_list_url(self.metric))
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        response = self.client.get(
+            get_list_url(self.metric), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        self.client.delete(get_details_url(self.user_record))
+        response = self.client.get(
+            get_list_url(self.metric), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_records_without_last_modified(self):
+        # A deletion would not advance it, so a client sending
+        # If-Modified-Since still gets the shorter list
+        response = self.client.get(get_list_url(self.metric))
+        self.assertNotIn("Last-Modified", response)
+        self.client.delete(get_details_url(self.user_record))
+        response = self.client.get(
+            get_list_url(self.metric),
+            HTTP_IF_MODIFIED_SINCE=http_date(time.time()),
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_records_skips_metric_query(self):
+        self.client.get(get_list_url(self.metric))
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(get_list_url(self.metric))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(
+            any(
+                Metric._meta.db_table in query["sql"]
+                for query in context.captured_queries
+            )
+        )
+
+    def test_get_records_invalid_metric(self):
+        response = self.client.get(get_create_url() + "?metric=weight")
+        self.assertEqual(response.status_code, 400)
+
+    def test_create_record_new_metric(self):
+        self.client.get(get_list_url(self.metric))
+        response = self.client.post(
+            reverse("metrics:get-create-metrics"),
+            {"name": "Waist", "unit": "cm"},
+        )
+        self.new_record_data["metric"] = response.data["id"]
+        response = self.client.post(get_create_url(), self.new_record_data)
+        self.assertEqual(response.status_code, 201)
+
+    def test_metric_shared_with_admin_flag(self):
+        self.new_record_data["metric"] = self.other_user_metric.pk
+        self.client.get(get_list_url(self.metric))
+        self.other_user_metric.admin = True
+        self.other_user_metric.save()
+        response = self.client.post(get_create_url(), self.new_record_data)
+        self.assertEqual(response.status_code, 201)
@@ -1,8 +1,10 @@
-from django.db.models import Q
 from rest_framework import generics
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.permissions import IsAuthenticated
 
+from gymstat.mixins import ConditionalGetMixin
+
+from .cache import get_accessible_metric_ids
 from .models import Metric, Record
 from .permissions import IsAdminObjectReadOnly, IsOwner
 from .serializers import MetricSerializer, RecordSerializer
@@ -21,7 +23,9 @@ class MetricListCreateAPIView(generics.ListCreateAPIView):
         elif metric_type == "admin":
             return Metric.objects.filter(admin=True)
         elif metric_type == "all":
-            return Metric.objects.filter(Q(owner=user) | Q(admin=True))
+            return Metric.objects.filter(
+                pk__in=get_accessible_metric_ids(user)
+            )
         else:
             return Metric.objects.none()
 
@@ -40,7 +44,7 @@ class MetricRetrieveUpdateDestroyAPIView(
     queryset = Metric.objects.all()
 
 
-class RecordListCreateAPIView(generics.ListCreateAPIView):
+class RecordListCreateAPIView(ConditionalGetMixin, generics.ListCreateAPIView):
     serializer_class = RecordSerializer
     permission_classes = [IsAuthenticated]
 
@@ -53,22 +57,23 @@ class RecordListCreateAPIView(generics.ListCreateAPIView):
                 {"metric": "This query parameter is required."}
             )
 
-        # Verify metric exists and user can access it
         try:
-            metric = Metric.objects.get(
-                Q(pk=metric_id), Q(owner=user) | Q(admin=True)
-            )
-        except Metric.DoesNotExist:
+            metric_id = int(metric_id)
+        except ValueError:
+            raise ValidationError({"metric": "Must be an integer."})
+
+        # Verify metric exists and user can access it
+        if metric_id not in get_accessible_metric_ids(user):
             raise PermissionDenied("You do not have access to this metric.")
 
-        return Record.objects.filter(owner=user, metric=metric)
+        return Record.objects.filter(owner=user, metric_id=metric_id)
 
     def perform_create(self, serializer):
         user = self.request.user
         metric = serializer.validated_data["metric"]
 
         # Check if metric is accessible (user-owned or admin)
-        if not (metric.admin or metric.owner == user):
+        if metric.pk not in get_accessible_metric_ids(user):
             raise PermissionDenied(
                 "Cannot create record for unauthorized metric."
             )
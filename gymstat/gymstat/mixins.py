@@ -0,0 +1,70 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(version: str) -> str:
+    return quote_etag(
+        hashlib.md5(version.encode(), usedforsecurity=False).hexdigest()
+    )
+
+
+class ConditionalGetMixin:
+    """
+    Answer GET requests of generic views with 304 Not Modified when the
+    client copy is current, before anything is serialized. Validators are
+    'edited_at' of the object, or max('edited_at') and the count of the
+    filtered queryset for lists, so deletions change them too. Lists send
+    no Last-Modified, which a deletion would not advance.
+    """
+
+    last_modified_field = "edited_at"
+
+    def get_object(self):
+        # Validators and retrieve() share one lookup
+        if not hasattr(self, "_object"):
+            self._object = super().get_object()
+        return self._object
+
+    def get_validators(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        if lookup_url_kwarg in self.kwargs:
+            count = 1
+            last_modified = getattr(
+                self.get_object(), self.last_modified_field
+            )
+        else:
+            aggregates = (
+                self.filter_queryset(self.get_queryset())
+                .order_by()
+                .aggregate(
+                    count=Count("pk"),
+                    last_modified=Max(self.last_modified_field),
+                )
+            )
+            count = aggregates["count"]
+            last_modified = aggregates["last_modified"]
+        version = (
+            f"{self.request.user.pk}:{count}:"
+            f"{last_modified.isoformat() if last_modified else ''}"
+        )
+        if lookup_url_kwarg not in self.kwargs:
+            # A deletion does not move max('edited_at') forward, so lists
+            # are validated by the ETag only
+            last_modified = None
+        return make_etag(version), last_modified
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators()
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        response = get_conditional_response(
+            request, etag=etag, last_modified=timestamp
+        )
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+        return response
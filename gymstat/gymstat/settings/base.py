@@ -177,6 +177,17 @@ CACHES = {
 
 SITE_ID = 1
 
+# Serve GET requests of trainings with the read-only row serializers
+TRAINING_FAST_READ_SERIALIZERS = config(
+    "TRAINING_FAST_READ_SERIALIZERS", default=True, cast=bool
+)
+
+# Deletions older than this are compacted away; clients that synced
+# before that have to download everything again
+TOMBSTONE_RETENTION_DAYS = config(
+    "TOMBSTONE_RETENTION_DAYS", default=90, cast=int
+)
+
 # allauth settings
 # https://docs.allauth.org/en/latest/account/configuration.html
 
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import time
+from collections.abc import Iterable
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import transaction
+
+# Every change of exercise templates bumps a version that is part of the
+# keys of cached lists, so stale entries are never read and just expire.
+EXERCISE_TEMPLATES_CACHE_TIMEOUT = 60 * 60
+EXERCISE_TEMPLATE_LIST_PARAMS = ["type", "tags", "fields", "search", "page"]
+# How long a worker trusts its admin templates without asking Redis
+ADMIN_TEMPLATES_CHECK_INTERVAL = 1
+
+
+def get_version_key(owner_id: int | None = None) -> str:
+    """Version of admin templates, or of templates of one owner."""
+    if owner_id is None:
+        return "exercise-templates:version:admin"
+    return f"exercise-templates:version:user:{owner_id}"
+
+
+def get_versions(*keys: str) -> list[int]:
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Start from the clock, so a version lost by eviction does not
+            # go back to a number used by entries that are still cached
+            cache.add(key, time.time_ns(), timeout=None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def _increment_version(owner_id: int | None = None):
+    key = get_version_key(owner_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+    if owner_id is None:
+        admin_templates.invalidate()
+
+
+def bump_version(owner_id: int | None = None):
+    # The version is bumped again after commit, so lists and admin
+    # snapshots that concurrent requests load before the change is visible
+    # are not kept under the new version.
+    _increment_version(owner_id)
+    transaction.on_commit(lambda: _increment_version(owner_id))
+
+
+def get_exercise_template_list_key(user, query_params) -> str:
+    """
+    Key of an exercise templates list response. Lists of admin templates
+    are the same for all users and are shared.
+    """
+    exercise_type = query_params.get("type", "all")
+    version_keys = []
+    if exercise_type != "user":
+        version_keys.append(get_version_key())
+    if exercise_type != "admin":
+        version_keys.append(get_version_key(user.pk))
+    versions = get_versions(*version_keys)
+    if exercise_type != "admin":
+        versions.append(f"user:{user.pk}")
+    params = json.dumps(
+        [
+            query_params.get(param, "")
+            for param in EXERCISE_TEMPLATE_LIST_PARAMS
+        ]
+    )
+    digest = hashlib.md5(params.encode(), usedforsecurity=False).hexdigest()
+    return f"exercise-templates:list:{':'.join(map(str, versions))}:{digest}"
+
+
+class AdminTemplates:
+    """
+    Process-local snapshot of active admin exercise templates. The admin
+    version in Redis is the generation counter: other workers bump it and
+    the snapshot is reloaded once it differs. The templates are shared
+    between requests and must not be modified.
+    """
+
+    def __init__(self):
+        self.generation = None
+        self.checked_at = 0.0
+        self.by_id = {}
+        self.by_name = {}
+
+    def invalidate(self):
+        self.generation = None
+
+    def refresh(self):
+        now = time.monotonic()
+        if (
+            self.generation is not None
+            and now - self.checked_at < ADMIN_TEMPLATES_CHECK_INTERVAL
+        ):
+            return
+        generation = get_versions(get_version_key())[0]
+        if generation != self.generation:
+            ExerciseTemplate = apps.get_model("training", "ExerciseTemplate")
+            templates = ExerciseTemplate.objects.filter(
+                is_admin=True, is_active=True
+            ).order_by("pk")
+            by_id = {template.pk: template for template in templates}
+            by_name = {}
+            for template in by_id.values():
+                by_name.setdefault(template.name, template)
+            # Swap whole mappings, so concurrent readers see one snapshot
+            self.by_id, self.by_name = by_id, by_name
+            self.generation = generation
+        self.checked_at = now
+
+    def get_by_ids(self) -> dict:
+        self.refresh()
+        return self.by_id
+
+    def get_by_names(self) -> dict:
+        self.refresh()
+        return self.by_name
+
+
+admin_templates = AdminTemplates()
+
+
+def get_exercise_templates(template_ids: Iterable[int]) -> dict:
+    """
+    in_bulk for exercise templates that takes admin templates from the
+    process-local snapshot and queries only the others.
+    """
+    admin = admin_templates.get_by_ids()
+    templates = {pk: admin[pk] for pk in template_ids if pk in admin}
+    missing = set(template_ids) - set(templates)
+    if missing:
+        ExerciseTemplate = apps.get_model("training", "ExerciseTemplate")
+        templates.update(ExerciseTemplate.objects.in_bulk(missing))
+    return templates
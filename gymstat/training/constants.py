@@ -32,3 +32,31 @@ ALLOWED_EXERCISE_TAGS = {
     "yoga",
     "pilates",
 }
+CANONICAL_UNITS = {
+    "weight": "kg",
+    "distance": "m",
+    "speed": "mps",
+}
+UNIT_FACTORS = {
+    "kg": 1,
+    "lbs": 0.45359237,
+    "m": 1,
+    "km": 1000,
+    "mi": 1609.344,
+    "mps": 1,
+    "kph": 1 / 3.6,
+    "mph": 0.44704,
+}
+RECORD_FIELDS = ["weight", "reps", "distance", "speed", "rounds", "successes"]
+STATISTICS_PERIODS = ["day", "week", "month"]
+STATISTICS_AGGREGATES = ["max", "sum", "count"]
+TRAINING_SUMMARY_FIELDS = [
+    "id",
+    "template",
+    "conducted",
+    "title",
+    "exercises_count",
+]
+TRAINING_BATCH_MAX_SIZE = 100
+# Largest int and duration (seconds) an ExerciseSet integer column holds
+EXERCISE_VALUE_MAX = 2**31 - 1
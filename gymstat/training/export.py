@@ -0,0 +1,121 @@
+import csv
+import json
+from collections.abc import Iterator
+
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .constants import ALLOWED_EXERCISE_FIELDS, CANONICAL_UNITS
+from .models import Exercise
+from .serializers import DATETIME_FIELD
+
+User = get_user_model()
+
+EXPORT_FORMATS = ["csv", "ndjson"]
+EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+EXPORT_META_COLUMNS = [
+    "training",
+    "conducted",
+    "title",
+    "exercise",
+    "template",
+    "template_name",
+    "order",
+    "set",
+]
+EXPORT_UNIT_COLUMNS = {field: f"{field}_unit" for field in CANONICAL_UNITS}
+EXPORT_CSV_COLUMNS = [
+    *EXPORT_META_COLUMNS,
+    *ALLOWED_EXERCISE_FIELDS,
+    *EXPORT_UNIT_COLUMNS.values(),
+]
+
+
+def iter_set_rows(
+    owner: User, chunk_size: int = 1000
+) -> Iterator[tuple[dict, dict, dict]]:
+    """
+    Yield (meta, values, units) for every set of the owner's trainings,
+    oldest first. Exercises are read through a server-side cursor, so
+    memory stays constant for any history length.
+    """
+    exercises = (
+        Exercise.objects.filter(training__owner=owner)
+        .order_by("training__conducted", "training_id", "order")
+        .values_list(
+            "training_id",
+            "training__conducted",
+            "training__title",
+            "id",
+            "template_id",
+            "template__name",
+            "order",
+            "units",
+            "sets",
+        )
+        .iterator(chunk_size=chunk_size)
+    )
+    for (
+        training_id,
+        conducted,
+        title,
+        exercise_id,
+        template_id,
+        template_name,
+        order,
+        units,
+        sets,
+    ) in exercises:
+        meta = {
+            "training": training_id,
+            "conducted": DATETIME_FIELD.to_representation(conducted),
+            "title": title,
+            "exercise": exercise_id,
+            "template": template_id,
+            "template_name": template_name,
+            "order": order,
+        }
+        for number, values in enumerate(sets or [], start=1):
+            yield {**meta, "set": number}, values, units or {}
+
+
+class Echo:
+    """File-like object that returns written values to the csv writer."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(rows: Iterator[tuple[dict, dict, dict]]) -> Iterator[str]:
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_CSV_COLUMNS)
+    for meta, values, units in rows:
+        yield writer.writerow(
+            [meta[column] for column in EXPORT_META_COLUMNS]
+            + [values.get(field, "") for field in ALLOWED_EXERCISE_FIELDS]
+            + [
+                units.get(field, "") if field in values else ""
+                for field in EXPORT_UNIT_COLUMNS
+            ]
+        )
+
+
+def iter_ndjson(rows: Iterator[tuple[dict, dict, dict]]) -> Iterator[str]:
+    for meta, values, units in rows:
+        row = {
+            **meta,
+            "values": values,
+            "units": {
+                field: unit for field, unit in units.items() if field in values
+            },
+        }
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+EXPORT_RENDERERS = {
+    "csv": iter_csv,
+    "ndjson": iter_ndjson,
+}
@@ -0,0 +1,248 @@
+import csv
+import io
+import time
+from collections.abc import Callable, Iterable
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from rest_framework import serializers
+
+from .cache import admin_templates
+from .constants import ALLOWED_EXERCISE_FIELDS
+from .export import EXPORT_UNIT_COLUMNS
+from .models import Exercise, ExerciseTemplate, Training
+from .serializers import DATETIME_FIELD
+from .validators import EXERCISE_SCHEMA
+
+User = get_user_model()
+
+# Bigger INSERT statements get slower to bind than to execute
+INSERT_BATCH_SIZE = 1000
+
+
+def parse_csv_trainings(file: Iterable[str]) -> list[dict]:
+    """
+    Group rows of the CSV export (one row per set) back into trainings
+    data. Rows of one training share the 'training' column, rows of one
+    exercise share the 'exercise' column.
+    """
+    trainings = {}
+    for row in csv.DictReader(file):
+        training = trainings.setdefault(
+            row.get("training"),
+            {
+                "conducted": row.get("conducted"),
+                "title": row.get("title") or None,
+                "exercises": {},
+            },
+        )
+        exercise = training["exercises"].setdefault(
+            row.get("exercise") or row.get("order"),
+            {
+                "template": row.get("template_name"),
+                "order": row.get("order"),
+                "units": {},
+                "sets": [],
+            },
+        )
+        exercise["sets"].append(
+            {
+                field: row[field]
+                for field in ALLOWED_EXERCISE_FIELDS
+                if row.get(field)
+            }
+        )
+        for field, column in EXPORT_UNIT_COLUMNS.items():
+            if row.get(column):
+                exercise["units"][field] = row[column]
+    for training in trainings.values():
+        training["exercises"] = list(training["exercises"].values())
+    return list(trainings.values())
+
+
+def parse_csv_bytes(content: bytes) -> list[dict]:
+    return parse_csv_trainings(io.StringIO(content.decode("utf-8-sig")))
+
+
+class TrainingImporter:
+    """
+    Imports trainings of one owner given as TrainingSerializer-like dicts
+    whose exercise templates are referenced by name.
+
+    All template names are resolved with one query. Trainings are then
+    validated and written chunk by chunk, every chunk with bulk_create in
+    its own transaction. Invalid trainings are skipped and reported.
+    """
+
+    def __init__(self, owner: User, chunk_size: int = 500):
+        self.owner = owner
+        self.chunk_size = chunk_size
+
+    def import_trainings(
+        self,
+        trainings_data: list[dict],
+        on_progress: Callable[[int, dict], None] | None = None,
+        start: int = 0,
+        result: dict | None = None,
+    ) -> dict:
+        """
+        Import the trainings and return counts, errors and throughput.
+        'on_progress' is called after every chunk with the number of
+        processed trainings and the result so far, in the transaction of
+        the chunk. An interrupted import continues from 'start' with the
+        'result' it reported last.
+        """
+        started = time.perf_counter()
+        templates = self.get_templates(trainings_data[start:])
+        result = {
+            "trainings": 0,
+            "exercises": 0,
+            "sets": 0,
+            "errors": [],
+            **(result or {}),
+        }
+        for chunk_start in range(start, len(trainings_data), self.chunk_size):
+            end = chunk_start + self.chunk_size
+            chunk = []
+            for number, training_data in enumerate(
+                trainings_data[chunk_start:end], start=chunk_start + 1
+            ):
+                training, exercises, errors = self.build_training(
+                    training_data, templates
+                )
+                if errors:
+                    result["errors"].append(
+                        {"training": number, "errors": errors}
+                    )
+                else:
+                    chunk.append((training, exercises))
+            for _, exercises in chunk:
+                result["trainings"] += 1
+                result["exercises"] += len(exercises)
+                result["sets"] += sum(
+                    len(exercise.sets or []) for exercise in exercises
+                )
+            with transaction.atomic():
+                self.save_chunk(chunk)
+                if on_progress is not None:
+                    on_progress(min(end, len(trainings_data)), result)
+        seconds = time.perf_counter() - started
+        result["seconds"] = round(seconds, 3)
+        result["rows_per_second"] = round(
+            result["sets"] / seconds if seconds else 0
+        )
+        return result
+
+    def get_templates(self, trainings_data: list[dict]) -> dict:
+        """Map template names to active templates usable by the owner."""
+        names = set()
+        for training_data in trainings_data:
+            if not isinstance(training_data, dict):
+                continue
+            exercises_data = training_data.get("exercises")
+            if not isinstance(exercises_data, list):
+                continue
+            for exercise_data in exercises_data:
+                if not isinstance(exercise_data, dict):
+                    continue
+                name = exercise_data.get("template")
+                # Other values are reported by build_training
+                if isinstance(name, str):
+                    names.add(name)
+        admin = admin_templates.get_by_names()
+        templates = {name: admin[name] for name in names if name in admin}
+        # The owner's templates take precedence over admin ones
+        templates.update(
+            (template.name, template)
+            for template in ExerciseTemplate.objects.filter(
+                owner=self.owner, is_active=True, name__in=names
+            )
+        )
+        return templates
+
+    def build_training(
+        self, training_data: dict, templates: dict
+    ) -> tuple[Training | None, list[Exercise], dict]:
+        """Return unsaved training and exercises, or validation errors."""
+        if not isinstance(training_data, dict):
+            return None, [], {"training": ["Training must be a dict"]}
+
+        errors = {}
+        conducted = None
+        try:
+            conducted = DATETIME_FIELD.to_internal_value(
+                training_data.get("conducted")
+            )
+        except serializers.ValidationError as exc:
+            errors["conducted"] = exc.detail
+        training = Training(
+            owner=self.owner,
+            conducted=conducted,
+            title=training_data.get("title"),
+            description=training_data.get("description"),
+            notes=training_data.get("notes"),
+        )
+        try:
+            training.full_clean(exclude=["owner", "template", "conducted"])
+        except ValidationError as exc:
+            errors.update(exc.message_dict)
+
+        exercises_data = training_data.get("exercises") or []
+        if not isinstance(exercises_data, list):
+            errors["exercises"] = ["Exercises data must be a list"]
+            return None, [], errors
+
+        exercises = []
+        exercise_errors = {}
+        for number, exercise_data in enumerate(exercises_data, start=1):
+            if not isinstance(exercise_data, dict):
+                exercise_errors[number] = ["Exercise must be a dict"]
+                continue
+            name = exercise_data.get("template")
+            template = templates.get(name) if isinstance(name, str) else None
+            units = exercise_data.get("units")
+            sets = exercise_data.get("sets")
+            order = exercise_data.get("order", number)
+            messages = [
+                *EXERCISE_SCHEMA.get_units_errors(units),
+                *EXERCISE_SCHEMA.get_sets_errors(sets),
+                *EXERCISE_SCHEMA.get_missing_units_errors(sets, units),
+            ]
+            try:
+                order = int(order)
+            except (TypeError, ValueError):
+                messages.append(f"Order '{order}' must be an integer")
+            if template is None:
+                messages.append(f"Unknown exercise template '{name}'")
+            if messages:
+                exercise_errors[number] = messages
+                continue
+            exercises.append(
+                Exercise(
+                    training=training,
+                    template=template,
+                    order=order,
+                    units=units,
+                    sets=sets,
+                )
+            )
+        if exercise_errors:
+            errors["exercises"] = exercise_errors
+        elif {exercise.order for exercise in exercises} != set(
+            range(1, len(exercises) + 1)
+        ):
+            errors["exercises"] = [
+                "The order of exercises is incorrect. "
+                "It should start from 1 and increase by 1."
+            ]
+
+        if errors:
+            return None, [], errors
+        return training, exercises, {}
+
+    def save_chunk(self, chunk: list[tuple[Training, list[Exercise]]]):
+        if chunk:
+            Training.objects.bulk_create_trainings(
+                self.owner, chunk, batch_size=INSERT_BATCH_SIZE
+            )
@@ -0,0 +1,27 @@
+import datetime
+from functools import cache
+
+import redis
+from django.conf import settings
+
+IMPORT_QUEUE_KEY = "training:import-jobs"
+# A running job without progress for this long lost its worker
+IMPORT_JOB_STALE_AFTER = datetime.timedelta(minutes=10)
+
+
+@cache
+def get_queue_client() -> redis.Redis:
+    """Client of the Redis server behind the default cache."""
+    return redis.Redis.from_url(settings.CACHES["default"]["LOCATION"])
+
+
+def enqueue_import_job(job_id: int):
+    get_queue_client().rpush(IMPORT_QUEUE_KEY, job_id)
+
+
+def pop_import_job(timeout: int = 5) -> int | None:
+    """Wait up to 'timeout' seconds for the next queued job id."""
+    item = get_queue_client().blpop([IMPORT_QUEUE_KEY], timeout=timeout)
+    if item is None:
+        return None
+    return int(item[1])
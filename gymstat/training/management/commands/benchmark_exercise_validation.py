@@ -0,0 +1,109 @@
+import random
+import timeit
+from datetime import datetime
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+
+from ...constants import ALLOWED_EXERCISE_FIELDS
+from ...utils import check_exercise_field
+from ...validators import EXERCISE_SCHEMA
+
+
+def make_sets(count: int) -> list[dict]:
+    rng = random.Random(0)
+    return [
+        {
+            "reps": str(rng.randint(1, 20)),
+            "weight": f"{rng.uniform(20, 200):.1f}",
+            "rest": f"0{rng.randint(0, 5)}:{rng.randint(10, 59)}",
+            "rpe": str(rng.randint(1, 10)),
+            "tempo": "3-1-1",
+        }
+        for _ in range(count)
+    ]
+
+
+def check_exercise_field_previous(field: str, value: str):
+    """check_exercise_field as it was before the parser table."""
+    match field:
+        case "text":
+            return True
+        case "int":
+            try:
+                int(value)
+            except ValueError:
+                raise ValidationError(
+                    f"Value '{value}' do not match type '{field}'"
+                )
+            else:
+                return True
+        case "float":
+            try:
+                float(value)
+            except ValueError:
+                raise ValidationError(
+                    f"Value '{value}' do not match type '{field}'"
+                )
+            else:
+                return True
+        case "duration":
+            for fmt in ("%H:%M:%S", "%M:%S"):
+                try:
+                    datetime.strptime(value, fmt)
+                except ValueError:
+                    continue
+                else:
+                    return True
+            raise ValidationError(
+                f"Value '{value}' do not match type '{field}'"
+            )
+        case _:
+            raise ValidationError(f"Got unexpected field type '{field}'")
+
+
+def validate_previous(sets: list[dict]):
+    """validate_exercise_sets as it was before the compiled schema."""
+    for exercise in sets:
+        for field, value in exercise.items():
+            if field not in ALLOWED_EXERCISE_FIELDS:
+                raise ValidationError(f"Got unexpected field {field}")
+            field_type = ALLOWED_EXERCISE_FIELDS[field]
+            if isinstance(field_type, list):
+                field_type = field_type[0]
+            check_exercise_field_previous(field_type, value)
+
+
+def validate_per_cell(sets: list[dict]):
+    for exercise in sets:
+        for field, value in exercise.items():
+            field_type = ALLOWED_EXERCISE_FIELDS[field]
+            if isinstance(field_type, list):
+                field_type = field_type[0]
+            check_exercise_field(field_type, value)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the previous validation of exercise sets with per-cell "
+        "calls of the parser table and the compiled schema"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sets", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **kwargs):
+        sets = make_sets(kwargs["sets"])
+        repeat = kwargs["repeat"]
+        for name, func in (
+            ("previous", validate_previous),
+            ("per cell", validate_per_cell),
+            ("compiled", EXERCISE_SCHEMA.get_sets_errors),
+        ):
+            seconds = min(
+                timeit.repeat(lambda: func(sets), number=1, repeat=repeat)
+            )
+            self.stdout.write(
+                f"{name}: {seconds * 1000:.2f} ms per {len(sets)} sets"
+            )
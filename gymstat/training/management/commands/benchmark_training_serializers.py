@@ -0,0 +1,100 @@
+import datetime
+import json
+import random
+import timeit
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.utils.encoders import JSONEncoder
+
+from ...models import ExerciseTemplate, Training
+from ...serializers import TrainingReadSerializer, TrainingSerializer
+
+User = get_user_model()
+
+
+def make_exercises_data(
+    template: ExerciseTemplate, count: int, sets: int, rng: random.Random
+) -> list[dict]:
+    return [
+        {
+            "template": template,
+            "order": order,
+            "units": {"weight": "kg"},
+            "sets": [
+                {
+                    "reps": str(rng.randint(1, 20)),
+                    "weight": f"{rng.uniform(20, 200):.1f}",
+                    "rest": f"0{rng.randint(0, 5)}:{rng.randint(10, 59)}",
+                }
+                for _ in range(sets)
+            ],
+        }
+        for order in range(1, count + 1)
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare TrainingSerializer and TrainingReadSerializer on a page "
+        "of trainings created in a rolled back transaction"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--trainings", type=int, default=60)
+        parser.add_argument("--exercises", type=int, default=6)
+        parser.add_argument("--sets", type=int, default=5)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **kwargs):
+        with transaction.atomic():
+            self.benchmark(**kwargs)
+            transaction.set_rollback(True)
+
+    def benchmark(self, **kwargs):
+        rng = random.Random(0)
+        user = User.objects.create_user(
+            email="benchmark@example.com",
+            password=None,
+            first_name="Benchmark",
+            last_name="User",
+        )
+        template = ExerciseTemplate.objects.create(
+            name="Bench press", owner=user, fields=["reps", "weight", "rest"]
+        )
+        conducted = datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC)
+        for day in range(kwargs["trainings"]):
+            Training.objects.create_training(
+                owner=user,
+                conducted=conducted + datetime.timedelta(days=day),
+                title=f"Training {day}",
+                exercises_data=make_exercises_data(
+                    template, kwargs["exercises"], kwargs["sets"], rng
+                ),
+            )
+        trainings = list(
+            Training.objects.prefetch_related("exercises").filter(owner=user)
+        )
+
+        outputs = {}
+        for name, serializer_class in (
+            ("model serializer", TrainingSerializer),
+            ("read serializer", TrainingReadSerializer),
+        ):
+            outputs[name] = json.dumps(
+                serializer_class(trainings, many=True).data, cls=JSONEncoder
+            )
+            seconds = min(
+                timeit.repeat(
+                    lambda: serializer_class(trainings, many=True).data,
+                    number=1,
+                    repeat=kwargs["repeat"],
+                )
+            )
+            self.stdout.write(
+                f"{name}: {seconds * 1000:.2f} ms "
+                f"per {len(trainings)} trainings"
+            )
+        if len(set(outputs.values())) != 1:
+            raise CommandError("Serializers produced different output")
@@ -0,0 +1,107 @@
+import datetime
+import random
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from ...models import Exercise, ExerciseSet, ExerciseTemplate, Training
+from .benchmark_training_serializers import make_exercises_data
+
+User = get_user_model()
+
+
+def recreate_exercises(
+    training: Training,
+    previous_exercises: list[Exercise],
+    exercises: list[Exercise],
+):
+    """Write path of update_training before exercises were diffed."""
+    Exercise.objects.filter(training=training).delete()
+    Exercise.objects.bulk_create(exercises)
+    ExerciseSet.objects.create_for_exercises(training, exercises)
+
+
+def get_wal_lsn() -> str:
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_current_wal_insert_lsn()")
+        return cursor.fetchone()[0]
+
+
+def get_wal_bytes(since: str) -> int:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), %s)",
+            [since],
+        )
+        return int(cursor.fetchone()[0])
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure WAL written by recreating and by diffing the exercises of "
+        "an updated training, in a rolled back transaction"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--exercises", type=int, default=50)
+        parser.add_argument("--sets", type=int, default=5)
+        parser.add_argument("--repeat", type=int, default=5)
+
+    def handle(self, *args, **kwargs):
+        with transaction.atomic():
+            self.benchmark(**kwargs)
+            transaction.set_rollback(True)
+
+    def benchmark(self, **kwargs):
+        rng = random.Random(0)
+        user = User.objects.create_user(
+            email="benchmark@example.com",
+            password=None,
+            first_name="Benchmark",
+            last_name="User",
+        )
+        template = ExerciseTemplate.objects.create(
+            name="Bench press", owner=user, fields=["reps", "weight", "rest"]
+        )
+        exercises_data = make_exercises_data(
+            template, kwargs["exercises"], kwargs["sets"], rng
+        )
+        training = Training.objects.create_training(
+            owner=user,
+            conducted=datetime.datetime(2025, 1, 1, tzinfo=datetime.UTC),
+            exercises_data=exercises_data,
+        )
+        edited_data = [dict(exercise_data) for exercise_data in exercises_data]
+        edited = edited_data[len(edited_data) // 2]
+        edited["sets"] = [{**edited["sets"][0], "weight": "1000"}]
+
+        for scenario, data in (
+            ("edit one exercise", edited_data),
+            ("resave unchanged", exercises_data),
+        ):
+            for name, write in (
+                ("recreate", recreate_exercises),
+                ("in place", Training.objects._apply_exercise_changes),
+            ):
+                wal_bytes = min(
+                    self.measure(training, data, write)
+                    for _ in range(kwargs["repeat"])
+                )
+                self.stdout.write(
+                    f"{scenario}, {name}: {wal_bytes} bytes of WAL"
+                )
+
+    @staticmethod
+    def measure(training: Training, exercises_data: list, write) -> int:
+        # Every run starts from the same stored exercises
+        with transaction.atomic():
+            previous_exercises = list(training.exercises.all())
+            exercises = Training.objects._process_exercise_data(
+                training.owner, training, exercises_data
+            )
+            since = get_wal_lsn()
+            write(training, previous_exercises, exercises)
+            wal_bytes = get_wal_bytes(since)
+            transaction.set_rollback(True)
+        return wal_bytes
@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...models import Tombstone
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete tombstones older than TOMBSTONE_RETENTION_DAYS. "
+        "Run periodically, e.g. daily from cron"
+    )
+
+    def handle(self, *args, **kwargs):
+        deleted = Tombstone.objects.compact()
+        self.stdout.write(
+            f"Deleted {deleted} tombstones older than "
+            f"{settings.TOMBSTONE_RETENTION_DAYS} days"
+        )
@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from ...imports import TrainingImporter, parse_csv_trainings
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Import trainings of a user from a CSV export or a JSON list"
+
+    def add_arguments(self, parser):
+        parser.add_argument("email")
+        parser.add_argument("path", type=Path)
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def handle(self, *args, **kwargs):
+        try:
+            owner = User.objects.get(email=kwargs["email"])
+        except User.DoesNotExist:
+            raise CommandError(f"User {kwargs['email']} does not exist")
+
+        path = kwargs["path"]
+        with path.open(encoding="utf-8-sig", newline="") as file:
+            if path.suffix == ".csv":
+                trainings_data = parse_csv_trainings(file)
+            elif path.suffix == ".json":
+                trainings_data = json.load(file)
+            else:
+                raise CommandError("Only .csv and .json files are supported")
+        if not isinstance(trainings_data, list):
+            raise CommandError("JSON file must contain a list of trainings")
+
+        result = TrainingImporter(
+            owner, chunk_size=kwargs["chunk_size"]
+        ).import_trainings(trainings_data)
+        for error in result["errors"]:
+            self.stderr.write(
+                f"Training #{error['training']}: {error['errors']}"
+            )
+        self.stdout.write(
+            f"Imported {result['trainings']} trainings, "
+            f"{result['exercises']} exercises and {result['sets']} sets "
+            f"in {result['seconds']} s ({result['rows_per_second']} rows/s)"
+        )
@@ -0,0 +1,35 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models.functions import TruncDate
+
+from ...models import ExerciseStatistic, PersonalRecord, Training
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild per-day exercise statistics and personal records "
+        "from stored trainings"
+    )
+
+    def handle(self, *args, **kwargs):
+        users_count = 0
+        for user in User.objects.all():
+            # Readers never see a user without statistics mid-rebuild
+            with transaction.atomic():
+                dates = set(
+                    Training.objects.filter(owner=user)
+                    .annotate(date=TruncDate("conducted"))
+                    .values_list("date", flat=True)
+                )
+                ExerciseStatistic.objects.filter(owner=user).delete()
+                PersonalRecord.objects.rebuild(user)
+                if dates:
+                    ExerciseStatistic.objects.rebuild(user, dates)
+                    users_count += 1
+        self.stdout.write(
+            "Rebuilt exercise statistics and records "
+            f"for {users_count} users"
+        )
@@ -0,0 +1,56 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from ...jobs import IMPORT_JOB_STALE_AFTER, enqueue_import_job, pop_import_job
+from ...models import ImportJob
+
+
+class Command(BaseCommand):
+    help = "Process queued training import jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit once the queue is empty",
+        )
+        parser.add_argument("--timeout", type=int, default=5)
+
+    def handle(self, *args, **kwargs):
+        # Jobs lost from the queue when Redis was flushed are picked up
+        # again; a job is claimed atomically, so duplicates in the queue
+        # are safe
+        pending = ImportJob.objects.filter(
+            status=ImportJob.Status.PENDING
+        ).values_list("pk", flat=True)
+        for job_id in pending:
+            enqueue_import_job(job_id)
+
+        recover_at = 0.0
+        while True:
+            if time.monotonic() >= recover_at:
+                # Jobs of workers that died while running them
+                for job_id in ImportJob.objects.requeue_stale_jobs():
+                    enqueue_import_job(job_id)
+                recover_at = (
+                    time.monotonic() + IMPORT_JOB_STALE_AFTER.total_seconds()
+                )
+
+            job_id = pop_import_job(timeout=kwargs["timeout"])
+            if job_id is None:
+                if kwargs["once"]:
+                    break
+                continue
+            # Connections may have timed out while waiting for the queue
+            close_old_connections()
+            try:
+                job = ImportJob.objects.run_job(job_id)
+            finally:
+                close_old_connections()
+            if job is not None:
+                self.stdout.write(
+                    f"Import job {job.pk} {job.status}: "
+                    f"{job.processed}/{job.total} trainings"
+                )
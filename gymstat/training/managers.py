@@ -1,15 +1,37 @@
 from __future__ import annotations
 
 import datetime
+import logging
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING
 
+import redis
 from django.apps import apps
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import PermissionDenied, ValidationError
 from django.db import models, transaction
+from django.db.models import Count, F, Max, Q, Sum, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce, TruncDate
+from django.utils import timezone
+
+from .cache import get_exercise_templates
+from .constants import RECORD_FIELDS
+from .jobs import IMPORT_JOB_STALE_AFTER, enqueue_import_job
+from .statistics import (
+    STATISTIC_FIELDS,
+    collect_records,
+    collect_statistics,
+    get_set_values,
+    merge_records,
+    merge_statistics,
+)
 
 if TYPE_CHECKING:
     from training.models import (
+        Exercise,
+        ImportJob,
         Training,
         TrainingTemplate,
     )
@@ -17,6 +39,50 @@ if TYPE_CHECKING:
 
 User = get_user_model()
 
+logger = logging.getLogger(__name__)
+
+
+# Renders a Training row like TrainingSerializer. DRF renders datetimes
+# as ISO 8601 with 'Z' and microseconds only when they are not zero.
+TRAINING_JSON_SQL = """
+json_build_object(
+    'id', "{training}"."id",
+    'owner', "{training}"."owner_id",
+    'template', "{training}"."template_id",
+    'conducted', to_char(
+        "{training}"."conducted" AT TIME ZONE 'UTC',
+        'YYYY-MM-DD"T"HH24:MI:SS'
+    ) || CASE
+        WHEN mod(
+            extract(microseconds FROM "{training}"."conducted")::bigint,
+            1000000
+        ) = 0 THEN ''
+        ELSE to_char("{training}"."conducted" AT TIME ZONE 'UTC', '.US')
+    END || 'Z',
+    'description', "{training}"."description",
+    'title', "{training}"."title",
+    'notes', "{training}"."notes",
+    'exercises', coalesce(
+        (
+            SELECT json_agg(
+                json_build_object(
+                    'id', "exercise"."id",
+                    'training', "exercise"."training_id",
+                    'template', "exercise"."template_id",
+                    'order', "exercise"."order",
+                    'units', "exercise"."units",
+                    'sets', "exercise"."sets"
+                )
+                ORDER BY "exercise"."order"
+            )
+            FROM "{exercise}" AS "exercise"
+            WHERE "exercise"."training_id" = "{training}"."id"
+        ),
+        '[]'::json
+    )
+)::text
+"""
+
 
 class TrainingManager(models.Manager):
 
@@ -30,7 +96,45 @@ class TrainingManager(models.Manager):
         description: str | None = None,
         notes: list | None = None,
         exercises_data: list | None = None,
+        exercise_templates: dict | None = None,
     ):
+        training, exercises = self.build_training(
+            owner=owner,
+            conducted=conducted,
+            template=template,
+            title=title,
+            description=description,
+            notes=notes,
+            exercises_data=exercises_data,
+            exercise_templates=exercise_templates,
+        )
+        training.save()
+        if exercises:
+            Exercise = apps.get_model("training", "Exercise")
+            ExerciseSet = apps.get_model("training", "ExerciseSet")
+            exercises = Exercise.objects.bulk_create(exercises)
+            ExerciseSet.objects.create_for_exercises(training, exercises)
+            self._update_statistics(
+                owner, current=self._collect(exercises, conducted)
+            )
+        return training
+
+    def build_training(
+        self,
+        owner: User,
+        conducted: datetime.datetime,
+        template: TrainingTemplate | None = None,
+        title: str | None = None,
+        description: str | None = None,
+        notes: list | None = None,
+        exercises_data: list | None = None,
+        exercise_templates: dict | None = None,
+    ) -> tuple[Training, list[Exercise]]:
+        """
+        Validate training data and return the unsaved training with its
+        unsaved exercises. 'exercise_templates' maps primary keys to
+        templates already fetched for several trainings at once.
+        """
         if template and not template.owner == owner:
             raise PermissionDenied(
                 "You are not the owner of this training template."
@@ -43,11 +147,58 @@ class TrainingManager(models.Manager):
             description=description,
             notes=notes,
         )
-        training.full_clean()
-        training.save()
+        # The owner and the template are already resolved instances
+        training.full_clean(exclude=["owner", "template"])
+        exercises = []
         if exercises_data:
-            self._process_exercise_data(owner, training, exercises_data)
-        return training
+            exercises = self._process_exercise_data(
+                owner, training, exercises_data, exercise_templates
+            )
+        return training, exercises
+
+    @transaction.atomic
+    def bulk_create_trainings(
+        self,
+        owner: User,
+        trainings_exercises: list[tuple[Training, list[Exercise]]],
+        batch_size: int | None = None,
+    ) -> list[Training]:
+        """
+        Save trainings built by build_training with bulk inserts and apply
+        their statistics and personal records in one pass.
+        """
+        Exercise = apps.get_model("training", "Exercise")
+        ExerciseSet = apps.get_model("training", "ExerciseSet")
+
+        trainings = self.bulk_create(
+            [training for training, _ in trainings_exercises],
+            batch_size=batch_size,
+        )
+        for training, exercises in trainings_exercises:
+            # Point the exercises at the primary key set by bulk_create
+            for exercise in exercises:
+                exercise.training = training
+        Exercise.objects.bulk_create(
+            [
+                exercise
+                for _, exercises in trainings_exercises
+                for exercise in exercises
+            ],
+            batch_size=batch_size,
+        )
+        ExerciseSet.objects.create_for_trainings(
+            trainings_exercises, batch_size=batch_size
+        )
+
+        statistics, records = {}, {}
+        for training, exercises in trainings_exercises:
+            training_statistics, training_records = self._collect(
+                exercises, training.conducted
+            )
+            merge_statistics(statistics, training_statistics)
+            merge_records(records, training_records)
+        self._update_statistics(owner, current=(statistics, records))
+        return trainings
 
     @transaction.atomic
     def update_training(
@@ -60,6 +211,7 @@ class TrainingManager(models.Manager):
         description: str | None = None,
         notes: list | None = None,
         exercises_data: list | None = None,
+        exercise_templates: dict | None = None,
     ):
         if training.owner != owner:
             raise PermissionDenied("You are not the owner of this training.")
@@ -68,6 +220,9 @@ class TrainingManager(models.Manager):
                 "You are not the owner of this training template."
             )
 
+        previous_exercises = list(training.exercises.all())
+        previous = self._collect(previous_exercises, training.conducted)
+        previous_conducted = training.conducted
         training.conducted = conducted
         training.template = template
         training.title = title
@@ -75,36 +230,176 @@ class TrainingManager(models.Manager):
         training.notes = notes
         training.full_clean()
         training.save()
+        if previous_conducted != conducted:
+            ExerciseSet = apps.get_model("training", "ExerciseSet")
+            ExerciseSet.objects.filter(exercise__training=training).update(
+                conducted=conducted
+            )
 
-        training.exercises.all().delete()
+        exercises = []
         if exercises_data:
-            self._process_exercise_data(owner, training, exercises_data)
+            exercises = self._process_exercise_data(
+                owner, training, exercises_data, exercise_templates
+            )
+        exercises = self._apply_exercise_changes(
+            training, previous_exercises, exercises
+        )
+        self._update_statistics(
+            owner,
+            previous=previous,
+            current=self._collect(exercises, conducted),
+        )
         return training
 
+    def iter_history_json(
+        self, owner: User, chunk_size: int = 500
+    ) -> Iterator[str]:
+        """
+        Yield trainings of the owner as JSON texts in the shape of
+        TrainingSerializer, newest first. PostgreSQL builds the JSON and
+        rows are read through a server-side cursor, so no model instances
+        are created. 'conducted' is rendered in UTC.
+        """
+        Exercise = apps.get_model("training", "Exercise")
+        sql = TRAINING_JSON_SQL.format(
+            training=self.model._meta.db_table,
+            exercise=Exercise._meta.db_table,
+        )
+        return (
+            self.filter(owner=owner)
+            .order_by("-conducted", "-id")
+            .annotate(json=RawSQL(sql, ()))
+            .values_list("json", flat=True)
+            .iterator(chunk_size=chunk_size)
+        )
+
+    @transaction.atomic
+    def delete_training(self, training: Training, owner: User):
+        if training.owner != owner:
+            raise PermissionDenied("You are not the owner of this training.")
+        Tombstone = apps.get_model("training", "Tombstone")
+
+        previous = self._collect(training.exercises.all(), training.conducted)
+        Tombstone.objects.record(training)
+        training.delete()
+        self._update_statistics(owner, previous=previous)
+
+    @staticmethod
+    def _collect(
+        exercises: list[Exercise],
+        conducted: datetime.datetime,
+    ) -> tuple[dict, dict]:
+        """Return statistics and records contribution of the exercises."""
+        return (
+            collect_statistics(exercises, timezone.localdate(conducted)),
+            collect_records(exercises, conducted),
+        )
+
+    @staticmethod
+    def _update_statistics(
+        owner: User,
+        previous: tuple[dict, dict] = ({}, {}),
+        current: tuple[dict, dict] = ({}, {}),
+    ):
+        ExerciseStatistic = apps.get_model("training", "ExerciseStatistic")
+        PersonalRecord = apps.get_model("training", "PersonalRecord")
+        ExerciseStatistic.objects.apply_changes(owner, previous[0], current[0])
+        PersonalRecord.objects.apply_changes(owner, previous[1], current[1])
+
+    @staticmethod
+    def _apply_exercise_changes(
+        training: Training,
+        previous_exercises: list[Exercise],
+        exercises: list[Exercise],
+    ) -> list[Exercise]:
+        """
+        Write unsaved exercises over the stored ones matching them by order.
+
+        Stored rows are updated in place only when their template, units or
+        sets differ, new orders are created and missing orders are deleted,
+        so primary keys and index entries of untouched rows are kept.
+        Typed set rows are rewritten only for updated and created exercises.
+        """
+        Exercise = apps.get_model("training", "Exercise")
+        ExerciseSet = apps.get_model("training", "ExerciseSet")
+
+        stored = {exercise.order: exercise for exercise in previous_exercises}
+        result, to_create, to_update = [], [], []
+        for exercise in exercises:
+            current = stored.pop(exercise.order, None)
+            if current is None:
+                to_create.append(exercise)
+                result.append(exercise)
+                continue
+            if (current.template_id, current.units, current.sets) != (
+                exercise.template_id,
+                exercise.units,
+                exercise.sets,
+            ):
+                current.template = exercise.template
+                current.units = exercise.units
+                current.sets = exercise.sets
+                to_update.append(current)
+            result.append(current)
+
+        if stored:
+            Exercise.objects.filter(
+                pk__in=[exercise.pk for exercise in stored.values()]
+            ).delete()
+        if to_update:
+            Exercise.objects.bulk_update(
+                to_update, ["template", "units", "sets"]
+            )
+            ExerciseSet.objects.filter(exercise__in=to_update).delete()
+        if to_create:
+            Exercise.objects.bulk_create(to_create)
+        ExerciseSet.objects.create_for_exercises(
+            training, to_update + to_create
+        )
+        return result
+
     @staticmethod
     def _process_exercise_data(
         owner: User,
         training: Training,
         exercises_data: list,
-    ):
+        templates: dict | None = None,
+    ) -> list[Exercise]:
+        """
+        Validate exercises data and return unsaved Exercise instances.
+
+        Templates may be given as instances or primary keys. Admin templates
+        come from the process-local snapshot and the others are resolved
+        with a single query, unless already fetched 'templates' are passed.
+        The exercises are validated without per-row foreign key lookups.
+        """
         Exercise = apps.get_model("training", "Exercise")
 
         if not isinstance(exercises_data, list):
             raise ValidationError("Exercises data must be a list")
-        unauthorized_templates = []
+        template_ids = []
         for idx, single_exercise_data in enumerate(exercises_data, start=1):
-            # Expect the template to be an instance
             exercise_template = single_exercise_data.get("template")
             if not exercise_template:
                 raise ValidationError(
                     f"Exercise #{idx} is missing a template."
                 )
+            template_ids.append(
+                getattr(exercise_template, "pk", exercise_template)
+            )
 
+        if templates is None:
+            templates = get_exercise_templates(set(template_ids))
+        unauthorized_templates = []
+        for template_id in dict.fromkeys(template_ids):
+            exercise_template = templates.get(template_id)
             # Check allowed condition: template must be active and either owned by the user or an admin template.
-            if not (
+            if exercise_template is None:
+                unauthorized_templates.append(template_id)
+            elif not (
                 exercise_template.is_active
                 and (
-                    exercise_template.owner == owner
+                    exercise_template.owner_id == owner.pk
                     or exercise_template.is_admin
                 )
             ):
@@ -117,19 +412,21 @@ class TrainingManager(models.Manager):
 
         exercises_to_create = []
         orders = []
-        for idx, single_exercise_data in enumerate(exercises_data, start=1):
-            template = single_exercise_data.get("template")
+        for single_exercise_data, template_id in zip(
+            exercises_data, template_ids
+        ):
             order = single_exercise_data.get("order")
             units = single_exercise_data.get("units")
             sets = single_exercise_data.get("sets")
             exercise = Exercise(
                 training=training,
-                template=template,
+                template=templates[template_id],
                 order=order,
                 units=units,
                 sets=sets,
             )
-            exercise.full_clean()
+            # Training and templates are already resolved above
+            exercise.full_clean(exclude=["training", "template"])
             orders.append(order)
             exercises_to_create.append(exercise)
 
@@ -139,4 +436,509 @@ class TrainingManager(models.Manager):
                 "The order of exercises is incorrect. It should start from 1 and increase by 1."
             )
 
-        Exercise.objects.bulk_create(exercises_to_create)
+        return exercises_to_create
+
+
+class ExerciseStatisticManager(models.Manager):
+
+    @transaction.atomic
+    def rebuild(self, owner: User, dates: set[datetime.date]):
+        """
+        Recompute per-day rollups of the owner for the given dates
+        from the stored exercises.
+        """
+        statistics = self._collect_stored_statistics(owner, dates)
+        self.filter(owner=owner, date__in=dates).delete()
+        self.bulk_create(
+            self.model(
+                owner=owner,
+                template_id=template_id,
+                date=date,
+                field=field,
+                max=bucket[0],
+                sum=bucket[1],
+                count=bucket[2],
+            )
+            for (date, template_id, field), bucket in statistics.items()
+        )
+
+    def apply_changes(
+        self,
+        owner: User,
+        previous: dict[tuple, list[float]],
+        current: dict[tuple, list[float]],
+    ):
+        """
+        Replace the contribution of one training to the rollups.
+
+        'previous' and 'current' are results of collect_statistics for the
+        training before and after the change. Only buckets whose
+        contribution differs are touched. A bucket whose maximum may have
+        been removed is recomputed from the stored exercises, so this must
+        be called after the exercises are written.
+        """
+        changed_keys = {
+            key
+            for key in previous.keys() | current.keys()
+            if previous.get(key) != current.get(key)
+        }
+        if not changed_keys:
+            return
+
+        with transaction.atomic():
+            # Empty buckets are inserted first, so concurrent first writes
+            # to a bucket wait for each other instead of both creating it,
+            # and every delta is applied to a locked row
+            empty_buckets = []
+            for key in sorted(changed_keys & current.keys()):
+                date, template_id, field = key
+                empty_buckets.append(
+                    self.model(
+                        owner=owner,
+                        template_id=template_id,
+                        date=date,
+                        field=field,
+                        max=current[key][0],
+                        sum=0,
+                        count=0,
+                    )
+                )
+            self.bulk_create(empty_buckets, ignore_conflicts=True)
+            rows = {
+                (row.date, row.template_id, row.field): row
+                for row in self.select_for_update().filter(
+                    owner=owner,
+                    date__in={key[0] for key in changed_keys},
+                    template_id__in={key[1] for key in changed_keys},
+                    field__in={key[2] for key in changed_keys},
+                )
+            }
+
+            to_update, to_delete, to_recompute = [], [], []
+            for key in changed_keys:
+                old = previous.get(key)
+                new = current.get(key)
+                row = rows.get(key)
+                if row is None:
+                    continue
+
+                row.count += (new[2] if new else 0) - (old[2] if old else 0)
+                if row.count <= 0:
+                    to_delete.append(row.pk)
+                    continue
+                row.sum += (new[1] if new else 0) - (old[1] if old else 0)
+                if (
+                    old
+                    and old[0] >= row.max
+                    and not (new and new[0] >= old[0])
+                ):
+                    to_recompute.append(row)
+                    continue
+                if new:
+                    row.max = max(row.max, new[0])
+                to_update.append(row)
+
+            if to_recompute:
+                statistics = self._collect_stored_statistics(
+                    owner,
+                    {row.date for row in to_recompute},
+                    {row.template_id for row in to_recompute},
+                )
+                for row in to_recompute:
+                    row.max = statistics[
+                        (row.date, row.template_id, row.field)
+                    ][0]
+                    to_update.append(row)
+
+            if to_delete:
+                self.filter(pk__in=to_delete).delete()
+            if to_update:
+                self.bulk_update(to_update, ["max", "sum", "count"])
+
+    @staticmethod
+    def _collect_stored_statistics(
+        owner: User,
+        dates: set[datetime.date],
+        template_ids: set[int] | None = None,
+    ) -> dict[tuple, list[float]]:
+        """Aggregate stored typed sets into collect_statistics format."""
+        ExerciseSet = apps.get_model("training", "ExerciseSet")
+
+        exercise_sets = ExerciseSet.objects.annotate(
+            date=TruncDate("conducted")
+        ).filter(owner=owner, date__in=dates)
+        if template_ids is not None:
+            exercise_sets = exercise_sets.filter(template_id__in=template_ids)
+        aggregates = {}
+        for field in STATISTIC_FIELDS:
+            aggregates[f"{field}_max"] = Max(field)
+            aggregates[f"{field}_sum"] = Sum(field)
+            aggregates[f"{field}_count"] = Count(field)
+        rows = (
+            exercise_sets.order_by()
+            .values("date", "template_id")
+            .annotate(**aggregates)
+        )
+
+        statistics = {}
+        for row in rows:
+            for field in STATISTIC_FIELDS:
+                if row[f"{field}_count"]:
+                    statistics[(row["date"], row["template_id"], field)] = [
+                        row[f"{field}_max"],
+                        row[f"{field}_sum"],
+                        row[f"{field}_count"],
+                    ]
+        return statistics
+
+
+class ExerciseSetManager(models.Manager):
+
+    def create_for_exercises(
+        self,
+        training: Training,
+        exercises: list[Exercise],
+    ):
+        """Store typed values of every set of the given saved exercises."""
+        return self.create_for_trainings([(training, exercises)])
+
+    def create_for_trainings(
+        self,
+        trainings_exercises: Iterable[tuple[Training, list[Exercise]]],
+        batch_size: int | None = None,
+    ):
+        """Store typed values of every set of several trainings at once."""
+        exercise_sets = (
+            self.model(
+                exercise=exercise,
+                owner_id=training.owner_id,
+                template_id=exercise.template_id,
+                conducted=training.conducted,
+                order=order,
+                **get_set_values(exercise_set, exercise.units),
+            )
+            for training, exercises in trainings_exercises
+            for exercise in exercises
+            for order, exercise_set in enumerate(exercise.sets or [], start=1)
+        )
+        return self.bulk_create(exercise_sets, batch_size=batch_size)
+
+
+class PersonalRecordManager(models.Manager):
+
+    @transaction.atomic
+    def rebuild(self, owner: User):
+        """Recompute all personal records of the owner from stored sets."""
+        records = self._collect_stored_records(owner)
+        self.filter(owner=owner).delete()
+        self.bulk_create(
+            self.model(
+                owner=owner,
+                template_id=template_id,
+                field=field,
+                reps=reps,
+                value=value,
+                achieved=achieved,
+            )
+            for (template_id, field, reps), (
+                value,
+                achieved,
+            ) in records.items()
+        )
+
+    def apply_changes(
+        self,
+        owner: User,
+        previous: dict[tuple, tuple],
+        current: dict[tuple, tuple],
+    ):
+        """
+        Replace the contribution of one training to the personal records.
+
+        'previous' and 'current' are results of collect_records for the
+        training before and after the change. A record that may have come
+        from the previous contribution is recomputed from the stored sets,
+        so this must be called after the sets are written.
+        """
+        changed_keys = {
+            key
+            for key in previous.keys() | current.keys()
+            if previous.get(key) != current.get(key)
+        }
+        if not changed_keys:
+            return
+
+        with transaction.atomic():
+            # New records are inserted first ignoring existing ones, so
+            # concurrent trainings do not both create a record, and every
+            # change is compared with a locked row
+            new_records = []
+            for key in sorted(changed_keys & current.keys()):
+                template_id, field, reps = key
+                value, achieved = current[key]
+                new_records.append(
+                    self.model(
+                        owner=owner,
+                        template_id=template_id,
+                        field=field,
+                        reps=reps,
+                        value=value,
+                        achieved=achieved,
+                    )
+                )
+            self.bulk_create(new_records, ignore_conflicts=True)
+            # The default ordering joins templates and would lock them too
+            rows = {
+                (row.template_id, row.field, row.reps): row
+                for row in self.select_for_update()
+                .order_by()
+                .filter(
+                    owner=owner,
+                    template_id__in={key[0] for key in changed_keys},
+                    field__in={key[1] for key in changed_keys},
+                )
+            }
+
+            to_update, to_recompute = [], []
+            for key in changed_keys:
+                old = previous.get(key)
+                new = current.get(key)
+                row = rows.get(key)
+                if row is None:
+                    continue
+                if old and old[0] >= row.value:
+                    to_recompute.append(row)
+                elif new and (
+                    new[0] > row.value
+                    or (new[0] == row.value and new[1] < row.achieved)
+                ):
+                    # Equal values keep the earliest achievement, as in
+                    # merge_records and rebuilds
+                    row.value, row.achieved = new
+                    to_update.append(row)
+
+            to_delete = []
+            if to_recompute:
+                records = self._collect_stored_records(
+                    owner,
+                    {row.template_id for row in to_recompute},
+                    {row.field for row in to_recompute},
+                )
+                for row in to_recompute:
+                    record = records.get(
+                        (row.template_id, row.field, row.reps)
+                    )
+                    if record is None:
+                        to_delete.append(row.pk)
+                    else:
+                        row.value, row.achieved = record
+                        to_update.append(row)
+
+            if to_delete:
+                self.filter(pk__in=to_delete).delete()
+            if to_update:
+                self.bulk_update(to_update, ["value", "achieved"])
+
+    @staticmethod
+    def _collect_stored_records(
+        owner: User,
+        template_ids: set[int] | None = None,
+        fields: set[str] | None = None,
+    ) -> dict[tuple, tuple]:
+        """
+        Find the best stored set per template and rep count for every
+        field, in collect_records format.
+        """
+        ExerciseSet = apps.get_model("training", "ExerciseSet")
+
+        records = {}
+        for field in fields or RECORD_FIELDS:
+            # Sets with negative reps stored before they were rejected are
+            # skipped, as in collect_records
+            exercise_sets = ExerciseSet.objects.filter(
+                Q(reps__isnull=True) | Q(reps__gte=0),
+                owner=owner,
+                **{f"{field}__isnull": False},
+            )
+            if template_ids is not None:
+                exercise_sets = exercise_sets.filter(
+                    template_id__in=template_ids
+                )
+            rows = (
+                exercise_sets.annotate(
+                    rep_count=(
+                        Value(0) if field == "reps" else Coalesce("reps", 0)
+                    )
+                )
+                .order_by(
+                    "template_id", "rep_count", F(field).desc(), "conducted"
+                )
+                .distinct("template_id", "rep_count")
+                .values_list("template_id", "rep_count", field, "conducted")
+            )
+            for template_id, reps, value, conducted in rows:
+                records[(template_id, field, reps)] = (value, conducted)
+        return records
+
+
+class ImportJobManager(models.Manager):
+
+    def create_job(self, owner: User, trainings_data: list) -> ImportJob:
+        """
+        Store trainings data and queue the job once it is committed. A job
+        that cannot be queued is marked as failed.
+        """
+        job = self.create(
+            owner=owner, data=trainings_data, total=len(trainings_data)
+        )
+
+        def enqueue():
+            try:
+                enqueue_import_job(job.pk)
+            except redis.RedisError:
+                logger.exception("Import job %s could not be queued", job.pk)
+                job.status = self.model.Status.FAILED
+                job.errors = [{"detail": "The import could not be queued."}]
+                job.finished_at = timezone.now()
+                job.save(
+                    update_fields=[
+                        "status",
+                        "errors",
+                        "finished_at",
+                        "updated_at",
+                    ]
+                )
+
+        transaction.on_commit(enqueue)
+        return job
+
+    def requeue_stale_jobs(self) -> list[int]:
+        """
+        Put running jobs without progress for IMPORT_JOB_STALE_AFTER back
+        to pending, as their worker is gone, and return their ids.
+        """
+        Status = self.model.Status
+        stale = self.filter(
+            status=Status.RUNNING,
+            updated_at__lt=timezone.now() - IMPORT_JOB_STALE_AFTER,
+        )
+        job_ids = list(stale.values_list("pk", flat=True))
+        if job_ids:
+            stale.filter(pk__in=job_ids).update(
+                status=Status.PENDING, updated_at=timezone.now()
+            )
+        return job_ids
+
+    def run_job(self, job_id: int) -> ImportJob | None:
+        """
+        Import the data of a pending job, recording progress after every
+        chunk. A requeued job resumes after its last processed chunk.
+        Returns None when the job is missing or already taken by another
+        worker.
+        """
+        # Imported here, the importer depends on the models module
+        from .imports import TrainingImporter
+
+        Status = self.model.Status
+        now = timezone.now()
+        claimed = self.filter(pk=job_id, status=Status.PENDING).update(
+            status=Status.RUNNING,
+            started_at=Coalesce("started_at", Value(now)),
+            updated_at=now,
+        )
+        if not claimed:
+            return None
+        job = self.select_related("owner").get(pk=job_id)
+
+        def on_progress(processed: int, result: dict):
+            self.filter(pk=job_id).update(
+                processed=processed,
+                result={
+                    key: value
+                    for key, value in result.items()
+                    if key != "errors"
+                },
+                errors=result["errors"],
+                updated_at=timezone.now(),
+            )
+
+        try:
+            result = TrainingImporter(job.owner).import_trainings(
+                job.data or [],
+                on_progress=on_progress,
+                start=job.processed,
+                result={**(job.result or {}), "errors": job.errors},
+            )
+        except Exception as exc:
+            logger.exception("Import job %s failed", job_id)
+            self.filter(pk=job_id).update(
+                status=Status.FAILED,
+                errors=[{"detail": str(exc)}],
+                finished_at=timezone.now(),
+                updated_at=timezone.now(),
+            )
+        else:
+            errors = result.pop("errors")
+            self.filter(pk=job_id).update(
+                status=Status.DONE,
+                data=None,
+                processed=job.total,
+                result=result,
+                errors=errors,
+                finished_at=timezone.now(),
+                updated_at=timezone.now(),
+            )
+        job.refresh_from_db()
+        return job
+
+
+class TombstoneManager(models.Manager):
+    # Lookups from Training to the deleted object, for objects whose
+    # deletion changes trainings through CASCADE or SET_NULL
+    TRAINING_LOOKUPS = {
+        "trainingtemplate": "template",
+        "exercisetemplate": "exercises__template",
+    }
+
+    def record(self, instance: models.Model):
+        """Log the deletion of instance. Call before deleting it."""
+        return self.create(
+            owner_id=(
+                None
+                if getattr(instance, "is_admin", False)
+                else instance.owner_id
+            ),
+            model=instance._meta.model_name,
+            object_id=instance.pk,
+        )
+
+    @transaction.atomic
+    def delete_object(self, instance: models.Model):
+        """
+        Delete instance and log it. Trainings that lose their template or
+        exercises are marked as edited, so they are synced again.
+        """
+        Training = apps.get_model("training", "Training")
+
+        lookup = self.TRAINING_LOOKUPS.get(instance._meta.model_name)
+        if lookup:
+            Training.objects.filter(**{lookup: instance}).update(
+                edited_at=timezone.now()
+            )
+        self.record(instance)
+        instance.delete()
+
+    def for_user(self, owner: User):
+        """Tombstones of the owner and of shared objects."""
+        return self.filter(models.Q(owner=owner) | models.Q(owner=None))
+
+    def get_horizon(self) -> datetime.datetime:
+        """Deletions before this moment may be compacted away."""
+        return timezone.now() - datetime.timedelta(
+            days=settings.TOMBSTONE_RETENTION_DAYS
+        )
+
+    def compact(self) -> int:
+        """Delete tombstones older than the retention period."""
+        deleted, _ = self.filter(deleted_at__lt=self.get_horizon()).delete()
+        return deleted
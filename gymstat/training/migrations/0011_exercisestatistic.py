@@ -0,0 +1,162 @@
+# Generated by Django 5.1.4 on 2026-10-17 11:42
+
+import math
+import re
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+# Frozen copy of the set value parsing of training.statistics, so later
+# changes to the live helpers do not change this migration
+SET_FIELD_TYPES = {
+    "sets": "int",
+    "reps": "int",
+    "weight": "float",
+    "time": "duration",
+    "distance": "float",
+    "speed": "float",
+    "rounds": "int",
+    "rest": "duration",
+    "rpe": "int",
+    "attempts": "int",
+    "successes": "int",
+}
+UNIT_FACTORS = {
+    "weight": {"kg": 1, "lbs": 0.45359237},
+    "distance": {"m": 1, "km": 1000, "mi": 1609.344},
+    "speed": {"mps": 1, "kph": 1 / 3.6, "mph": 0.44704},
+}
+DURATION_PATTERN = re.compile(r"(?:([0-9]+):)?([0-5]?[0-9]):([0-5]?[0-9])")
+# Range of the integer columns of ExerciseSet
+INT_MIN, INT_MAX = -(2**31), 2**31 - 1
+
+
+def parse_set_value(field, value, unit):
+    if SET_FIELD_TYPES[field] == "duration":
+        hours, minutes, seconds = DURATION_PATTERN.fullmatch(value).groups()
+        return float(int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds))
+    factor = UNIT_FACTORS[field][unit] if field in UNIT_FACTORS and unit else 1
+    return float(value) * factor
+
+
+def fits_column(field, value):
+    if SET_FIELD_TYPES[field] == "float":
+        return math.isfinite(value)
+    return INT_MIN <= value <= INT_MAX
+
+
+def get_set_values(exercise_set, units):
+    """
+    Parse the numeric values of a set. Legacy values that do not fit the
+    ExerciseSet columns, such as huge integers or nan, are left out.
+    """
+    units = units or {}
+    values = {}
+    for field, value in exercise_set.items():
+        if value == "" or field not in SET_FIELD_TYPES:
+            continue
+        value = parse_set_value(field, value, units.get(field))
+        if fits_column(field, value):
+            values[field] = value
+    return values
+
+
+def fill_exercise_statistics(apps, schema_editor):
+    Exercise = apps.get_model("training", "Exercise")
+    ExerciseStatistic = apps.get_model("training", "ExerciseStatistic")
+
+    statistics = {}
+    exercises = Exercise.objects.select_related("training").iterator(
+        chunk_size=1000
+    )
+    for exercise in exercises:
+        training = exercise.training
+        date = timezone.localdate(training.conducted)
+        for exercise_set in exercise.sets or []:
+            values = get_set_values(exercise_set, exercise.units)
+            for field, value in values.items():
+                key = (training.owner_id, date, exercise.template_id, field)
+                bucket = statistics.get(key)
+                if bucket is None:
+                    statistics[key] = [value, value, 1]
+                else:
+                    bucket[0] = max(bucket[0], value)
+                    bucket[1] += value
+                    bucket[2] += 1
+    ExerciseStatistic.objects.bulk_create(
+        (
+            ExerciseStatistic(
+                owner_id=owner_id,
+                template_id=template_id,
+                date=date,
+                field=field,
+                max=bucket[0],
+                sum=bucket[1],
+                count=bucket[2],
+            )
+            for (owner_id, date, template_id, field), bucket in (
+                statistics.items()
+            )
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("training", "0010_alter_training_notes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExerciseStatistic",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("field", models.CharField(max_length=20)),
+                ("max", models.FloatField()),
+                ("sum", models.FloatField()),
+                ("count", models.PositiveIntegerField()),
+                (
+                    "owner",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exercise_statistics",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "template",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="statistics",
+                        to="training.exercisetemplate",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["date"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("owner", "template", "field", "date"),
+                        name="unique_exercise_statistic",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            fill_exercise_statistics, migrations.RunPython.noop
+        ),
+    ]
@@ -0,0 +1,160 @@
+# Generated by Django 5.1.4 on 2026-10-17 12:01
+
+import math
+import re
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Frozen copy of the set value parsing of training.statistics, so later
+# changes to the live helpers do not change this migration
+SET_FIELD_TYPES = {
+    "sets": "int",
+    "reps": "int",
+    "weight": "float",
+    "time": "duration",
+    "distance": "float",
+    "speed": "float",
+    "rounds": "int",
+    "rest": "duration",
+    "rpe": "int",
+    "attempts": "int",
+    "successes": "int",
+}
+UNIT_FACTORS = {
+    "weight": {"kg": 1, "lbs": 0.45359237},
+    "distance": {"m": 1, "km": 1000, "mi": 1609.344},
+    "speed": {"mps": 1, "kph": 1 / 3.6, "mph": 0.44704},
+}
+DURATION_PATTERN = re.compile(r"(?:([0-9]+):)?([0-5]?[0-9]):([0-5]?[0-9])")
+# Range of the integer columns of ExerciseSet
+INT_MIN, INT_MAX = -(2**31), 2**31 - 1
+
+
+def parse_set_value(field, value, unit):
+    if SET_FIELD_TYPES[field] == "duration":
+        hours, minutes, seconds = DURATION_PATTERN.fullmatch(value).groups()
+        return float(int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds))
+    factor = UNIT_FACTORS[field][unit] if field in UNIT_FACTORS and unit else 1
+    return float(value) * factor
+
+
+def fits_column(field, value):
+    if SET_FIELD_TYPES[field] == "float":
+        return math.isfinite(value)
+    return INT_MIN <= value <= INT_MAX
+
+
+def get_set_values(exercise_set, units):
+    """
+    Parse the numeric values of a set. Legacy values that do not fit the
+    ExerciseSet columns, such as huge integers or nan, are left out.
+    """
+    units = units or {}
+    values = {}
+    for field, value in exercise_set.items():
+        if value == "" or field not in SET_FIELD_TYPES:
+            continue
+        value = parse_set_value(field, value, units.get(field))
+        if fits_column(field, value):
+            values[field] = value
+    return values
+
+
+def fill_exercise_sets(apps, schema_editor):
+    Exercise = apps.get_model("training", "Exercise")
+    ExerciseSet = apps.get_model("training", "ExerciseSet")
+
+    exercise_sets = []
+    exercises = Exercise.objects.select_related("training").iterator(
+        chunk_size=1000
+    )
+    for exercise in exercises:
+        for order, exercise_set in enumerate(exercise.sets or [], start=1):
+            exercise_sets.append(
+                ExerciseSet(
+                    exercise=exercise,
+                    owner_id=exercise.training.owner_id,
+                    template_id=exercise.template_id,
+                    conducted=exercise.training.conducted,
+                    order=order,
+                    **get_set_values(exercise_set, exercise.units),
+                )
+            )
+        if len(exercise_sets) >= 1000:
+            ExerciseSet.objects.bulk_create(exercise_sets)
+            exercise_sets = []
+    ExerciseSet.objects.bulk_create(exercise_sets)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("training", "0011_exercisestatistic"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExerciseSet",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("conducted", models.DateTimeField()),
+                ("order", models.PositiveIntegerField()),
+                ("sets", models.IntegerField(blank=True, null=True)),
+                ("reps", models.IntegerField(blank=True, null=True)),
+                ("weight", models.FloatField(blank=True, null=True)),
+                ("time", models.PositiveIntegerField(blank=True, null=True)),
+                ("distance", models.FloatField(blank=True, null=True)),
+                ("speed", models.FloatField(blank=True, null=True)),
+                ("rounds", models.IntegerField(blank=True, null=True)),
+                ("rest", models.PositiveIntegerField(blank=True, null=True)),
+                ("rpe", models.IntegerField(blank=True, null=True)),
+                ("attempts", models.IntegerField(blank=True, null=True)),
+                ("successes", models.IntegerField(blank=True, null=True)),
+                (
+                    "exercise",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="set_values",
+                        to="training.exercise",
+                    ),
+                ),
+                (
+                    "owner",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exercise_sets",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "template",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="exercise_sets",
+                        to="training.exercisetemplate",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["exercise", "order"],
+                "indexes": [
+                    models.Index(
+                        fields=["owner", "template", "conducted"],
+                        name="training_ex_owner_i_2b4d88_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_exercise_sets, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,165 @@
+# Generated by Django 5.1.4 on 2026-10-17 12:05
+
+import math
+import re
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+# Frozen copy of the set value parsing of training.statistics, so later
+# changes to the live helpers do not change this migration
+SET_FIELD_TYPES = {
+    "sets": "int",
+    "reps": "int",
+    "weight": "float",
+    "time": "duration",
+    "distance": "float",
+    "speed": "float",
+    "rounds": "int",
+    "rest": "duration",
+    "rpe": "int",
+    "attempts": "int",
+    "successes": "int",
+}
+UNIT_FACTORS = {
+    "weight": {"kg": 1, "lbs": 0.45359237},
+    "distance": {"m": 1, "km": 1000, "mi": 1609.344},
+    "speed": {"mps": 1, "kph": 1 / 3.6, "mph": 0.44704},
+}
+DURATION_PATTERN = re.compile(r"(?:([0-9]+):)?([0-5]?[0-9]):([0-5]?[0-9])")
+# Range of the integer columns of ExerciseSet
+INT_MIN, INT_MAX = -(2**31), 2**31 - 1
+
+
+def parse_set_value(field, value, unit):
+    if SET_FIELD_TYPES[field] == "duration":
+        hours, minutes, seconds = DURATION_PATTERN.fullmatch(value).groups()
+        return float(int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds))
+    factor = UNIT_FACTORS[field][unit] if field in UNIT_FACTORS and unit else 1
+    return float(value) * factor
+
+
+def fits_column(field, value):
+    if SET_FIELD_TYPES[field] == "float":
+        return math.isfinite(value)
+    return INT_MIN <= value <= INT_MAX
+
+
+def get_set_values(exercise_set, units):
+    """
+    Parse the numeric values of a set. Legacy values that do not fit the
+    ExerciseSet columns, such as huge integers or nan, are left out.
+    """
+    units = units or {}
+    values = {}
+    for field, value in exercise_set.items():
+        if value == "" or field not in SET_FIELD_TYPES:
+            continue
+        value = parse_set_value(field, value, units.get(field))
+        if fits_column(field, value):
+            values[field] = value
+    return values
+
+
+RECORD_FIELDS = ["weight", "reps", "distance", "speed", "rounds", "successes"]
+
+
+def fill_personal_records(apps, schema_editor):
+    Exercise = apps.get_model("training", "Exercise")
+    PersonalRecord = apps.get_model("training", "PersonalRecord")
+
+    records = {}
+    exercises = (
+        Exercise.objects.select_related("training")
+        .order_by("training__conducted")
+        .iterator(chunk_size=1000)
+    )
+    for exercise in exercises:
+        training = exercise.training
+        for exercise_set in exercise.sets or []:
+            values = get_set_values(exercise_set, exercise.units)
+            reps = int(values.get("reps") or 0)
+            if reps < 0:
+                continue
+            for field in RECORD_FIELDS:
+                value = values.get(field)
+                if value is None:
+                    continue
+                key = (
+                    training.owner_id,
+                    exercise.template_id,
+                    field,
+                    0 if field == "reps" else reps,
+                )
+                if key not in records or value > records[key][0]:
+                    records[key] = (value, training.conducted)
+    PersonalRecord.objects.bulk_create(
+        (
+            PersonalRecord(
+                owner_id=owner_id,
+                template_id=template_id,
+                field=field,
+                reps=reps,
+                value=record[0],
+                achieved=record[1],
+            )
+            for (owner_id, template_id, field, reps), record in records.items()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("training", "0012_exerciseset"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PersonalRecord",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("field", models.CharField(max_length=20)),
+                ("reps", models.PositiveIntegerField(default=0)),
+                ("value", models.FloatField()),
+                ("achieved", models.DateTimeField()),
+                (
+                    "owner",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="personal_records",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "template",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="personal_records",
+                        to="training.exercisetemplate",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["template", "field", "reps"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("owner", "template", "field", "reps"),
+                        name="unique_personal_record",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_personal_records, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.1.4 on 2026-10-17 12:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("training", "0014_importjob"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model", models.CharField(max_length=30)),
+                ("object_id", models.BigIntegerField()),
+                ("deleted_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["deleted_at"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="exercisetemplate",
+            index=models.Index(
+                fields=["owner", "edited_at"],
+                name="training_ex_owner_i_4f1eb5_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="training",
+            index=models.Index(
+                fields=["owner", "edited_at"],
+                name="training_tr_owner_i_35850d_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="trainingtemplate",
+            index=models.Index(
+                fields=["owner", "edited_at"],
+                name="training_tr_owner_i_959169_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="tombstone",
+            name="owner",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="tombstones",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="tombstone",
+            index=models.Index(
+                fields=["owner", "deleted_at"],
+                name="training_to_owner_i_733624_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.1.4 on 2026-10-17 12:58
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("training", "0015_tombstone"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="exercisetemplate",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["tags"],
+                name="exercise_templates_tags",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.1.4 on 2026-10-17 13:04
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("training", "0016_exercise_templates_tags"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="exercisetemplate",
+            name="et_search_vector",
+        ),
+        migrations.AddField(
+            model_name="exercisetemplate",
+            name="search_vector",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.SearchVector(
+                        "name", config="english", weight="A"
+                    ),
+                    "||",
+                    django.contrib.postgres.search.SearchVector(
+                        "description", config="english", weight="B"
+                    ),
+                    django.contrib.postgres.search.SearchConfig("english"),
+                ),
+                output_field=django.contrib.postgres.search.SearchVectorField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="exercisetemplate",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="et_search_vector"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="exercisetemplate",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["name"],
+                name="exercise_templates_name_trgm",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-17 13:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("training", "0017_exercise_template_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="importjob",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
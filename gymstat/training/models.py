@@ -1,12 +1,19 @@
 from django.conf import settings
 from django.contrib.postgres.indexes import GinIndex
-from django.contrib.postgres.search import SearchVector
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
 
-from .constants import ALLOWED_EXERCISE_FIELDS
-from .managers import TrainingManager
+from .managers import (
+    ExerciseSetManager,
+    ExerciseStatisticManager,
+    ImportJobManager,
+    PersonalRecordManager,
+    TombstoneManager,
+    TrainingManager,
+)
 from .validators import (
+    EXERCISE_SCHEMA,
     validate_exercise_sets,
     validate_exercise_template_fields,
     validate_exercise_template_tags,
@@ -34,6 +41,7 @@ class TrainingTemplate(models.Model):
         indexes = [
             models.Index(fields=["name"]),
             models.Index(fields=["owner", "name"]),
+            models.Index(fields=["owner", "edited_at"]),
             GinIndex(
                 name="training_template_data",
                 fields=["data"],
@@ -79,6 +87,7 @@ class Training(models.Model):
         indexes = [
             models.Index(fields=["-conducted"]),
             models.Index(fields=["owner", "-conducted"]),
+            models.Index(fields=["owner", "edited_at"]),
             GinIndex(
                 name="training_notes",
                 fields=["notes"],
@@ -115,20 +124,35 @@ class ExerciseTemplate(models.Model):
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     edited_at = models.DateTimeField(auto_now=True)
+    # Weighted document for full-text search, maintained by PostgreSQL
+    search_vector = models.GeneratedField(
+        expression=SearchVector("name", weight="A", config="english")
+        + SearchVector("description", weight="B", config="english"),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         indexes = [
             models.Index(fields=["name"]),
             models.Index(fields=["is_active", "name"]),
             models.Index(fields=["is_active", "is_admin", "name"]),
+            models.Index(fields=["owner", "edited_at"]),
             GinIndex(
                 name="exercise_templates_fields",
                 fields=["fields"],
                 opclasses=["jsonb_path_ops"],
             ),
             GinIndex(
-                SearchVector("name", "description", config="english"),
-                name="et_search_vector",
+                name="exercise_templates_tags",
+                fields=["tags"],
+                opclasses=["jsonb_path_ops"],
+            ),
+            GinIndex(fields=["search_vector"], name="et_search_vector"),
+            GinIndex(
+                name="exercise_templates_name_trgm",
+                fields=["name"],
+                opclasses=["gin_trgm_ops"],
             ),
         ]
         ordering = ["name"]
@@ -175,19 +199,216 @@ class Exercise(models.Model):
         ordering = ["order"]
 
     def clean(self):
-        sets: list | None = self.sets
-        units: dict | None = self.units
-        if sets:
-            for exercise in sets:
-                for field, value in exercise.items():
-                    if isinstance(ALLOWED_EXERCISE_FIELDS[field], list):
-                        if not units or field not in units:
-                            raise ValidationError(
-                                f"Field {field} in 'Sets' must have unit"
-                            )
+        errors = EXERCISE_SCHEMA.get_missing_units_errors(
+            self.sets, self.units
+        )
+        if errors:
+            raise ValidationError(errors)
 
     def __repr__(self):
         return f"<Exercise ({self.template.name}) for Training {self.training.id}>"
 
     def __str__(self):
         return f"{self.template.name} (Order {self.order})"
+
+
+class ExerciseSet(models.Model):
+    """
+    Numeric values of one set of an exercise in canonical units
+    (kg, m, m/s, seconds), denormalized for SQL aggregates.
+    """
+
+    exercise = models.ForeignKey(
+        Exercise, related_name="set_values", on_delete=models.CASCADE
+    )
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="exercise_sets",
+        on_delete=models.CASCADE,
+    )
+    template = models.ForeignKey(
+        ExerciseTemplate,
+        related_name="exercise_sets",
+        on_delete=models.CASCADE,
+    )
+    conducted = models.DateTimeField()
+    order = models.PositiveIntegerField()
+    sets = models.IntegerField(blank=True, null=True)
+    reps = models.IntegerField(blank=True, null=True)
+    weight = models.FloatField(blank=True, null=True)
+    time = models.PositiveIntegerField(blank=True, null=True)
+    distance = models.FloatField(blank=True, null=True)
+    speed = models.FloatField(blank=True, null=True)
+    rounds = models.IntegerField(blank=True, null=True)
+    rest = models.PositiveIntegerField(blank=True, null=True)
+    rpe = models.IntegerField(blank=True, null=True)
+    attempts = models.IntegerField(blank=True, null=True)
+    successes = models.IntegerField(blank=True, null=True)
+
+    objects = ExerciseSetManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["owner", "template", "conducted"]),
+        ]
+        ordering = ["exercise", "order"]
+
+    def __str__(self):
+        return f"Set {self.order} of {self.exercise_id}"
+
+    def __repr__(self):
+        return (
+            f"<ExerciseSet(exercise={self.exercise_id}, order={self.order}, "
+            f"template={self.template_id})>"
+        )
+
+
+class ExerciseStatistic(models.Model):
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="exercise_statistics",
+        on_delete=models.CASCADE,
+    )
+    template = models.ForeignKey(
+        ExerciseTemplate,
+        related_name="statistics",
+        on_delete=models.CASCADE,
+    )
+    date = models.DateField()
+    field = models.CharField(max_length=20)
+    max = models.FloatField()
+    sum = models.FloatField()
+    count = models.PositiveIntegerField()
+
+    objects = ExerciseStatisticManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["owner", "template", "field", "date"],
+                name="unique_exercise_statistic",
+            ),
+        ]
+        ordering = ["date"]
+
+    def __str__(self):
+        return f"{self.template} {self.field} on {self.date}"
+
+    def __repr__(self):
+        return (
+            f"<ExerciseStatistic(owner={self.owner_id}, "
+            f"template={self.template_id}, field={self.field!r}, "
+            f"date={self.date.isoformat()})>"
+        )
+
+
+class PersonalRecord(models.Model):
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="personal_records",
+        on_delete=models.CASCADE,
+    )
+    template = models.ForeignKey(
+        ExerciseTemplate,
+        related_name="personal_records",
+        on_delete=models.CASCADE,
+    )
+    field = models.CharField(max_length=20)
+    reps = models.PositiveIntegerField(default=0)
+    value = models.FloatField()
+    achieved = models.DateTimeField()
+
+    objects = PersonalRecordManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["owner", "template", "field", "reps"],
+                name="unique_personal_record",
+            ),
+        ]
+        ordering = ["template", "field", "reps"]
+
+    def __str__(self):
+        return f"{self.template} {self.field} x{self.reps}: {self.value}"
+
+    def __repr__(self):
+        return (
+            f"<PersonalRecord(owner={self.owner_id}, "
+            f"template={self.template_id}, field={self.field!r}, "
+            f"reps={self.reps}, value={self.value})>"
+        )
+
+
+class ImportJob(models.Model):
+    class Status(models.TextChoices):
+        PENDING = "pending"
+        RUNNING = "running"
+        DONE = "done"
+        FAILED = "failed"
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="import_jobs",
+        on_delete=models.CASCADE,
+    )
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    # Trainings data waiting for the worker, cleared once processed
+    data = models.JSONField(blank=True, null=True)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    result = models.JSONField(blank=True, null=True)
+    errors = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    # Touched on every progress report, so stalled jobs can be recovered
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ImportJobManager()
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    @property
+    def progress(self) -> int:
+        """Percent of processed trainings."""
+        if not self.total:
+            return 100 if self.status == self.Status.DONE else 0
+        return self.processed * 100 // self.total
+
+    def __str__(self):
+        return f"Import job {self.pk} ({self.status})"
+
+
+class Tombstone(models.Model):
+    """
+    Deletion log of synced objects, so clients can drop deleted rows
+    without downloading full lists. Admin exercise templates are shared by
+    all users and are logged without an owner.
+    """
+
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="tombstones",
+        on_delete=models.CASCADE,
+        blank=True,
+        null=True,
+    )
+    # Model name of the deleted object, e.g. 'training'
+    model = models.CharField(max_length=30)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    objects = TombstoneManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["owner", "deleted_at"]),
+        ]
+        ordering = ["deleted_at"]
+
+    def __str__(self):
+        return f"Deleted {self.model} {self.object_id}"
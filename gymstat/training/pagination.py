@@ -0,0 +1,43 @@
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class TrainingCursorPagination(CursorPagination):
+    """
+    Keyset pagination that follows the (owner, -conducted) index, so every
+    page costs the same regardless of how deep it is. Trainings conducted
+    at the same time are ordered by id, so the offset the cursor keeps
+    within a tie points at the same rows on every request. The total
+    count is included unless the client passes 'count=false'.
+    """
+
+    ordering = ("-conducted", "-id")
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = None
+        if self.should_count(request):
+            self.count = queryset.order_by().count()
+        return super().paginate_queryset(queryset, request, view)
+
+    def should_count(self, request):
+        value = request.query_params.get(self.count_query_param, "")
+        return value.lower() not in ("0", "false")
+
+    def get_paginated_response(self, data):
+        response_data = {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+        if self.count is not None:
+            response_data = {"count": self.count, **response_data}
+        return Response(response_data)
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"] = {
+            "count": {"type": "integer", "example": 123},
+            **response_schema["properties"],
+        }
+        return response_schema
@@ -1,6 +1,17 @@
 from rest_framework import serializers
 
-from .models import Exercise, ExerciseTemplate, Training, TrainingTemplate
+from . import units
+from .constants import CANONICAL_UNITS
+from .models import (
+    Exercise,
+    ExerciseStatistic,
+    ExerciseTemplate,
+    ImportJob,
+    PersonalRecord,
+    Training,
+    TrainingTemplate,
+)
+from .statistics import format_statistic_value
 
 
 class ExerciseTemplateSerializer(serializers.ModelSerializer):
@@ -39,7 +50,30 @@ class TrainingTemplateSerializer(serializers.ModelSerializer):
         ]
 
 
+class ExerciseTemplateField(serializers.PrimaryKeyRelatedField):
+    """
+    Looks templates up in the 'exercise_templates' context mapping when
+    given, so a batch of trainings is validated without a query per
+    exercise.
+    """
+
+    def to_internal_value(self, data):
+        templates = self.context.get("exercise_templates")
+        if templates is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            return templates[int(data)]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
 class ExerciseSerializer(serializers.ModelSerializer):
+    template = ExerciseTemplateField(queryset=ExerciseTemplate.objects.all())
+
     class Meta:
         model = Exercise
         fields = ["id", "training", "template", "order", "units", "sets"]
@@ -47,7 +81,14 @@ class ExerciseSerializer(serializers.ModelSerializer):
 
 
 class TrainingSerializer(serializers.ModelSerializer):
+    """
+    Accepts optional 'fields' to render only the given field names.
+    'exercises_count' is rendered only on request and expects the
+    instances to be annotated with it.
+    """
+
     exercises = ExerciseSerializer(required=False, many=True)
+    exercises_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Training
@@ -60,9 +101,18 @@ class TrainingSerializer(serializers.ModelSerializer):
             "title",
             "notes",
             "exercises",
+            "exercises_count",
         ]
         read_only_fields = ["id", "owner"]
 
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is None:
+            self.fields.pop("exercises_count")
+            return
+        for field_name in set(self.fields) - set(fields):
+            self.fields.pop(field_name)
+
     def create(self, validated_data):
         return Training.objects.create_training(
             owner=validated_data.get("owner"),
@@ -72,6 +122,7 @@ class TrainingSerializer(serializers.ModelSerializer):
             description=validated_data.get("description"),
             notes=validated_data.get("notes"),
             exercises_data=validated_data.get("exercises"),
+            exercise_templates=self.context.get("exercise_templates"),
         )
 
     def update(self, instance, validated_data):
@@ -84,4 +135,163 @@ class TrainingSerializer(serializers.ModelSerializer):
             description=validated_data.get("description"),
             notes=validated_data.get("notes"),
             exercises_data=validated_data.get("exercises"),
+            exercise_templates=self.context.get("exercise_templates"),
+        )
+
+
+DATETIME_FIELD = serializers.DateTimeField()
+
+
+def exercise_to_representation(exercise: Exercise) -> dict:
+    """Same output as ExerciseSerializer, without field dispatch."""
+    return {
+        "id": exercise.id,
+        "training": exercise.training_id,
+        "template": exercise.template_id,
+        "order": exercise.order,
+        "units": exercise.units,
+        "sets": exercise.sets,
+    }
+
+
+TRAINING_FIELD_GETTERS = {
+    "id": lambda training: training.id,
+    "owner": lambda training: training.owner_id,
+    "template": lambda training: training.template_id,
+    "conducted": lambda training: DATETIME_FIELD.to_representation(
+        training.conducted
+    ),
+    "description": lambda training: training.description,
+    "title": lambda training: training.title,
+    "notes": lambda training: training.notes,
+    "exercises": lambda training: [
+        exercise_to_representation(exercise)
+        for exercise in training.exercises.all()
+    ],
+    "exercises_count": lambda training: training.exercises_count,
+}
+
+
+class TrainingReadSerializer:
+    """
+    Read-only replacement of TrainingSerializer for GET requests. Produces
+    the same representation, including the 'fields' argument, by mapping
+    model attributes directly instead of dispatching per field.
+    """
+
+    def __init__(self, instance=None, many=False, fields=None, **kwargs):
+        self.instance = instance
+        self.many = many
+        if fields is None:
+            fields = [
+                field
+                for field in TrainingSerializer.Meta.fields
+                if field != "exercises_count"
+            ]
+        self.getters = [
+            (field, TRAINING_FIELD_GETTERS[field])
+            for field in TrainingSerializer.Meta.fields
+            if field in fields
+        ]
+
+    def to_representation(self, training: Training) -> dict:
+        return {field: getter(training) for field, getter in self.getters}
+
+    @property
+    def data(self):
+        if self.many:
+            return [self.to_representation(item) for item in self.instance]
+        return self.to_representation(self.instance)
+
+
+def render_statistic_values(values: list, context: dict) -> list[str]:
+    field = context["field"]
+    if context["aggregate"] == "count":
+        return [str(value) for value in values]
+    return [
+        format_statistic_value(field, value)
+        for value in units.from_canonical(field, values, context["unit"])
+    ]
+
+
+class ExerciseStatisticListSerializer(serializers.ListSerializer):
+    """
+    Converts the aggregated values of the whole page to the requested unit
+    in one pass.
+    """
+
+    def to_representation(self, data):
+        rows = list(data.all() if hasattr(data, "all") else data)
+        field = self.context["field"]
+        aggregate = self.context["aggregate"]
+        values = render_statistic_values(
+            [getattr(row, aggregate) for row in rows], self.context
         )
+        date_field = self.child.fields["date"]
+        return [
+            {"date": date_field.to_representation(row.date), field: value}
+            for row, value in zip(rows, values)
+        ]
+
+
+class ExerciseStatisticSerializer(serializers.ModelSerializer):
+    """
+    Expects 'field', 'aggregate' and 'unit' in the context and renders
+    the aggregated value under the field name in the requested unit.
+    """
+
+    class Meta:
+        model = ExerciseStatistic
+        fields = ["date"]
+        list_serializer_class = ExerciseStatisticListSerializer
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        value = getattr(instance, self.context["aggregate"])
+        data[self.context["field"]] = render_statistic_values(
+            [value], self.context
+        )[0]
+        return data
+
+
+class PersonalRecordSerializer(serializers.ModelSerializer):
+    value = serializers.SerializerMethodField()
+    unit = serializers.SerializerMethodField()
+
+    class Meta:
+        model = PersonalRecord
+        fields = [
+            "id",
+            "template",
+            "field",
+            "reps",
+            "value",
+            "unit",
+            "achieved",
+        ]
+
+    def get_value(self, obj):
+        return format_statistic_value(obj.field, obj.value)
+
+    def get_unit(self, obj):
+        return CANONICAL_UNITS.get(obj.field)
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    progress = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = ImportJob
+        fields = [
+            "id",
+            "status",
+            "total",
+            "processed",
+            "progress",
+            "result",
+            "errors",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
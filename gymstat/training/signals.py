@@ -0,0 +1,25 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import bump_version
+from .models import ExerciseTemplate
+
+
+@receiver(pre_save, sender=ExerciseTemplate)
+def remember_admin_flag(sender, instance, **kwargs):
+    # A template that stops being an admin one leaves the admin lists
+    instance._was_admin = bool(
+        instance.pk
+        and not instance.is_admin
+        and ExerciseTemplate.objects.filter(
+            pk=instance.pk, is_admin=True
+        ).exists()
+    )
+
+
+@receiver(post_save, sender=ExerciseTemplate)
+@receiver(post_delete, sender=ExerciseTemplate)
+def invalidate_exercise_template_lists(sender, instance, **kwargs):
+    bump_version(instance.owner_id)
+    if instance.is_admin or getattr(instance, "_was_admin", False):
+        bump_version()
@@ -0,0 +1,147 @@
+import datetime
+from calendar import monthrange
+from collections.abc import Iterable
+
+from .constants import RECORD_FIELDS
+from .units import get_factor
+from .utils import Duration
+from .validators import EXERCISE_SCHEMA
+
+NUMERIC_FIELD_TYPES = {"int", "float", "duration"}
+
+
+def get_field_type(field: str) -> str:
+    return EXERCISE_SCHEMA.field_types[field]
+
+
+def is_statistic_field(field: str) -> bool:
+    return EXERCISE_SCHEMA.field_types.get(field) in NUMERIC_FIELD_TYPES
+
+
+STATISTIC_FIELDS = [
+    field for field in EXERCISE_SCHEMA.field_types if is_statistic_field(field)
+]
+
+
+def parse_canonical(field: str, value, unit: str | None = None) -> float:
+    """Parse a raw set value to a float in the field's canonical unit."""
+    if get_field_type(field) == "duration":
+        return float(Duration.parse(value))
+    return float(value) * get_factor(field, unit)
+
+
+def format_statistic_value(field: str, value: float) -> str:
+    if get_field_type(field) == "duration":
+        return str(Duration(round(value)))
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def get_set_values(exercise_set: dict, units: dict | None) -> dict:
+    """Return canonical numeric values of the statistic fields of a set."""
+    units = units or {}
+    return {
+        field: parse_canonical(field, value, units.get(field))
+        for field, value in exercise_set.items()
+        if value != "" and is_statistic_field(field)
+    }
+
+
+def collect_statistics(
+    exercises: Iterable,
+    date: datetime.date,
+) -> dict[tuple[datetime.date, int, str], list[float]]:
+    """
+    Aggregate sets of the given exercises conducted on the date into
+    {(date, template_id, field): [max, sum, count]} in canonical units.
+    """
+    statistics = {}
+    for exercise in exercises:
+        for exercise_set in exercise.sets or []:
+            values = get_set_values(exercise_set, exercise.units)
+            for field, value in values.items():
+                key = (date, exercise.template_id, field)
+                bucket = statistics.get(key)
+                if bucket is None:
+                    statistics[key] = [value, value, 1]
+                else:
+                    bucket[0] = max(bucket[0], value)
+                    bucket[1] += value
+                    bucket[2] += 1
+    return statistics
+
+
+def collect_records(
+    exercises: Iterable,
+    conducted: datetime.datetime,
+) -> dict[tuple[int, str, int], tuple[float, datetime.datetime]]:
+    """
+    Collect the best value of every record field per rep count into
+    {(template_id, field, reps): (value, conducted)} in canonical units.
+    Sets without reps and the 'reps' field itself use rep count 0, sets
+    with negative reps stored before they were rejected are skipped.
+    """
+    records = {}
+    for exercise in exercises:
+        for exercise_set in exercise.sets or []:
+            values = get_set_values(exercise_set, exercise.units)
+            reps = int(values.get("reps") or 0)
+            if reps < 0:
+                continue
+            for field in RECORD_FIELDS:
+                value = values.get(field)
+                if value is None:
+                    continue
+                key = (
+                    exercise.template_id,
+                    field,
+                    0 if field == "reps" else reps,
+                )
+                if key not in records or value > records[key][0]:
+                    records[key] = (value, conducted)
+    return records
+
+
+def merge_statistics(statistics: dict, other: dict) -> dict:
+    """Merge collect_statistics results of other into statistics."""
+    for key, (maximum, total, count) in other.items():
+        bucket = statistics.get(key)
+        if bucket is None:
+            statistics[key] = [maximum, total, count]
+        else:
+            bucket[0] = max(bucket[0], maximum)
+            bucket[1] += total
+            bucket[2] += count
+    return statistics
+
+
+def merge_records(records: dict, other: dict) -> dict:
+    """Merge collect_records results of other into records."""
+    for key, (value, conducted) in other.items():
+        record = records.get(key)
+        if (
+            record is None
+            or value > record[0]
+            or (value == record[0] and conducted < record[1])
+        ):
+            records[key] = (value, conducted)
+    return records
+
+
+def get_period_start(
+    today: datetime.date, period: str, quantity: int
+) -> datetime.date:
+    """Return the first day that is not covered by the requested window."""
+    match period:
+        case "day":
+            return today - datetime.timedelta(days=quantity)
+        case "week":
+            return today - datetime.timedelta(weeks=quantity)
+        case "month":
+            year, month = divmod(
+                today.year * 12 + today.month - 1 - quantity, 12
+            )
+            month += 1
+            day = min(today.day, monthrange(year, month)[1])
+            return datetime.date(year, month, day)
+        case _:
+            raise ValueError(f"Unexpected period '{period}'")
@@ -0,0 +1,82 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.db.models import Q, QuerySet
+
+from .models import ExerciseTemplate, Tombstone, Training, TrainingTemplate
+from .serializers import (
+    ExerciseTemplateSerializer,
+    TrainingSerializer,
+    TrainingTemplateSerializer,
+)
+
+User = get_user_model()
+
+# Rows saved by a transaction that commits after a sync has started carry
+# an older edited_at than the returned watermark. Changes from this window
+# before the watermark are sent again; clients apply them idempotently.
+SYNC_OVERLAP = datetime.timedelta(seconds=5)
+
+
+def get_sync_querysets(owner: User) -> dict[str, QuerySet]:
+    return {
+        "trainings": Training.objects.filter(owner=owner).prefetch_related(
+            "exercises"
+        ),
+        "training_templates": TrainingTemplate.objects.filter(owner=owner),
+        "exercise_templates": ExerciseTemplate.objects.filter(
+            Q(owner=owner) | Q(is_admin=True)
+        ),
+    }
+
+
+SYNC_SERIALIZERS = {
+    "trainings": TrainingSerializer,
+    "training_templates": TrainingTemplateSerializer,
+    "exercise_templates": ExerciseTemplateSerializer,
+}
+SYNC_MODEL_NAMES = {
+    "trainings": Training._meta.model_name,
+    "training_templates": TrainingTemplate._meta.model_name,
+    "exercise_templates": ExerciseTemplate._meta.model_name,
+}
+
+
+def get_changes(owner: User, since: datetime.datetime | None) -> dict:
+    """
+    Return {key: {"created": [...], "updated": [...], "deleted": [ids]}}
+    for every synced model of the owner changed after 'since'. Without
+    'since' every existing object is returned as created.
+    """
+    start = None if since is None else since - SYNC_OVERLAP
+    deleted = {key: [] for key in SYNC_MODEL_NAMES}
+    if start is not None:
+        keys = {name: key for key, name in SYNC_MODEL_NAMES.items()}
+        tombstones = Tombstone.objects.for_user(owner).filter(
+            deleted_at__gte=start
+        )
+        for model, object_id in tombstones.values_list("model", "object_id"):
+            if model in keys:
+                deleted[keys[model]].append(object_id)
+
+    changes = {}
+    for key, queryset in get_sync_querysets(owner).items():
+        if start is not None:
+            queryset = queryset.filter(edited_at__gte=start)
+        created, updated = [], []
+        for instance in queryset:
+            if not getattr(instance, "is_active", True):
+                # Deactivated templates are gone for clients
+                if start is not None:
+                    deleted[key].append(instance.pk)
+            elif start is None or instance.created_at >= start:
+                created.append(instance)
+            else:
+                updated.append(instance)
+        serializer_class = SYNC_SERIALIZERS[key]
+        changes[key] = {
+            "created": serializer_class(created, many=True).data,
+            "updated": serializer_class(updated, many=True).data,
+            "deleted": deleted[key],
+        }
+    return changes
@@ -0,0 +1,7 @@
+import datetime
+
+CONDUCTED = datetime.datetime(2025, 4, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+def get_streaming_content(response) -> bytes:
+    return b"".join(response.streaming_content)
@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+from training.tests import CONDUCTED
+from user.tests import user_data
+
+User = get_user_model()
+
+
+class BackfillMigrationsTestCase(TransactionTestCase):
+    migrate_from = [("training", "0010_alter_training_notes")]
+    migrate_to = [("training", "0013_personalrecord")]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        self.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_legacy_values_out_of_column_range(self):
+        apps = self.migrate(self.migrate_from)
+        user = User.objects.create_user(**user_data)
+        template = apps.get_model("training", "ExerciseTemplate")(
+            name="Bench press", owner_id=user.pk, fields=["reps", "weight"]
+        )
+        template.save()
+        training = apps.get_model("training", "Training")(
+            owner_id=user.pk, conducted=CONDUCTED
+        )
+        training.save()
+        # Accepted by the validators before set values were bounded
+        apps.get_model("training", "Exercise").objects.create(
+            training=training,
+            template=template,
+            order=1,
+            units={"weight": "kg"},
+            sets=[
+                {"reps": "3000000000", "weight": "80"},
+                {"reps": "5", "weight": "nan"},
+                {"reps": "3", "weight": "90"},
+            ],
+        )
+
+        apps = self.migrate(self.migrate_to)
+        ExerciseSet = apps.get_model("training", "ExerciseSet")
+        self.assertEqual(
+            list(
+                ExerciseSet.objects.order_by("order").values_list(
+                    "reps", "weight"
+                )
+            ),
+            [(None, 80), (5, None), (3, 90)],
+        )
+        PersonalRecord = apps.get_model("training", "PersonalRecord")
+        self.assertEqual(
+            set(PersonalRecord.objects.values_list("field", "reps", "value")),
+            {("weight", 0, 80), ("weight", 3, 90), ("reps", 0, 5)},
+        )
+        ExerciseStatistic = apps.get_model("training", "ExerciseStatistic")
+        self.assertEqual(ExerciseStatistic.objects.get(field="reps").count, 2)
@@ -0,0 +1,91 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.db.models import Max, Sum
+from django.test import TestCase
+
+from training.tests import CONDUCTED
+from user.tests import user_data
+
+from ...models import ExerciseSet, ExerciseTemplate, Training
+
+User = get_user_model()
+
+
+class ExerciseSetModelTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.exercise_template = ExerciseTemplate.objects.create(
+            name="Bench press",
+            owner=self.user,
+            fields=["reps", "weight", "rest", "tempo"],
+        )
+        self.run_template = ExerciseTemplate.objects.create(
+            name="Run",
+            owner=self.user,
+            fields=["distance", "time"],
+        )
+        self.exercise_data = {
+            "template": self.exercise_template,
+            "order": 1,
+            "units": {"weight": "lbs"},
+            "sets": [
+                {"reps": "8", "weight": "100", "rest": "01:30"},
+                {"reps": "5", "weight": "120", "tempo": "3-1-1"},
+            ],
+        }
+        self.run_data = {
+            "template": self.run_template,
+            "order": 2,
+            "units": {"distance": "km"},
+            "sets": [{"distance": "42.195", "time": "25:10:00"}],
+        }
+        self.training = Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[self.exercise_data, self.run_data],
+        )
+
+    def test_create_training_stores_typed_sets(self):
+        self.assertEqual(ExerciseSet.objects.count(), 3)
+        first, second = ExerciseSet.objects.filter(
+            template=self.exercise_template
+        )
+        self.assertEqual(first.order, 1)
+        self.assertEqual(first.owner, self.user)
+        self.assertEqual(first.conducted, CONDUCTED)
+        self.assertEqual(first.reps, 8)
+        self.assertAlmostEqual(first.weight, 45.359237)
+        self.assertEqual(first.rest, 90)
+        self.assertIsNone(second.rest)
+        run = ExerciseSet.objects.get(template=self.run_template)
+        self.assertEqual(run.distance, 42195)
+        self.assertEqual(run.time, 90600)
+
+    def test_typed_sets_support_sql_aggregates(self):
+        result = ExerciseSet.objects.filter(
+            owner=self.user, template=self.exercise_template
+        ).aggregate(Max("reps"), Sum("reps"))
+        self.assertEqual(result, {"reps__max": 8, "reps__sum": 13})
+
+    def test_update_training_rewrites_changed_exercises_only(self):
+        run_set = ExerciseSet.objects.get(template=self.run_template)
+        self.exercise_data["sets"] = [{"reps": "12", "weight": "90"}]
+        new_conducted = CONDUCTED + datetime.timedelta(days=1)
+        Training.objects.update_training(
+            training=self.training,
+            owner=self.user,
+            conducted=new_conducted,
+            exercises_data=[self.exercise_data, self.run_data],
+        )
+        self.assertEqual(ExerciseSet.objects.count(), 2)
+        bench_set = ExerciseSet.objects.get(template=self.exercise_template)
+        self.assertEqual(bench_set.reps, 12)
+        self.assertEqual(bench_set.conducted, new_conducted)
+        updated_run_set = ExerciseSet.objects.get(template=self.run_template)
+        self.assertEqual(updated_run_set.pk, run_set.pk)
+        self.assertEqual(updated_run_set.conducted, new_conducted)
+
+    def test_delete_training_removes_typed_sets(self):
+        Training.objects.delete_training(self.training, self.user)
+        self.assertEqual(ExerciseSet.objects.count(), 0)
@@ -0,0 +1,253 @@
+import datetime
+import threading
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import PermissionDenied
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+
+from training.tests import CONDUCTED
+from user.tests import other_user_data, user_data
+
+from ...models import ExerciseStatistic, ExerciseTemplate, Training
+from ...statistics import collect_statistics
+
+User = get_user_model()
+
+
+class ExerciseStatisticModelTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.other_user = User.objects.create_user(**other_user_data)
+        self.exercise_template = ExerciseTemplate.objects.create(
+            name="Bench press",
+            owner=self.user,
+            fields=["reps", "weight", "rest", "notes"],
+        )
+        self.exercise_data = {
+            "template": self.exercise_template,
+            "order": 1,
+            "units": {"weight": "kg"},
+            "sets": [
+                {"reps": "8", "weight": "60", "rest": "01:30"},
+                {"reps": "5", "weight": "80", "notes": "hard"},
+                {"weight": "70"},
+            ],
+        }
+
+    def get_statistic(self, field, date=CONDUCTED.date()):
+        return ExerciseStatistic.objects.get(
+            owner=self.user,
+            template=self.exercise_template,
+            field=field,
+            date=date,
+        )
+
+    def test_create_training_builds_statistics(self):
+        Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[self.exercise_data],
+        )
+        self.assertEqual(ExerciseStatistic.objects.count(), 3)
+        weight = self.get_statistic("weight")
+        self.assertEqual(weight.max, 80)
+        self.assertEqual(weight.sum, 210)
+        self.assertEqual(weight.count, 3)
+        reps = self.get_statistic("reps")
+        self.assertEqual(reps.max, 8)
+        self.assertEqual(reps.count, 2)
+        self.assertEqual(self.get_statistic("rest").max, 90)
+
+    def test_statistics_in_canonical_unit(self):
+        self.exercise_data["units"] = {"weight": "lbs"}
+        self.exercise_data["sets"] = [{"weight": "220.46"}]
+        Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[self.exercise_data],
+        )
+        self.assertAlmostEqual(self.get_statistic("weight").max, 100, 1)
+
+    def test_statistics_merge_trainings_of_one_day(self):
+        for _ in range(2):
+            Training.objects.create_training(
+                owner=self.user,
+                conducted=CONDUCTED,
+                exercises_data=[self.exercise_data],
+            )
+        weight = self.get_statistic("weight")
+        self.assertEqual(weight.max, 80)
+        self.assertEqual(weight.sum, 420)
+        self.assertEqual(weight.count, 6)
+
+    def test_update_training_moves_statistics(self):
+        training = Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[self.exercise_data],
+        )
+        new_conducted = CONDUCTED + datetime.timedelta(days=1)
+        self.exercise_data["sets"] = [{"weight": "100"}]
+        Training.objects.update_training(
+            training=training,
+            owner=self.user,
+            conducted=new_conducted,
+            exercises_data=[self.exercise_data],
+        )
+        self.assertFalse(
+            ExerciseStatistic.objects.filter(date=CONDUCTED.date()).exists()
+        )
+        weight = self.get_statistic("weight", new_conducted.date())
+        self.assertEqual(weight.max, 100)
+        self.assertEqual(weight.count, 1)
+
+    def test_delete_training_removes_statistics(self):
+        training = Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[self.exercise_data],
+        )
+        Training.objects.delete_training(training, self.user)
+        self.assertEqual(ExerciseStatistic.objects.count(), 0)
+
+    def test_delete_other_user_training(self):
+        training = Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[self.exercise_data],
+        )
+        with self.assertRaises(PermissionDenied):
+            Training.objects.delete_training(training, self.other_user)
+        self.assertEqual(ExerciseStatistic.objects.count(), 3)
+
+    def test_update_training_recomputes_removed_max(self):
+        Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[self.exercise_data],
+        )
+        training = Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[
+                {**self.exercise_data, "sets": [{"weight": "120"}]}
+            ],
+        )
+        self.assertEqual(self.get_statistic("weight").max, 120)
+        Training.objects.update_training(
+            training=training,
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[
+                {**self.exercise_data, "sets": [{"weight": "50"}]}
+            ],
+        )
+        weight = self.get_statistic("weight")
+        self.assertEqual(weight.max, 80)
+        self.assertEqual(weight.sum, 260)
+        self.assertEqual(weight.count, 4)
+
+    def test_unchanged_exercises_do_not_touch_statistics(self):
+        training = Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[self.exercise_data],
+        )
+        statistics = collect_statistics(
+            training.exercises.all(), CONDUCTED.date()
+        )
+        with self.assertNumQueries(0):
+            ExerciseStatistic.objects.apply_changes(
+                self.user, statistics, statistics
+            )
+
+    def test_incremental_changes_match_rebuild(self):
+        trainings = [
+            Training.objects.create_training(
+                owner=self.user,
+                conducted=CONDUCTED + datetime.timedelta(hours=hours),
+                exercises_data=[self.exercise_data],
+            )
+            for hours in range(3)
+        ]
+        Training.objects.update_training(
+            training=trainings[0],
+            owner=self.user,
+            conducted=CONDUCTED + datetime.timedelta(days=1),
+            exercises_data=[{**self.exercise_data, "sets": [{"reps": "12"}]}],
+        )
+        Training.objects.delete_training(trainings[1], self.user)
+
+        def dump():
+            return sorted(
+                ExerciseStatistic.objects.values_list(
+                    "date", "template", "field", "max", "sum", "count"
+                )
+            )
+
+        incremental = dump()
+        ExerciseStatistic.objects.rebuild(
+            self.user,
+            {CONDUCTED.date(), CONDUCTED.date() + datetime.timedelta(days=1)},
+        )
+        self.assertEqual(incremental, dump())
+
+    def test_rebuild_command_restores_statistics(self):
+        Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[self.exercise_data],
+        )
+
+        def dump():
+            return sorted(
+                ExerciseStatistic.objects.values_list(
+                    "date", "template", "field", "max", "sum", "count"
+                )
+            )
+
+        statistics = dump()
+        ExerciseStatistic.objects.update(max=0, sum=0, count=0)
+
+        out = StringIO()
+        call_command("rebuild_exercise_statistics", stdout=out)
+        self.assertIn("for 1 users", out.getvalue())
+        self.assertEqual(statistics, dump())
+
+
+class ExerciseStatisticConcurrencyTestCase(TransactionTestCase):
+    def test_concurrent_first_writes_to_bucket(self):
+        user = User.objects.create_user(**user_data)
+        template = ExerciseTemplate.objects.create(
+            name="Bench press", owner=user, fields=["weight"]
+        )
+        key = (CONDUCTED.date(), template.pk, "weight")
+        barrier = threading.Barrier(2)
+        errors = []
+
+        def write(value):
+            try:
+                barrier.wait()
+                ExerciseStatistic.objects.apply_changes(
+                    user, previous={}, current={key: [value, value, 1]}
+                )
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [
+            threading.Thread(target=write, args=(value,)) for value in (80, 90)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        statistic = ExerciseStatistic.objects.get(owner=user, field="weight")
+        self.assertEqual(
+            (statistic.max, statistic.sum, statistic.count), (90, 170, 2)
+        )
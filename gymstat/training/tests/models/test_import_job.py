@@ -0,0 +1,164 @@
+import datetime
+import io
+from unittest import mock
+
+import redis
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from user.tests import user_data
+
+from ...jobs import IMPORT_JOB_STALE_AFTER
+from ...models import ExerciseTemplate, ImportJob, Training
+from ..utils.test_training_import import make_training_data
+
+User = get_user_model()
+
+
+@mock.patch("training.managers.enqueue_import_job")
+class ImportJobModelTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+        ExerciseTemplate.objects.create(
+            name="Run", owner=self.user, fields=["distance", "time"]
+        )
+
+    def create_job(self, trainings_data):
+        with self.captureOnCommitCallbacks(execute=True):
+            return ImportJob.objects.create_job(self.user, trainings_data)
+
+    def test_create_job_enqueues_after_commit(self, enqueue):
+        with self.captureOnCommitCallbacks() as callbacks:
+            job = ImportJob.objects.create_job(
+                self.user, [make_training_data(1)]
+            )
+            enqueue.assert_not_called()
+        for callback in callbacks:
+            callback()
+        enqueue.assert_called_once_with(job.pk)
+        self.assertEqual(job.status, ImportJob.Status.PENDING)
+        self.assertEqual(job.total, 1)
+        self.assertEqual(job.progress, 0)
+
+    def test_run_job(self, enqueue):
+        job = self.create_job(
+            [make_training_data(day) for day in range(1, 4)]
+            + [{"conducted": "never"}]
+        )
+        job = ImportJob.objects.run_job(job.pk)
+        self.assertEqual(job.status, ImportJob.Status.DONE)
+        self.assertEqual(job.processed, 4)
+        self.assertEqual(job.progress, 100)
+        self.assertEqual(job.result["trainings"], 3)
+        self.assertEqual(job.errors[0]["training"], 4)
+        self.assertIsNone(job.data)
+        self.assertIsNotNone(job.finished_at)
+        self.assertEqual(Training.objects.filter(owner=self.user).count(), 3)
+
+    def test_run_job_reports_progress_per_chunk(self, enqueue):
+        job = self.create_job([make_training_data(day) for day in range(1, 4)])
+        progress = []
+
+        def import_trainings(importer, trainings_data, on_progress, **kwargs):
+            for processed in (2, 3):
+                on_progress(processed, {"errors": []})
+                progress.append(ImportJob.objects.get(pk=job.pk).progress)
+            return {"trainings": 3, "errors": []}
+
+        with mock.patch(
+            "training.imports.TrainingImporter.import_trainings",
+            import_trainings,
+        ):
+            ImportJob.objects.run_job(job.pk)
+        self.assertEqual(progress, [66, 100])
+
+    def test_enqueue_failure_fails_job(self, enqueue):
+        enqueue.side_effect = redis.ConnectionError("Redis is gone")
+        with self.assertLogs("training.managers", "ERROR"):
+            job = self.create_job([make_training_data(1)])
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJob.Status.FAILED)
+        self.assertIsNotNone(job.finished_at)
+        self.assertIsNone(ImportJob.objects.run_job(job.pk))
+
+    def test_requeue_stale_jobs(self, enqueue):
+        stale = self.create_job([make_training_data(1)])
+        running = self.create_job([make_training_data(2)])
+        ImportJob.objects.update(status=ImportJob.Status.RUNNING)
+        ImportJob.objects.filter(pk=stale.pk).update(
+            updated_at=timezone.now()
+            - IMPORT_JOB_STALE_AFTER
+            - datetime.timedelta(seconds=1)
+        )
+        self.assertEqual(ImportJob.objects.requeue_stale_jobs(), [stale.pk])
+        stale.refresh_from_db()
+        running.refresh_from_db()
+        self.assertEqual(stale.status, ImportJob.Status.PENDING)
+        self.assertEqual(running.status, ImportJob.Status.RUNNING)
+
+    def test_requeued_job_resumes(self, enqueue):
+        job = self.create_job(
+            [make_training_data(day) for day in range(1, 4)]
+            + [{"conducted": "never"}]
+        )
+        # A worker committed the first two trainings and died
+        ImportJob.objects.filter(pk=job.pk).update(
+            processed=2, result={"trainings": 2, "exercises": 4, "sets": 6}
+        )
+        job = ImportJob.objects.run_job(job.pk)
+        self.assertEqual(job.status, ImportJob.Status.DONE)
+        self.assertEqual(job.result["trainings"], 3)
+        self.assertEqual(job.result["sets"], 9)
+        self.assertEqual(job.errors[0]["training"], 4)
+        self.assertEqual(Training.objects.filter(owner=self.user).count(), 1)
+
+    def test_run_job_only_once(self, enqueue):
+        job = self.create_job([make_training_data(1)])
+        self.assertIsNotNone(ImportJob.objects.run_job(job.pk))
+        self.assertIsNone(ImportJob.objects.run_job(job.pk))
+        self.assertIsNone(ImportJob.objects.run_job(job.pk + 1))
+        self.assertEqual(Training.objects.count(), 1)
+
+    def test_failed_job(self, enqueue):
+        job = self.create_job([make_training_data(1)])
+        with (
+            mock.patch(
+                "training.imports.TrainingImporter.save_chunk",
+                side_effect=RuntimeError("Database is gone"),
+            ),
+            self.assertLogs("training.managers", "ERROR"),
+        ):
+            job = ImportJob.objects.run_job(job.pk)
+        self.assertEqual(job.status, ImportJob.Status.FAILED)
+        self.assertEqual(job.errors, [{"detail": "Database is gone"}])
+        self.assertIsNotNone(job.data)
+
+    def test_worker_command(self, enqueue):
+        job = self.create_job([make_training_data(1)])
+        stdout = io.StringIO()
+        with (
+            mock.patch(
+                "training.management.commands.run_import_worker"
+                ".enqueue_import_job"
+            ) as requeue,
+            mock.patch(
+                "training.management.commands.run_import_worker"
+                ".pop_import_job",
+                side_effect=[job.pk, None],
+            ),
+            mock.patch(
+                "training.management.commands.run_import_worker"
+                ".close_old_connections"
+            ) as close_old_connections,
+        ):
+            call_command("run_import_worker", "--once", stdout=stdout)
+        requeue.assert_called_once_with(job.pk)
+        self.assertEqual(close_old_connections.call_count, 2)
+        self.assertIn(f"Import job {job.pk} done: 1/1", stdout.getvalue())
+        job.refresh_from_db()
+        self.assertEqual(job.status, ImportJob.Status.DONE)
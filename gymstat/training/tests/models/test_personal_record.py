@@ -0,0 +1,208 @@
+import datetime
+import threading
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+
+from training.tests import CONDUCTED
+from user.tests import user_data
+
+from ...models import (
+    Exercise,
+    ExerciseSet,
+    ExerciseTemplate,
+    PersonalRecord,
+    Training,
+)
+
+User = get_user_model()
+
+
+class PersonalRecordModelTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.exercise_template = ExerciseTemplate.objects.create(
+            name="Bench press",
+            owner=self.user,
+            fields=["reps", "weight", "notes"],
+        )
+
+    def create_training(self, sets, conducted=CONDUCTED, units=None):
+        return Training.objects.create_training(
+            owner=self.user,
+            conducted=conducted,
+            exercises_data=[self.get_exercise_data(sets, units)],
+        )
+
+    def get_exercise_data(self, sets, units=None):
+        return {
+            "template": self.exercise_template,
+            "order": 1,
+            "units": units or {"weight": "kg"},
+            "sets": sets,
+        }
+
+    def get_records(self):
+        return {
+            (record.field, record.reps): (record.value, record.achieved)
+            for record in PersonalRecord.objects.filter(owner=self.user)
+        }
+
+    def test_create_training_builds_records(self):
+        self.create_training(
+            [
+                {"reps": "5", "weight": "80"},
+                {"reps": "5", "weight": "85"},
+                {"reps": "8", "weight": "70"},
+                {"weight": "100"},
+            ]
+        )
+        self.assertEqual(
+            self.get_records(),
+            {
+                ("weight", 5): (85, CONDUCTED),
+                ("weight", 8): (70, CONDUCTED),
+                ("weight", 0): (100, CONDUCTED),
+                ("reps", 0): (8, CONDUCTED),
+            },
+        )
+
+    def test_records_in_canonical_unit(self):
+        self.create_training([{"weight": "220.46"}], units={"weight": "lbs"})
+        value, _ = self.get_records()[("weight", 0)]
+        self.assertAlmostEqual(value, 100, 1)
+
+    def test_record_keeps_first_achievement(self):
+        self.create_training([{"reps": "5", "weight": "80"}])
+        later = CONDUCTED + datetime.timedelta(days=1)
+        self.create_training([{"reps": "5", "weight": "80"}], later)
+        self.create_training([{"reps": "5", "weight": "75"}], later)
+        self.assertEqual(self.get_records()[("weight", 5)], (80, CONDUCTED))
+
+    def test_equal_record_moves_to_earlier_achievement(self):
+        later = CONDUCTED + datetime.timedelta(days=1)
+        self.create_training([{"reps": "5", "weight": "80"}], later)
+        self.create_training([{"reps": "5", "weight": "80"}])
+        self.assertEqual(self.get_records()[("weight", 5)], (80, CONDUCTED))
+
+    def test_new_record_replaces_old(self):
+        self.create_training([{"reps": "5", "weight": "80"}])
+        later = CONDUCTED + datetime.timedelta(days=1)
+        self.create_training([{"reps": "5", "weight": "90"}], later)
+        self.assertEqual(self.get_records()[("weight", 5)], (90, later))
+
+    def test_update_training_repairs_record(self):
+        self.create_training([{"reps": "5", "weight": "80"}])
+        later = CONDUCTED + datetime.timedelta(days=1)
+        training = self.create_training([{"reps": "5", "weight": "90"}], later)
+        Training.objects.update_training(
+            training=training,
+            owner=self.user,
+            conducted=later,
+            exercises_data=[self.get_exercise_data([{"reps": "3"}])],
+        )
+        records = self.get_records()
+        self.assertEqual(records[("weight", 5)], (80, CONDUCTED))
+        self.assertEqual(records[("reps", 0)], (5, CONDUCTED))
+
+    def test_update_training_moves_achievement(self):
+        training = self.create_training([{"reps": "5", "weight": "80"}])
+        later = CONDUCTED + datetime.timedelta(days=1)
+        Training.objects.update_training(
+            training=training,
+            owner=self.user,
+            conducted=later,
+            exercises_data=[
+                self.get_exercise_data([{"reps": "5", "weight": "80"}])
+            ],
+        )
+        self.assertEqual(self.get_records()[("weight", 5)], (80, later))
+
+    def test_delete_training_repairs_records(self):
+        self.create_training([{"reps": "5", "weight": "80"}])
+        training = self.create_training(
+            [{"reps": "5", "weight": "90"}, {"reps": "1", "weight": "100"}]
+        )
+        Training.objects.delete_training(training, self.user)
+        self.assertEqual(
+            self.get_records(),
+            {("weight", 5): (80, CONDUCTED), ("reps", 0): (5, CONDUCTED)},
+        )
+
+    def test_incremental_changes_match_rebuild(self):
+        trainings = [
+            self.create_training(
+                [{"reps": str(reps), "weight": str(60 + reps * 5)}],
+                CONDUCTED + datetime.timedelta(days=reps),
+            )
+            for reps in range(1, 6)
+        ]
+        Training.objects.update_training(
+            training=trainings[0],
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[
+                self.get_exercise_data([{"reps": "3", "weight": "100"}])
+            ],
+        )
+        Training.objects.delete_training(trainings[4], self.user)
+
+        incremental = self.get_records()
+        PersonalRecord.objects.rebuild(self.user)
+        self.assertEqual(incremental, self.get_records())
+
+    def test_rebuild_skips_legacy_negative_reps(self):
+        self.create_training([{"reps": "5", "weight": "80"}])
+        training = self.create_training(
+            [{"reps": "3", "weight": "100"}],
+            CONDUCTED + datetime.timedelta(days=1),
+        )
+        # Stored before negative reps were rejected
+        Exercise.objects.filter(training=training).update(
+            sets=[{"reps": "-3", "weight": "100"}]
+        )
+        ExerciseSet.objects.filter(exercise__training=training).update(reps=-3)
+        PersonalRecord.objects.rebuild(self.user)
+        rebuilt = self.get_records()
+        self.assertEqual(
+            rebuilt,
+            {("weight", 5): (80, CONDUCTED), ("reps", 0): (5, CONDUCTED)},
+        )
+        Training.objects.delete_training(training, self.user)
+        self.assertEqual(self.get_records(), rebuilt)
+
+
+class PersonalRecordConcurrencyTestCase(TransactionTestCase):
+    def test_concurrent_new_records(self):
+        user = User.objects.create_user(**user_data)
+        template = ExerciseTemplate.objects.create(
+            name="Bench press", owner=user, fields=["reps", "weight"]
+        )
+        key = (template.pk, "weight", 5)
+        barrier = threading.Barrier(2)
+        errors = []
+
+        def write(value, achieved):
+            try:
+                barrier.wait()
+                PersonalRecord.objects.apply_changes(
+                    user, previous={}, current={key: (value, achieved)}
+                )
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        later = CONDUCTED + datetime.timedelta(days=1)
+        threads = [
+            threading.Thread(target=write, args=(80, CONDUCTED)),
+            threading.Thread(target=write, args=(90, later)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        record = PersonalRecord.objects.get(owner=user, reps=5)
+        self.assertEqual((record.value, record.achieved), (90, later))
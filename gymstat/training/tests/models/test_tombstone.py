@@ -0,0 +1,133 @@
+import datetime
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from training.tests import CONDUCTED
+from user.tests import admin_user_data, other_user_data, user_data
+
+from ...models import (
+    ExerciseTemplate,
+    Tombstone,
+    Training,
+    TrainingTemplate,
+)
+
+User = get_user_model()
+
+
+class TombstoneModelTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.other_user = User.objects.create_user(**other_user_data)
+        self.admin = User.objects.create_user(**admin_user_data)
+
+    def test_delete_training_records_tombstone(self):
+        training = Training.objects.create_training(
+            owner=self.user, conducted=CONDUCTED
+        )
+        pk = training.pk
+        Training.objects.delete_training(training, self.user)
+        tombstone = Tombstone.objects.get()
+        self.assertEqual(tombstone.owner, self.user)
+        self.assertEqual(tombstone.model, "training")
+        self.assertEqual(tombstone.object_id, pk)
+
+    def test_admin_template_is_shared(self):
+        template = ExerciseTemplate.objects.create(
+            name="Squat", owner=self.admin, fields=["reps"], is_admin=True
+        )
+        tombstone = Tombstone.objects.record(template)
+        self.assertIsNone(tombstone.owner)
+        self.assertEqual(tombstone.model, "exercisetemplate")
+
+    def test_for_user(self):
+        own = Tombstone.objects.create(
+            owner=self.user, model="training", object_id=1
+        )
+        shared = Tombstone.objects.create(
+            model="exercisetemplate", object_id=2
+        )
+        Tombstone.objects.create(
+            owner=self.other_user, model="training", object_id=3
+        )
+        self.assertQuerySetEqual(
+            Tombstone.objects.for_user(self.user),
+            [own, shared],
+            ordered=False,
+        )
+
+    def test_compact(self):
+        old = Tombstone.objects.create(
+            owner=self.user, model="training", object_id=1
+        )
+        recent = Tombstone.objects.create(
+            owner=self.user, model="training", object_id=2
+        )
+        Tombstone.objects.filter(pk=old.pk).update(
+            deleted_at=Tombstone.objects.get_horizon()
+            - datetime.timedelta(days=1)
+        )
+        self.assertEqual(Tombstone.objects.compact(), 1)
+        self.assertQuerySetEqual(Tombstone.objects.all(), [recent])
+
+    def test_compact_command(self):
+        Tombstone.objects.create(
+            owner=self.user, model="training", object_id=1
+        )
+        Tombstone.objects.update(deleted_at=CONDUCTED)
+        out = StringIO()
+        call_command("compact_tombstones", stdout=out)
+        self.assertIn("Deleted 1 tombstones", out.getvalue())
+        self.assertFalse(Tombstone.objects.exists())
+
+    def test_delete_template_touches_trainings(self):
+        template = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps"]
+        )
+        training_template = TrainingTemplate.objects.create(
+            name="Push day", owner=self.user
+        )
+        trainings = [
+            Training.objects.create_training(
+                owner=self.user,
+                conducted=CONDUCTED,
+                template=training_template if number else None,
+                exercises_data=(
+                    [
+                        {
+                            "template": template,
+                            "order": 1,
+                            "sets": [{"reps": "5"}],
+                        }
+                    ]
+                    if not number
+                    else None
+                ),
+            )
+            for number in range(2)
+        ]
+        untouched = Training.objects.create_training(
+            owner=self.user, conducted=CONDUCTED
+        )
+        Training.objects.update(edited_at=CONDUCTED)
+
+        Tombstone.objects.delete_object(template)
+        Tombstone.objects.delete_object(training_template)
+
+        self.assertEqual(
+            set(
+                Training.objects.filter(edited_at__gt=CONDUCTED).values_list(
+                    "pk", flat=True
+                )
+            ),
+            {training.pk for training in trainings},
+        )
+        untouched.refresh_from_db()
+        self.assertEqual(untouched.edited_at, CONDUCTED)
+        self.assertEqual(
+            sorted(Tombstone.objects.values_list("model", flat=True)),
+            ["exercisetemplate", "trainingtemplate"],
+        )
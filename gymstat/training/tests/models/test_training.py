@@ -3,7 +3,9 @@ import zoneinfo
 
 from django.contrib.auth import get_user_model
 from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from training.constants import NOTES_FIELDS
 from user.tests import other_user_data, user_data
@@ -704,3 +706,115 @@ class TrainingModelTestCase(TestCase):
         self.assertEqual(second_exercise.order, 2)
         self.assertEqual(second_exercise.units, second_exercise_data["units"])
         self.assertEqual(second_exercise.sets, second_exercise_data["sets"])
+
+    def test_update_training_keeps_unchanged_exercises(self):
+        exercises_data = [
+            {**self.first_exercise_data, "order": order}
+            for order in range(1, 51)
+        ]
+        training = Training.objects.create_training(
+            owner=self.user,
+            conducted=VALID_CONDUCTED,
+            exercises_data=exercises_data,
+        )
+        previous_pks = list(training.exercises.values_list("pk", flat=True))
+        exercises_data[10] = {
+            **exercises_data[10],
+            "sets": [{"reps": "10", "weight": "100"}],
+        }
+        with CaptureQueriesContext(connection) as context:
+            Training.objects.update_training(
+                training=training,
+                owner=self.user,
+                conducted=VALID_CONDUCTED,
+                exercises_data=exercises_data,
+            )
+        exercise_writes = [
+            query["sql"].split(" ", 1)[0]
+            for query in context.captured_queries
+            if '"training_exercise"' in query["sql"]
+            and not query["sql"].startswith("SELECT")
+        ]
+        self.assertEqual(exercise_writes, ["UPDATE"])
+        self.assertEqual(
+            list(training.exercises.values_list("pk", flat=True)),
+            previous_pks,
+        )
+        self.assertEqual(
+            Exercise.objects.get(training=training, order=11).sets,
+            [{"reps": "10", "weight": "100"}],
+        )
+
+    def test_update_training_add_and_remove_exercises(self):
+        training = Training.objects.create_training(
+            owner=self.user,
+            conducted=VALID_CONDUCTED,
+            exercises_data=[
+                self.first_exercise_data,
+                self.second_exercise_data,
+            ],
+        )
+        first_exercise = training.exercises.get(order=1)
+        Training.objects.update_training(
+            training=training,
+            owner=self.user,
+            conducted=VALID_CONDUCTED,
+            exercises_data=[self.first_exercise_data],
+        )
+        self.assertEqual(
+            list(training.exercises.values_list("pk", flat=True)),
+            [first_exercise.pk],
+        )
+        Training.objects.update_training(
+            training=training,
+            owner=self.user,
+            conducted=VALID_CONDUCTED,
+            exercises_data=[
+                self.first_exercise_data,
+                self.second_exercise_data,
+            ],
+        )
+        self.assertEqual(training.exercises.count(), 2)
+        self.assertEqual(training.exercises.first().pk, first_exercise.pk)
+
+    def test_create_training_constant_number_of_queries(self):
+        def count_queries(exercises_count):
+            with CaptureQueriesContext(connection) as context:
+                Training.objects.create_training(
+                    owner=self.user,
+                    conducted=VALID_CONDUCTED,
+                    exercises_data=[
+                        {**self.first_exercise_data, "order": order}
+                        for order in range(1, exercises_count + 1)
+                    ],
+                )
+            return len(context.captured_queries)
+
+        # The first training creates personal records, later ones only read
+        count_queries(1)
+        self.assertEqual(count_queries(2), count_queries(30))
+
+    def test_create_training_exercise_template_by_pk(self):
+        training = Training.objects.create_training(
+            owner=self.user,
+            conducted=VALID_CONDUCTED,
+            exercises_data=[
+                {
+                    **self.first_exercise_data,
+                    "template": self.exercise_template.pk,
+                }
+            ],
+        )
+        self.assertEqual(
+            training.exercises.get().template, self.exercise_template
+        )
+
+    def test_create_training_inactive_exercise_template(self):
+        self.exercise_template.is_active = False
+        self.exercise_template.save()
+        with self.assertRaises(PermissionDenied):
+            Training.objects.create_training(
+                owner=self.user,
+                conducted=VALID_CONDUCTED,
+                exercises_data=[self.first_exercise_data],
+            )
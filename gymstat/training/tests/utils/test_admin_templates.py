@@ -0,0 +1,87 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+from training.tests import CONDUCTED
+from user.tests import admin_user_data, user_data
+
+from ...cache import admin_templates, get_exercise_templates, get_version_key
+from ...models import ExerciseTemplate, Training
+
+User = get_user_model()
+
+
+class AdminTemplatesTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        admin_templates.invalidate()
+        self.user = User.objects.create_user(**user_data)
+        self.admin_user = User.objects.create_user(**admin_user_data)
+        self.run = ExerciseTemplate.objects.create(
+            name="Run",
+            owner=self.admin_user,
+            fields=["distance", "time"],
+            is_admin=True,
+        )
+        self.inactive = ExerciseTemplate.objects.create(
+            name="Walk",
+            owner=self.admin_user,
+            fields=["distance", "time"],
+            is_admin=True,
+            is_active=False,
+        )
+        self.bench = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+
+    def test_snapshot_without_queries(self):
+        self.assertEqual(list(admin_templates.get_by_ids()), [self.run.pk])
+        with self.assertNumQueries(0):
+            self.assertEqual(admin_templates.get_by_names(), {"Run": self.run})
+
+    def test_local_change_reloads(self):
+        admin_templates.get_by_ids()
+        self.run.name = "Running"
+        self.run.save()
+        self.assertEqual(list(admin_templates.get_by_names()), ["Running"])
+
+    def test_other_worker_change_reloads(self):
+        admin_templates.get_by_ids()
+        ExerciseTemplate.objects.filter(pk=self.run.pk).update(is_active=False)
+        # Another worker saved the change and bumped the generation
+        cache.incr(get_version_key())
+        self.assertEqual(len(admin_templates.get_by_ids()), 1)
+        admin_templates.checked_at = 0
+        self.assertEqual(admin_templates.get_by_ids(), {})
+
+    def test_get_exercise_templates(self):
+        admin_templates.get_by_ids()
+        with self.assertNumQueries(1):
+            templates = get_exercise_templates(
+                {self.run.pk, self.inactive.pk, self.bench.pk}
+            )
+        self.assertEqual(
+            templates,
+            {
+                self.run.pk: self.run,
+                self.inactive.pk: self.inactive,
+                self.bench.pk: self.bench,
+            },
+        )
+        with self.assertNumQueries(0):
+            get_exercise_templates({self.run.pk})
+
+    def test_create_training_with_admin_templates(self):
+        training = Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[
+                {
+                    "template": self.run.pk,
+                    "order": 1,
+                    "sets": [{"distance": "5"}],
+                    "units": {"distance": "km"},
+                }
+            ],
+        )
+        self.assertEqual(training.exercises.get().template, self.run)
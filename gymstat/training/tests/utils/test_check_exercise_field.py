@@ -25,6 +25,12 @@ class CheckExerciseFieldTestCase(TestCase):
     def test_int_field_float(self):
         self.do_test("int", "13.204", False)
 
+    def test_int_field_negative(self):
+        self.do_test("int", "-5", False)
+
+    def test_int_field_too_large(self):
+        self.do_test("int", "3000000000", False)
+
     def test_int_field_text(self):
         self.do_test("int", "text", False)
 
@@ -37,6 +43,11 @@ class CheckExerciseFieldTestCase(TestCase):
     def test_float_field_float(self):
         self.do_test("float", "13.204", True)
 
+    def test_float_field_not_finite(self):
+        for value in ("nan", "inf", "-inf", "1e999"):
+            with self.subTest(value=value):
+                self.do_test("float", value, False)
+
     def test_float_field_text(self):
         self.do_test("float", "text", False)
 
@@ -60,3 +71,9 @@ class CheckExerciseFieldTestCase(TestCase):
 
     def test_duration_field_text(self):
         self.do_test("duration", "text", False)
+
+    def test_duration_field_more_than_a_day(self):
+        self.do_test("duration", "26:15:00", True)
+
+    def test_duration_field_too_long(self):
+        self.do_test("duration", "99999999:00:00", False)
@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+from django.core.exceptions import ValidationError
+
+from ...utils import Duration
+
+
+class DurationTestCase(TestCase):
+    def test_parse_hours_minutes_seconds(self):
+        self.assertEqual(Duration.parse("01:20:02"), 4802)
+
+    def test_parse_minutes_seconds(self):
+        self.assertEqual(Duration.parse("01:02"), 62)
+
+    def test_parse_single_digits(self):
+        self.assertEqual(Duration.parse("1:2:3"), 3723)
+
+    def test_parse_more_than_a_day(self):
+        self.assertEqual(Duration.parse("30:00:15"), 108015)
+
+    def test_parse_invalid(self):
+        for value in (
+            "text",
+            "00:60",
+            "01:60:00",
+            "12:30:",
+            "2000-01-01 12:20:30",
+            " 01:02",
+            "",
+        ):
+            with self.subTest(value=value):
+                with self.assertRaises(ValidationError):
+                    Duration.parse(value)
+
+    def test_format(self):
+        self.assertEqual(str(Duration(62)), "00:01:02")
+        self.assertEqual(str(Duration.parse("30:00:15")), "30:00:15")
+
+    def test_is_int(self):
+        self.assertEqual(Duration.parse("01:30") + 30, 120)
@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+from django.core.exceptions import ValidationError
+
+from ...validators import (
+    EXERCISE_SCHEMA,
+    validate_exercise_sets,
+    validate_exercise_units,
+)
+
+
+class ExerciseSchemaTestCase(TestCase):
+    def test_units_compiled_to_frozensets(self):
+        self.assertEqual(EXERCISE_SCHEMA.units["weight"], {"kg", "lbs"})
+        self.assertIsInstance(EXERCISE_SCHEMA.units["weight"], frozenset)
+        self.assertNotIn("reps", EXERCISE_SCHEMA.units)
+
+    def test_valid_sets(self):
+        sets = [
+            {"reps": "8", "weight": "60.5", "rest": "01:30"},
+            {"reps": "5", "notes": "hard", "time": "01:02:03"},
+        ]
+        self.assertEqual(EXERCISE_SCHEMA.get_sets_errors(sets), [])
+        validate_exercise_sets(sets)
+
+    def test_sets_report_all_errors(self):
+        sets = [
+            {"reps": "8.5", "weight": "60"},
+            {"reps": "5", "weight": "heavy"},
+            {"height": "2"},
+            "not a dict",
+        ]
+        errors = EXERCISE_SCHEMA.get_sets_errors(sets)
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(errors[0], "Value '8.5' do not match type 'int'")
+        self.assertEqual(errors[1], "Value 'heavy' do not match type 'float'")
+        with self.assertRaises(ValidationError) as context:
+            validate_exercise_sets(sets)
+        self.assertEqual(context.exception.messages, errors)
+
+    def test_sets_not_list(self):
+        with self.assertRaises(ValidationError):
+            validate_exercise_sets({"reps": "8"})
+
+    def test_valid_units(self):
+        validate_exercise_units({"weight": "lbs", "distance": "km"})
+
+    def test_units_report_all_errors(self):
+        errors = EXERCISE_SCHEMA.get_units_errors(
+            {"weight": "stone", "reps": "kg", "height": "m"}
+        )
+        self.assertEqual(len(errors), 3)
+
+    def test_missing_units(self):
+        self.assertEqual(
+            EXERCISE_SCHEMA.get_missing_units_errors(
+                [{"weight": "60", "distance": "5"}], {"weight": "kg"}
+            ),
+            ["Field distance in 'Sets' must have unit"],
+        )
@@ -0,0 +1,241 @@
+import datetime
+import io
+import json
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from user.tests import admin_user_data, other_user_data, user_data
+
+from ...imports import TrainingImporter, parse_csv_trainings
+from ...models import (
+    Exercise,
+    ExerciseSet,
+    ExerciseStatistic,
+    ExerciseTemplate,
+    PersonalRecord,
+    Training,
+)
+
+User = get_user_model()
+
+
+def make_training_data(day: int, weight: str = "80") -> dict:
+    return {
+        "conducted": f"2025-04-{day:02d}T12:00:00Z",
+        "title": f"Training {day}",
+        "exercises": [
+            {
+                "template": "Bench press",
+                "order": 1,
+                "units": {"weight": "kg"},
+                "sets": [{"reps": "5", "weight": weight}, {"reps": "3"}],
+            },
+            {
+                "template": "Run",
+                "order": 2,
+                "units": {"distance": "km"},
+                "sets": [{"distance": "5", "time": "25:00"}],
+            },
+        ],
+    }
+
+
+class TrainingImporterTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.other_user = User.objects.create_user(**other_user_data)
+        self.admin = User.objects.create_user(**admin_user_data)
+        self.bench = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+        self.admin_bench = ExerciseTemplate.objects.create(
+            name="Bench press",
+            owner=self.admin,
+            is_admin=True,
+            fields=["reps", "weight"],
+        )
+        self.run = ExerciseTemplate.objects.create(
+            name="Run",
+            owner=self.admin,
+            is_admin=True,
+            fields=["distance", "time"],
+        )
+        ExerciseTemplate.objects.create(
+            name="Squat", owner=self.other_user, fields=["reps"]
+        )
+
+    def test_import_trainings(self):
+        result = TrainingImporter(self.user, chunk_size=2).import_trainings(
+            [make_training_data(day) for day in range(1, 4)]
+        )
+        self.assertEqual(result["trainings"], 3)
+        self.assertEqual(result["exercises"], 6)
+        self.assertEqual(result["sets"], 9)
+        self.assertEqual(result["errors"], [])
+        self.assertGreater(result["rows_per_second"], 0)
+
+        trainings = Training.objects.filter(owner=self.user)
+        self.assertEqual(trainings.count(), 3)
+        exercise = Exercise.objects.get(training__title="Training 1", order=1)
+        self.assertEqual(exercise.template, self.bench)
+        self.assertEqual(
+            Exercise.objects.get(
+                training__title="Training 1", order=2
+            ).template,
+            self.run,
+        )
+        self.assertEqual(ExerciseSet.objects.count(), 9)
+
+    def test_number_of_queries_does_not_depend_on_trainings(self):
+        def count_queries(days):
+            with CaptureQueriesContext(connection) as context:
+                TrainingImporter(self.user).import_trainings(
+                    [make_training_data(day) for day in days]
+                )
+            return len(context.captured_queries)
+
+        # Only the first import creates personal records
+        count_queries([1])
+        self.assertEqual(count_queries([2, 3]), count_queries(range(4, 30)))
+
+    def test_import_updates_statistics_and_records(self):
+        TrainingImporter(self.user).import_trainings(
+            [make_training_data(1, "80"), make_training_data(2, "90")]
+        )
+        self.assertEqual(
+            ExerciseStatistic.objects.get(
+                template=self.bench,
+                field="weight",
+                date=datetime.date(2025, 4, 2),
+            ).max,
+            90,
+        )
+        record = PersonalRecord.objects.get(
+            template=self.bench, field="weight", reps=5
+        )
+        self.assertEqual(record.value, 90)
+
+        incremental = sorted(
+            PersonalRecord.objects.values_list(
+                "template", "field", "reps", "value", "achieved"
+            )
+        )
+        PersonalRecord.objects.rebuild(self.user)
+        self.assertEqual(
+            incremental,
+            sorted(
+                PersonalRecord.objects.values_list(
+                    "template", "field", "reps", "value", "achieved"
+                )
+            ),
+        )
+
+    def test_invalid_trainings_are_reported_and_skipped(self):
+        invalid_set = make_training_data(2)
+        invalid_set["exercises"][0]["sets"][0]["weight"] = "heavy"
+        unknown_template = make_training_data(3)
+        unknown_template["exercises"][1]["template"] = "Squat"
+        invalid_date = make_training_data(4)
+        invalid_date["conducted"] = "yesterday"
+        wrong_order = make_training_data(5)
+        wrong_order["exercises"][1]["order"] = 3
+
+        result = TrainingImporter(self.user).import_trainings(
+            [
+                make_training_data(1),
+                invalid_set,
+                unknown_template,
+                invalid_date,
+                wrong_order,
+                "training",
+            ]
+        )
+        self.assertEqual(result["trainings"], 1)
+        self.assertEqual(
+            [error["training"] for error in result["errors"]],
+            [2, 3, 4, 5, 6],
+        )
+        self.assertIn(1, result["errors"][0]["errors"]["exercises"])
+        self.assertIn(
+            "Unknown exercise template 'Squat'",
+            result["errors"][1]["errors"]["exercises"][2],
+        )
+        self.assertIn("conducted", result["errors"][2]["errors"])
+        self.assertEqual(Training.objects.count(), 1)
+
+    def test_template_names_that_are_not_strings(self):
+        unhashable_template = make_training_data(2)
+        unhashable_template["exercises"][0]["template"] = ["Bench press"]
+        missing_template = make_training_data(3)
+        del missing_template["exercises"][1]["template"]
+
+        result = TrainingImporter(self.user).import_trainings(
+            [make_training_data(1), unhashable_template, missing_template]
+        )
+        self.assertEqual(result["trainings"], 1)
+        self.assertIn(
+            "Unknown exercise template '['Bench press']'",
+            result["errors"][0]["errors"]["exercises"][1],
+        )
+        self.assertIn(2, result["errors"][1]["errors"]["exercises"])
+
+    def test_parse_csv_trainings(self):
+        file = io.StringIO(
+            "training,conducted,title,exercise,template_name,order,set,"
+            "reps,weight,weight_unit\n"
+            "7,2025-04-01T12:00:00Z,Push,10,Bench press,1,1,5,80,lbs\n"
+            "7,2025-04-01T12:00:00Z,Push,10,Bench press,1,2,3,,\n"
+            "8,2025-04-02T12:00:00Z,,11,Bench press,1,1,1,100,kg\n"
+        )
+        self.assertEqual(
+            parse_csv_trainings(file),
+            [
+                {
+                    "conducted": "2025-04-01T12:00:00Z",
+                    "title": "Push",
+                    "exercises": [
+                        {
+                            "template": "Bench press",
+                            "order": "1",
+                            "units": {"weight": "lbs"},
+                            "sets": [
+                                {"reps": "5", "weight": "80"},
+                                {"reps": "3"},
+                            ],
+                        }
+                    ],
+                },
+                {
+                    "conducted": "2025-04-02T12:00:00Z",
+                    "title": None,
+                    "exercises": [
+                        {
+                            "template": "Bench press",
+                            "order": "1",
+                            "units": {"weight": "kg"},
+                            "sets": [{"reps": "1", "weight": "100"}],
+                        }
+                    ],
+                },
+            ],
+        )
+
+    def test_import_command(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".json") as file:
+            json.dump([make_training_data(1)], file)
+            file.flush()
+            stdout = io.StringIO()
+            call_command(
+                "import_trainings",
+                user_data["email"],
+                file.name,
+                stdout=stdout,
+            )
+        self.assertIn("Imported 1 trainings", stdout.getvalue())
+        self.assertIn("rows/s", stdout.getvalue())
+        self.assertEqual(Training.objects.filter(owner=self.user).count(), 1)
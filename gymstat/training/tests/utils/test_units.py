@@ -0,0 +1,17 @@
+from unittest import TestCase
+
+from ... import units
+
+
+class UnitsTestCase(TestCase):
+    def test_factor_of_canonical_unit(self):
+        self.assertEqual(units.get_factor("weight", "kg"), 1)
+        self.assertEqual(units.get_factor("distance", "m"), 1)
+        self.assertEqual(units.get_factor("speed", "mps"), 1)
+
+    def test_factor_of_field_without_unit(self):
+        self.assertEqual(units.get_factor("reps", None), 1)
+
+    def test_from_canonical(self):
+        result = units.from_canonical("speed", [10, 1], "kph")
+        self.assertEqual([round(value, 2) for value in result], [36, 3.6])
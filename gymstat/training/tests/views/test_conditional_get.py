@@ -0,0 +1,102 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from training.tests import CONDUCTED
+from user.tests import login_data, other_user_data, user_data
+
+from ...models import ExerciseTemplate, Training
+
+User = get_user_model()
+
+
+class ConditionalGetTestCase(APITestCase):
+    list_url = reverse("training:exercise-template-list-create")
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(**user_data)
+        self.other_user = User.objects.create_user(**other_user_data)
+        self.bench = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+        self.training = Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            title="Push day",
+            exercises_data=[
+                {
+                    "template": self.bench,
+                    "order": 1,
+                    "units": {"weight": "kg"},
+                    "sets": [{"reps": "5", "weight": "80"}],
+                }
+            ],
+        )
+        self.detail_url = reverse(
+            "training:training-detail", kwargs={"pk": self.training.pk}
+        )
+        self.client.login(**login_data)
+
+    def test_training_not_modified(self):
+        response = self.client.get(self.detail_url)
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        with self.assertNumQueries(4):
+            # Session, user, training and its owner; no exercises
+            response = self.client.get(
+                self.detail_url, HTTP_IF_NONE_MATCH=etag
+            )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+    def test_training_modified(self):
+        etag = self.client.get(self.detail_url)["ETag"]
+        Training.objects.update_training(
+            training=self.training,
+            owner=self.user,
+            conducted=CONDUCTED,
+            title="Pull day",
+        )
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["title"], "Pull day")
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_training_modified_since(self):
+        response = self.client.get(self.detail_url)
+        response = self.client.get(
+            self.detail_url,
+            HTTP_IF_MODIFIED_SINCE=response["Last-Modified"],
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_other_user_training(self):
+        etag = self.client.get(self.detail_url)["ETag"]
+        self.client.logout()
+        self.client.login(
+            email=other_user_data["email"],
+            password=other_user_data["password"],
+        )
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 403)
+
+    def test_exercise_templates_not_modified(self):
+        etag = self.client.get(self.list_url)["ETag"]
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        ExerciseTemplate.objects.create(
+            name="Squat", owner=self.user, fields=["reps", "weight"]
+        )
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 2)
+
+    def test_filtered_list_has_own_etag(self):
+        etag = self.client.get(self.list_url)["ETag"]
+        response = self.client.get(
+            self.list_url, {"type": "admin"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
@@ -226,7 +226,7 @@ class ExericseStatisticsAPITestCase(APITestCase):
         )
 
         response = self.client.get(get_url(
-            exercise_template,
+            exercise_template.pk,
             period="day",
             period_quantity=5,
             field="reps",
@@ -266,11 +266,25 @@ class ExericseStatisticsAPITestCase(APITestCase):
                 ]
             }]
         )
+        other_user_exercise_template = ExerciseTemplate.objects.create(
+            name="Bench press",
+            owner=self.other_user,
+            fields=["weight"],
+        )
         create_training(
             self,
             owner=self.other_user,
-            weight=200,
-            conducted=datetime.datetime.now(tz=datetime.timezone.utc)
+            conducted=datetime.datetime.now(tz=datetime.timezone.utc),
+            exercises_data=[{
+                "template": other_user_exercise_template,
+                "order": 1,
+                "units": {"weight": "kg"},
+                "sets": [
+                    {
+                        "weight": "200",
+                    },
+                ]
+            }]
         )
 
         wrong_exercise_template = ExerciseTemplate.objects.create(
@@ -314,7 +328,7 @@ class ExericseStatisticsAPITestCase(APITestCase):
         )
         create_training(
             self,
-            conducted=datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=2),
+            conducted=datetime.datetime.now(tz=datetime.timezone.utc) - datetime.timedelta(days=1),
             exercises_data=[{
                 "template": self.exercise_template,
                 "order": 1,
@@ -348,6 +362,6 @@ class ExericseStatisticsAPITestCase(APITestCase):
         ))
         self.assertEqual(response_lbs.status_code, 200)
         self.assertEqual(response_lbs.data["count"], 2)
-        returned_weights_lbs = {round(float(exercise["weight"])) for exercise in response_lbs.data["results"]}
+        returned_weights_lbs = {round(float(exercise["weight"]), 2) for exercise in response_lbs.data["results"]}
         expected_weights_lbs = {220.46, 176.37}
         self.assertEqual(returned_weights_lbs, expected_weights_lbs)
@@ -1,6 +1,7 @@
 from urllib.parse import urlencode
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework.test import APITestCase
 
@@ -42,6 +43,7 @@ def get_detail_url(pk: int):
 
 class ExericseTemplateAPITestCase(APITestCase):
     def setUp(self):
+        cache.clear()
         self.user = User.objects.create_user(**user_data)
         self.other_user = User.objects.create_user(**other_user_data)
         self.admin_user = User.objects.create_user(**admin_user_data)
@@ -373,6 +375,18 @@ class ExericseTemplateAPITestCase(APITestCase):
         }
         self.assertEqual(returned_ids, expected_ids)
 
+    def test_search_after_edit(self):
+        self.client.patch(
+            get_detail_url(self.leg_exercise.pk),
+            {"description": "Heavy quadriceps builder"},
+        )
+        response = self.client.get(get_list_url(search="quadriceps"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [exercise["id"] for exercise in response.data["results"]],
+            [self.leg_exercise.pk],
+        )
+
     # All filters and search at the same time
     def test_filters_and_search(self):
         exercise_type = "user"
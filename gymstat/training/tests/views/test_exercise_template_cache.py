@@ -0,0 +1,107 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from user.tests import admin_user_data, login_data, other_user_data, user_data
+
+from ...cache import get_exercise_template_list_key
+from ...models import ExerciseTemplate
+
+User = get_user_model()
+
+
+class ExerciseTemplateListCacheTestCase(APITestCase):
+    url = reverse("training:exercise-template-list-create")
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(**user_data)
+        self.other_user = User.objects.create_user(**other_user_data)
+        self.admin_user = User.objects.create_user(**admin_user_data)
+        self.bench = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+        self.run = ExerciseTemplate.objects.create(
+            name="Run",
+            owner=self.admin_user,
+            fields=["distance", "time"],
+            is_admin=True,
+        )
+        self.client.login(**login_data)
+
+    def get_names(self, params=None):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return [template["name"] for template in response.data["results"]]
+
+    def test_cached_response(self):
+        self.assertEqual(self.get_names(), ["Bench press", "Run"])
+        # Only the session and the user are read
+        with self.assertNumQueries(2):
+            self.assertEqual(self.get_names(), ["Bench press", "Run"])
+
+    def test_not_modified_without_queries(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.bench.name = "Incline bench press"
+        self.bench.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_user_change_invalidates(self):
+        self.get_names()
+        self.client.post(
+            self.url, {"name": "Squat", "fields": ["reps"]}, format="json"
+        )
+        self.assertEqual(self.get_names(), ["Bench press", "Run", "Squat"])
+
+    def test_admin_change_invalidates(self):
+        self.get_names()
+        self.run.name = "Running"
+        self.run.save()
+        self.assertEqual(self.get_names(), ["Bench press", "Running"])
+        self.run.delete()
+        self.assertEqual(self.get_names(), ["Bench press"])
+
+    def test_version_bumped_again_on_commit(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.run.name = "Running"
+            self.run.save()
+            # A list read before the change commits is cached under the
+            # bumped version
+            key = get_exercise_template_list_key(self.user, {})
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(get_exercise_template_list_key(self.user, {}), key)
+
+    def test_admin_flag_removed(self):
+        self.assertEqual(self.get_names({"type": "admin"}), ["Run"])
+        self.run.is_admin = False
+        self.run.save()
+        self.assertEqual(self.get_names({"type": "admin"}), [])
+
+    def test_other_user_change_keeps_cache(self):
+        key = get_exercise_template_list_key(self.user, {})
+        self.get_names()
+        ExerciseTemplate.objects.create(
+            name="Row", owner=self.other_user, fields=["reps"]
+        )
+        self.assertEqual(get_exercise_template_list_key(self.user, {}), key)
+
+    def test_admin_list_shared(self):
+        self.assertEqual(
+            get_exercise_template_list_key(self.user, {"type": "admin"}),
+            get_exercise_template_list_key(self.other_user, {"type": "admin"}),
+        )
+        self.assertNotEqual(
+            get_exercise_template_list_key(self.user, {}),
+            get_exercise_template_list_key(self.other_user, {}),
+        )
+
+    def test_params_in_key(self):
+        self.assertEqual(self.get_names({"type": "user"}), ["Bench press"])
+        self.assertEqual(self.get_names({"search": "run"}), ["Run"])
+        self.assertEqual(self.get_names({"tags": "legs"}), [])
@@ -0,0 +1,81 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from user.tests import other_user_data, user_data
+
+from ...models import ExerciseTemplate
+from ...views import ExerciseTemplateListCreateAPIView
+
+User = get_user_model()
+
+
+class ExerciseTemplateFilterIndexTestCase(TestCase):
+    url = "/training/exercises/"
+    size = 100_000
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(**user_data)
+        other_user = User.objects.create_user(**other_user_data)
+        ExerciseTemplate.objects.bulk_create(
+            (
+                ExerciseTemplate(
+                    name=f"Exercise {number}",
+                    owner=cls.user if number % 10 == 0 else other_user,
+                    fields=(
+                        ["reps", "weight"]
+                        if number % 1000
+                        else ["distance", "time"]
+                    ),
+                    tags=(
+                        ["chest", "triceps"]
+                        if number % 1000
+                        else ["cardio", "cycling"]
+                    ),
+                    is_admin=number % 2 == 1,
+                )
+                for number in range(cls.size)
+            ),
+            batch_size=5000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {ExerciseTemplate._meta.db_table}")
+
+    def get_queryset(self, params):
+        request = APIRequestFactory().get(self.url, params)
+        force_authenticate(request, self.user)
+        view = ExerciseTemplateListCreateAPIView()
+        view.setup(request)
+        view.request = view.initialize_request(request)
+        return view.get_queryset()
+
+    def test_tags_use_gin_index(self):
+        queryset = self.get_queryset({"tags": "cardio,cycling"})
+        self.assertIn("exercise_templates_tags", queryset.explain())
+        self.assertEqual(queryset.count(), self.size // 1000)
+
+    def test_fields_use_gin_index(self):
+        queryset = self.get_queryset({"fields": "distance,time"})
+        self.assertIn("exercise_templates_fields", queryset.explain())
+        self.assertEqual(queryset.count(), self.size // 1000)
+
+    def test_single_containment_predicate(self):
+        sql = str(self.get_queryset({"tags": "cardio,cycling"}).query)
+        self.assertEqual(sql.count("@>"), 1)
+
+    def test_search_uses_gin_indexes(self):
+        ExerciseTemplate.objects.create(
+            name="Bench press",
+            owner=self.user,
+            fields=["reps", "weight"],
+            description="Press the bar from the chest",
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {ExerciseTemplate._meta.db_table}")
+        queryset = self.get_queryset({"search": "bench press"})
+        plan = queryset.explain()
+        self.assertIn("et_search_vector", plan)
+        self.assertIn("exercise_templates_name_trgm", plan)
+        self.assertEqual(queryset[0].name, "Bench press")
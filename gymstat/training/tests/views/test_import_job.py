@@ -0,0 +1,64 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from user.tests import login_data, other_user_data, user_data
+
+from ...models import ImportJob
+from ..utils.test_training_import import make_training_data
+
+User = get_user_model()
+
+
+def get_detail_url(pk: int):
+    return reverse("training:import-job-detail", kwargs={"pk": pk})
+
+
+@mock.patch("training.managers.enqueue_import_job")
+class ImportJobAPITestCase(APITestCase):
+    url = reverse("training:import-job-list-create")
+
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.other_user = User.objects.create_user(**other_user_data)
+        self.client.login(**login_data)
+
+    def test_create_job(self, enqueue):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.url, [make_training_data(1), make_training_data(2)]
+            )
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data["status"], "pending")
+        self.assertEqual(response.data["total"], 2)
+        self.assertEqual(response.data["progress"], 0)
+        self.assertNotIn("data", response.data)
+        enqueue.assert_called_once_with(response.data["id"])
+
+    def test_create_job_invalid_body(self, enqueue):
+        response = self.client.post(self.url, {"conducted": "2025-04-01"})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(ImportJob.objects.exists())
+
+    def test_poll_job(self, enqueue):
+        job = ImportJob.objects.create_job(self.user, [make_training_data(1)])
+        ImportJob.objects.run_job(job.pk)
+        response = self.client.get(get_detail_url(job.pk))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["status"], "done")
+        self.assertEqual(response.data["progress"], 100)
+        self.assertEqual(response.data["errors"][0]["training"], 1)
+
+    def test_list_jobs(self, enqueue):
+        ImportJob.objects.create_job(self.user, [])
+        ImportJob.objects.create_job(self.other_user, [])
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 1)
+
+    def test_other_user_job(self, enqueue):
+        job = ImportJob.objects.create_job(self.other_user, [])
+        response = self.client.get(get_detail_url(job.pk))
+        self.assertEqual(response.status_code, 404)
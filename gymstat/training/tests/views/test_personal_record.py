@@ -0,0 +1,87 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from training.tests import CONDUCTED
+from user.tests import login_data, other_user_data, user_data
+
+from ...models import ExerciseTemplate, Training
+
+User = get_user_model()
+
+
+class PersonalRecordListAPIViewTestCase(APITestCase):
+    url = reverse("training:personal-record-list")
+
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.other_user = User.objects.create_user(**other_user_data)
+        self.bench = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+        self.run = ExerciseTemplate.objects.create(
+            name="Run", owner=self.user, fields=["distance", "time"]
+        )
+        Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            exercises_data=[
+                {
+                    "template": self.bench,
+                    "order": 1,
+                    "units": {"weight": "kg"},
+                    "sets": [{"reps": "5", "weight": "82.5"}],
+                },
+                {
+                    "template": self.run,
+                    "order": 2,
+                    "units": {"distance": "km"},
+                    "sets": [{"distance": "5", "time": "25:00"}],
+                },
+            ],
+        )
+        self.client.login(**login_data)
+
+    def test_list_records(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        records = {
+            (record["template"], record["field"], record["reps"]): (
+                record["value"],
+                record["unit"],
+            )
+            for record in response.data
+        }
+        self.assertEqual(
+            records,
+            {
+                (self.bench.pk, "weight", 5): ("82.5", "kg"),
+                (self.bench.pk, "reps", 0): ("5", None),
+                (self.run.pk, "distance", 0): ("5000", "m"),
+            },
+        )
+
+    def test_filter_by_template(self):
+        response = self.client.get(self.url, {"template": self.run.pk})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["field"], "distance")
+
+    def test_invalid_template(self):
+        response = self.client.get(self.url, {"template": "bench"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_records_of_other_user_are_hidden(self):
+        self.client.logout()
+        self.client.login(
+            email=other_user_data["email"],
+            password=other_user_data["password"],
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [])
+
+    def test_unauthenticated(self):
+        self.client.logout()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,193 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from training.tests import CONDUCTED
+from user.tests import admin_user_data, login_data, other_user_data, user_data
+
+from ...models import (
+    ExerciseTemplate,
+    Tombstone,
+    Training,
+    TrainingTemplate,
+)
+
+User = get_user_model()
+
+
+SYNCED = timezone.now() - datetime.timedelta(days=1)
+
+
+class SyncAPIViewTestCase(APITestCase):
+    url = reverse("training:sync")
+
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.other_user = User.objects.create_user(**other_user_data)
+        self.admin = User.objects.create_user(**admin_user_data)
+        self.bench = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+        self.admin_template = ExerciseTemplate.objects.create(
+            name="Squat",
+            owner=self.admin,
+            fields=["reps", "weight"],
+            is_admin=True,
+        )
+        ExerciseTemplate.objects.create(
+            name="Row", owner=self.other_user, fields=["reps", "weight"]
+        )
+        self.training_template = TrainingTemplate.objects.create(
+            name="Push day", owner=self.user
+        )
+        self.training = self.create_training()
+        self.create_training(owner=self.other_user)
+        # Everything above was synced before SYNCED
+        old = SYNCED - datetime.timedelta(days=1)
+        for model in (ExerciseTemplate, TrainingTemplate, Training):
+            model.objects.update(created_at=old, edited_at=old)
+        self.client.login(**login_data)
+
+    def create_training(self, owner=None):
+        owner = owner or self.user
+        return Training.objects.create_training(
+            owner=owner,
+            conducted=CONDUCTED,
+            exercises_data=[
+                {
+                    "template": self.admin_template,
+                    "order": 1,
+                    "units": {"weight": "kg"},
+                    "sets": [{"reps": "5", "weight": "80"}],
+                }
+            ],
+        )
+
+    def sync(self, since=SYNCED):
+        params = {} if since is None else {"since": since.isoformat()}
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def ids(self, changes):
+        return {
+            kind: [item["id"] for item in changes[kind]]
+            for kind in ("created", "updated")
+        }
+
+    def test_full_sync(self):
+        data = self.sync(since=None)
+        self.assertIn("watermark", data)
+        self.assertEqual(
+            self.ids(data["trainings"]),
+            {"created": [self.training.pk], "updated": []},
+        )
+        self.assertEqual(len(data["trainings"]["created"][0]["exercises"]), 1)
+        self.assertEqual(
+            sorted(self.ids(data["exercise_templates"])["created"]),
+            sorted([self.bench.pk, self.admin_template.pk]),
+        )
+        self.assertEqual(
+            self.ids(data["training_templates"])["created"],
+            [self.training_template.pk],
+        )
+
+    def test_nothing_changed(self):
+        data = self.sync()
+        for key in ("trainings", "training_templates", "exercise_templates"):
+            self.assertEqual(
+                data[key], {"created": [], "updated": [], "deleted": []}
+            )
+
+    def test_delta(self):
+        created = self.create_training()
+        self.bench.refresh_from_db()
+        self.bench.name = "Incline bench press"
+        self.bench.save()
+        self.client.delete(
+            reverse(
+                "training:training-detail", kwargs={"pk": self.training.pk}
+            )
+        )
+        self.client.delete(
+            reverse(
+                "training:training-template-detail",
+                kwargs={"pk": self.training_template.pk},
+            )
+        )
+        data = self.sync()
+        self.assertEqual(
+            self.ids(data["trainings"]),
+            {"created": [created.pk], "updated": []},
+        )
+        self.assertEqual(data["trainings"]["deleted"], [self.training.pk])
+        self.assertEqual(
+            self.ids(data["exercise_templates"]),
+            {"created": [], "updated": [self.bench.pk]},
+        )
+        self.assertEqual(
+            data["training_templates"]["deleted"],
+            [self.training_template.pk],
+        )
+
+    def test_admin_template_changes(self):
+        self.admin_template.refresh_from_db()
+        self.admin_template.is_active = False
+        self.admin_template.save()
+        data = self.sync()
+        self.assertEqual(
+            data["exercise_templates"]["deleted"], [self.admin_template.pk]
+        )
+
+    def test_other_user_deletions_hidden(self):
+        self.client.logout()
+        self.client.login(
+            email=other_user_data["email"],
+            password=other_user_data["password"],
+        )
+        training = Training.objects.get(owner=self.other_user)
+        self.client.delete(
+            reverse("training:training-detail", kwargs={"pk": training.pk})
+        )
+        self.client.logout()
+        self.client.login(**login_data)
+        self.assertEqual(self.sync()["trainings"]["deleted"], [])
+
+    def test_full_sync_not_reset(self):
+        self.assertFalse(self.sync(since=None)["reset"])
+        self.assertFalse(self.sync()["reset"])
+
+    def test_compacted_watermark_resets(self):
+        since = Tombstone.objects.get_horizon() - datetime.timedelta(days=1)
+        data = self.sync(since=since)
+        self.assertTrue(data["reset"])
+        self.assertEqual(
+            self.ids(data["trainings"])["created"], [self.training.pk]
+        )
+
+    def test_deleted_template_resyncs_trainings(self):
+        Training.objects.filter(pk=self.training.pk).update(
+            template=self.training_template
+        )
+        self.client.delete(
+            reverse(
+                "training:training-template-detail",
+                kwargs={"pk": self.training_template.pk},
+            )
+        )
+        data = self.sync()
+        self.assertEqual(len(data["trainings"]["updated"]), 1)
+        self.assertIsNone(data["trainings"]["updated"][0]["template"])
+
+    def test_invalid_since(self):
+        response = self.client.get(self.url, {"since": "yesterday"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("since", response.data)
+
+    def test_unauthenticated(self):
+        self.client.logout()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
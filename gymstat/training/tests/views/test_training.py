@@ -1,4 +1,6 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.dateparse import parse_datetime
 from rest_framework.test import APITestCase
@@ -312,3 +314,50 @@ class TrainingAPITestCase(APITestCase):
             get_detail_url(self.training_other_user.pk)
         )
         self.assertEqual(response.status_code, 403)
+
+    def test_write_queries_do_not_grow_with_exercises(self):
+        templates = [
+            ExerciseTemplate.objects.create(
+                name=f"Exercise {index}", owner=self.user, fields=["reps"]
+            )
+            for index in range(5)
+        ]
+
+        def get_data(size):
+            return {
+                "conducted": VALID_CONDUCTED,
+                "exercises": [
+                    {
+                        "template": template.pk,
+                        "order": order,
+                        "sets": [{"reps": "5"}],
+                    }
+                    for order, template in enumerate(
+                        templates[:size], start=1
+                    )
+                ],
+            }
+
+        def count_queries(method, url, size, status_code):
+            with CaptureQueriesContext(connection) as context:
+                response = method(url, get_data(size))
+            self.assertEqual(response.status_code, status_code)
+            return len(context)
+
+        count_queries(self.client.post, get_create_url(), 1, 201)
+        self.assertEqual(
+            count_queries(self.client.post, get_create_url(), 2, 201),
+            count_queries(self.client.post, get_create_url(), 5, 201),
+        )
+        first, second = (
+            Training.objects.create_training(
+                owner=self.user, conducted=VALID_CONDUCTED
+            )
+            for _ in range(2)
+        )
+        self.assertEqual(
+            count_queries(self.client.put, get_detail_url(first.pk), 2, 200),
+            count_queries(
+                self.client.put, get_detail_url(second.pk), 5, 200
+            ),
+        )
@@ -0,0 +1,158 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from user.tests import login_data, other_user_data, user_data
+
+from ...constants import TRAINING_BATCH_MAX_SIZE
+from ...models import (
+    ExerciseSet,
+    ExerciseStatistic,
+    ExerciseTemplate,
+    PersonalRecord,
+    Training,
+)
+
+User = get_user_model()
+
+
+class TrainingBatchCreateAPIViewTestCase(APITestCase):
+    url = reverse("training:training-batch")
+
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.other_user = User.objects.create_user(**other_user_data)
+        self.bench = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+        self.squat = ExerciseTemplate.objects.create(
+            name="Squat", owner=self.user, fields=["reps", "weight"]
+        )
+        self.other_template = ExerciseTemplate.objects.create(
+            name="Row", owner=self.other_user, fields=["reps", "weight"]
+        )
+        self.client.login(**login_data)
+
+    def make_training(self, day, template=None, weight="80"):
+        return {
+            "conducted": f"2025-04-{day:02}T12:00:00Z",
+            "title": f"Day {day}",
+            "exercises": [
+                {
+                    "template": (template or self.bench).pk,
+                    "order": 1,
+                    "units": {"weight": "kg"},
+                    "sets": [{"reps": "5", "weight": weight}],
+                },
+                {
+                    "template": self.squat.pk,
+                    "order": 2,
+                    "units": {"weight": "kg"},
+                    "sets": [{"reps": "5", "weight": "100"}],
+                },
+            ],
+        }
+
+    def test_create_batch(self):
+        response = self.client.post(
+            self.url,
+            [self.make_training(1), self.make_training(2, weight="90")],
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.data[1]["title"], "Day 2")
+        self.assertEqual(len(response.data[1]["exercises"]), 2)
+        self.assertEqual(Training.objects.filter(owner=self.user).count(), 2)
+        self.assertEqual(ExerciseSet.objects.count(), 4)
+        self.assertEqual(ExerciseStatistic.objects.count(), 8)
+        record = PersonalRecord.objects.get(
+            template=self.bench, field="weight", reps=5
+        )
+        self.assertEqual(record.value, 90)
+
+    def test_invalid_item_saves_nothing(self):
+        invalid = self.make_training(2)
+        invalid["exercises"][1]["order"] = 3
+        response = self.client.post(
+            self.url,
+            [
+                self.make_training(1),
+                invalid,
+                {"conducted": "not a date"},
+                self.make_training(4, template=self.other_template),
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        errors = response.data["errors"]
+        self.assertEqual([error["index"] for error in errors], [1, 2, 3])
+        self.assertIn("non_field_errors", errors[0]["errors"])
+        self.assertIn("conducted", errors[1]["errors"])
+        self.assertIn("detail", errors[2]["errors"])
+        self.assertFalse(Training.objects.exists())
+        self.assertFalse(ExerciseStatistic.objects.exists())
+
+    def test_unknown_template(self):
+        training = self.make_training(1)
+        training["exercises"][0]["template"] = 0
+        response = self.client.post(self.url, [training], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("exercises", response.data["errors"][0]["errors"])
+
+    def test_negative_reps(self):
+        training = self.make_training(1)
+        training["exercises"][0]["sets"][0]["reps"] = "-5"
+        response = self.client.post(self.url, [training], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("exercises", response.data["errors"][0]["errors"])
+        self.assertFalse(PersonalRecord.objects.exists())
+
+    def test_values_out_of_column_range(self):
+        training = self.make_training(1)
+        training["exercises"][0]["sets"] = [
+            {"reps": "3000000000", "weight": "80"},
+            {"reps": "5", "weight": "nan"},
+        ]
+        response = self.client.post(self.url, [training], format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(ExerciseSet.objects.exists())
+
+    def test_expects_list(self):
+        response = self.client.post(
+            self.url, self.make_training(1), format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("trainings", response.data)
+
+    def test_batch_size_limit(self):
+        response = self.client.post(
+            self.url,
+            [self.make_training(1)] * (TRAINING_BATCH_MAX_SIZE + 1),
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Training.objects.exists())
+
+    def test_queries_do_not_grow_with_batch(self):
+        def count_queries(size):
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(
+                    self.url,
+                    [self.make_training(day) for day in range(1, size + 1)],
+                    format="json",
+                )
+            self.assertEqual(response.status_code, 201)
+            return len(context)
+
+        count_queries(1)
+        self.assertEqual(count_queries(2), count_queries(10))
+
+    def test_unauthenticated(self):
+        self.client.logout()
+        response = self.client.post(
+            self.url, [self.make_training(1)], format="json"
+        )
+        self.assertEqual(response.status_code, 403)
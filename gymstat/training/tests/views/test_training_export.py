@@ -0,0 +1,130 @@
+import csv
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from training.tests import CONDUCTED, get_streaming_content
+from user.tests import login_data, other_user_data, user_data
+
+from ...export import EXPORT_CSV_COLUMNS
+from ...models import ExerciseTemplate, Training
+
+User = get_user_model()
+
+
+class TrainingExportAPIViewTestCase(APITestCase):
+    url = reverse("training:training-export")
+
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.other_user = User.objects.create_user(**other_user_data)
+        self.bench = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+        self.run = ExerciseTemplate.objects.create(
+            name="Run", owner=self.user, fields=["distance", "time"]
+        )
+        self.training = Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            title="Push day",
+            exercises_data=[
+                {
+                    "template": self.bench,
+                    "order": 1,
+                    "units": {"weight": "lbs"},
+                    "sets": [{"reps": "5", "weight": "80"}, {"reps": "3"}],
+                },
+                {
+                    "template": self.run,
+                    "order": 2,
+                    "units": {"distance": "km"},
+                    "sets": [{"distance": "5", "time": "25:00"}],
+                },
+            ],
+        )
+        other_template = ExerciseTemplate.objects.create(
+            name="Squat", owner=self.other_user, fields=["reps"]
+        )
+        Training.objects.create_training(
+            owner=self.other_user,
+            conducted=CONDUCTED,
+            exercises_data=[
+                {
+                    "template": other_template,
+                    "order": 1,
+                    "units": {},
+                    "sets": [{"reps": "1"}],
+                }
+            ],
+        )
+        self.client.login(**login_data)
+
+    def get_export(self, output):
+        response = self.client.get(self.url, {"output": output})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response["Content-Disposition"],
+            f'attachment; filename="trainings.{output}"',
+        )
+        return get_streaming_content(response).decode()
+
+    def test_csv_export(self):
+        rows = list(csv.DictReader(io.StringIO(self.get_export("csv"))))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(list(rows[0]), EXPORT_CSV_COLUMNS)
+        self.assertEqual(
+            [
+                (row["template_name"], row["set"], row["reps"], row["weight"])
+                for row in rows
+            ],
+            [
+                ("Bench press", "1", "5", "80"),
+                ("Bench press", "2", "3", ""),
+                ("Run", "1", "", ""),
+            ],
+        )
+        self.assertEqual(rows[0]["weight_unit"], "lbs")
+        self.assertEqual(rows[1]["weight_unit"], "")
+        self.assertEqual(rows[2]["distance_unit"], "km")
+        self.assertEqual(rows[2]["time"], "25:00")
+        self.assertEqual(rows[0]["conducted"], "2025-04-01T12:00:00Z")
+        self.assertEqual(rows[0]["training"], str(self.training.pk))
+
+    def test_ndjson_export(self):
+        lines = self.get_export("ndjson").splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(
+            rows[0],
+            {
+                "training": self.training.pk,
+                "conducted": "2025-04-01T12:00:00Z",
+                "title": "Push day",
+                "exercise": self.training.exercises.get(order=1).pk,
+                "template": self.bench.pk,
+                "template_name": "Bench press",
+                "order": 1,
+                "set": 1,
+                "values": {"reps": "5", "weight": "80"},
+                "units": {"weight": "lbs"},
+            },
+        )
+        self.assertEqual(rows[1]["units"], {})
+
+    def test_csv_is_default(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response["Content-Type"], "text/csv")
+
+    def test_invalid_output(self):
+        response = self.client.get(self.url, {"output": "xml"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("output", response.data)
+
+    def test_empty_export(self):
+        Training.objects.filter(owner=self.user).delete()
+        rows = list(csv.reader(io.StringIO(self.get_export("csv"))))
+        self.assertEqual(rows, [EXPORT_CSV_COLUMNS])
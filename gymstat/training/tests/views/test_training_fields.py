@@ -0,0 +1,127 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from training.tests import CONDUCTED
+from user.tests import login_data, user_data
+
+from ...models import ExerciseTemplate, Training
+from ..models.test_training import VALID_NOTES
+
+User = get_user_model()
+
+
+class TrainingListFieldsTestCase(APITestCase):
+    url = reverse("training:training-list-create")
+
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.exercise_template = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+        exercise_data = {
+            "template": self.exercise_template,
+            "units": {"weight": "kg"},
+            "sets": [{"reps": "5", "weight": "80"}],
+        }
+        self.training = Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            title="Push day",
+            notes=VALID_NOTES,
+            exercises_data=[
+                {**exercise_data, "order": 1},
+                {**exercise_data, "order": 2},
+            ],
+        )
+        self.empty_training = Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED - datetime.timedelta(days=1),
+            title="Rest day",
+        )
+        self.client.login(**login_data)
+
+    def get_training_queries(self, params):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, 200)
+        queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if "training_" in query["sql"]
+        ]
+        return response, queries
+
+    def test_full_view_by_default(self):
+        response = self.client.get(self.url)
+        training = response.data["results"][0]
+        self.assertEqual(len(training["exercises"]), 2)
+        self.assertIn("notes", training)
+        self.assertNotIn("exercises_count", training)
+
+    def test_summary_view(self):
+        response, queries = self.get_training_queries(
+            {"view": "summary", "count": "false"}
+        )
+        self.assertEqual(
+            response.data["results"],
+            [
+                {
+                    "id": self.training.pk,
+                    "template": None,
+                    "conducted": "2025-04-01T12:00:00Z",
+                    "title": "Push day",
+                    "exercises_count": 2,
+                },
+                {
+                    "id": self.empty_training.pk,
+                    "template": None,
+                    "conducted": "2025-03-31T12:00:00Z",
+                    "title": "Rest day",
+                    "exercises_count": 0,
+                },
+            ],
+        )
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"training_training"."notes"', queries[0])
+        self.assertNotIn('"training_exercise"."sets"', queries[0])
+
+    def test_sparse_fields(self):
+        response, queries = self.get_training_queries(
+            {"fields": "id,title", "count": "false"}
+        )
+        self.assertEqual(
+            response.data["results"][0],
+            {"id": self.training.pk, "title": "Push day"},
+        )
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"training_training"."description"', queries[0])
+
+    def test_sparse_fields_with_exercises(self):
+        response = self.client.get(self.url, {"fields": "id,exercises"})
+        training = response.data["results"][0]
+        self.assertEqual(set(training), {"id", "exercises"})
+        self.assertEqual(len(training["exercises"]), 2)
+
+    def test_invalid_fields(self):
+        response = self.client.get(self.url, {"fields": "id,password"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("fields", response.data)
+
+    def test_invalid_view(self):
+        response = self.client.get(self.url, {"view": "compact"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("view", response.data)
+
+    def test_create_ignores_fields(self):
+        response = self.client.post(
+            f"{self.url}?view=summary",
+            {"conducted": "2025-04-02T12:00:00Z", "title": "Legs"},
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertIn("exercises", response.data)
+        self.assertNotIn("exercises_count", response.data)
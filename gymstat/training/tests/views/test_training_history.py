@@ -0,0 +1,78 @@
+import datetime
+import json
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from training.tests import CONDUCTED, get_streaming_content
+from user.tests import login_data, other_user_data, user_data
+
+from ...models import ExerciseTemplate, Training
+from ...serializers import TrainingSerializer
+from ..models.test_training import VALID_NOTES
+
+User = get_user_model()
+
+
+class TrainingHistoryAPIViewTestCase(APITestCase):
+    url = reverse("training:training-history")
+
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.other_user = User.objects.create_user(**other_user_data)
+        self.exercise_template = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+        exercise_data = {
+            "template": self.exercise_template,
+            "units": {"weight": "lbs"},
+            "sets": [{"reps": "5", "weight": "80"}, {"reps": "3"}],
+        }
+        Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            title="Push day",
+            description="Heavy",
+            notes=VALID_NOTES,
+            exercises_data=[
+                {**exercise_data, "order": 2},
+                {**exercise_data, "order": 1},
+            ],
+        )
+        Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED
+            + datetime.timedelta(days=1, microseconds=1500),
+        )
+        Training.objects.create_training(
+            owner=self.other_user, conducted=CONDUCTED
+        )
+        self.client.login(**login_data)
+
+    def get_history(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        return json.loads(get_streaming_content(response))
+
+    def test_history_matches_serializer(self):
+        trainings = Training.objects.prefetch_related("exercises").filter(
+            owner=self.user
+        )
+        expected = json.loads(
+            JSONRenderer().render(
+                TrainingSerializer(trainings, many=True).data
+            )
+        )
+        self.assertEqual(self.get_history(), expected)
+
+    def test_empty_history(self):
+        Training.objects.filter(owner=self.user).delete()
+        self.assertEqual(self.get_history(), [])
+
+    def test_unauthenticated(self):
+        self.client.logout()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,113 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from training.tests import CONDUCTED, get_streaming_content
+from user.tests import login_data, user_data
+
+from ...models import ExerciseTemplate, Training
+
+User = get_user_model()
+
+
+class TrainingImportAPIViewTestCase(APITestCase):
+    url = reverse("training:training-import")
+
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.bench = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+        self.run = ExerciseTemplate.objects.create(
+            name="Run", owner=self.user, fields=["distance", "time"]
+        )
+        self.client.login(**login_data)
+
+    def get_history(self):
+        response = self.client.get(reverse("training:training-history"))
+        history = json.loads(get_streaming_content(response))
+        for training in history:
+            del training["id"]
+            for exercise in training["exercises"]:
+                del exercise["id"]
+                del exercise["training"]
+        return history
+
+    def test_import_json(self):
+        response = self.client.post(
+            self.url,
+            [
+                {
+                    "conducted": "2025-04-01T12:00:00Z",
+                    "title": "Push day",
+                    "exercises": [
+                        {
+                            "template": "Bench press",
+                            "order": 1,
+                            "units": {"weight": "kg"},
+                            "sets": [{"reps": "5", "weight": "80"}],
+                        }
+                    ],
+                },
+                {"conducted": "not a date"},
+            ],
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["trainings"], 1)
+        self.assertEqual(response.data["sets"], 1)
+        self.assertEqual(response.data["errors"][0]["training"], 2)
+        training = Training.objects.get(owner=self.user)
+        self.assertEqual(training.exercises.get().template, self.bench)
+
+    def test_csv_export_round_trip(self):
+        Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            title="Push day",
+            exercises_data=[
+                {
+                    "template": self.bench,
+                    "order": 1,
+                    "units": {"weight": "lbs"},
+                    "sets": [{"reps": "5", "weight": "80"}, {"reps": "3"}],
+                },
+                {
+                    "template": self.run,
+                    "order": 2,
+                    "units": {"distance": "km"},
+                    "sets": [{"distance": "5", "time": "25:00"}],
+                },
+            ],
+        )
+        export = self.client.get(
+            reverse("training:training-export"), {"output": "csv"}
+        )
+        content = get_streaming_content(export)
+        history = self.get_history()
+        Training.objects.all().delete()
+
+        response = self.client.post(
+            self.url,
+            {"file": SimpleUploadedFile("trainings.csv", content)},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["errors"], [])
+        self.assertEqual(self.get_history(), history)
+
+    def test_invalid_body(self):
+        response = self.client.post(self.url, {"conducted": "2025-04-01"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("trainings", response.data)
+
+    def test_invalid_csv_file(self):
+        response = self.client.post(
+            self.url,
+            {"file": SimpleUploadedFile("trainings.csv", b"\xff\xfe\x00")},
+            format="multipart",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("file", response.data)
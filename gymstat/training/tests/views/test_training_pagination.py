@@ -0,0 +1,104 @@
+import datetime
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from training.tests import CONDUCTED
+from user.tests import login_data, other_user_data, user_data
+
+from ...models import Training
+from ...pagination import TrainingCursorPagination
+
+User = get_user_model()
+
+
+@mock.patch.object(TrainingCursorPagination, "page_size", 4)
+class TrainingPaginationTestCase(APITestCase):
+    url = reverse("training:training-list-create")
+
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.other_user = User.objects.create_user(**other_user_data)
+        # Pairs of trainings share the conducted time to cover ties
+        Training.objects.bulk_create(
+            Training(
+                owner=self.user,
+                conducted=CONDUCTED - datetime.timedelta(days=number // 2),
+                title=f"Training {number}",
+            )
+            for number in range(10)
+        )
+        Training.objects.create(
+            owner=self.other_user, conducted=CONDUCTED, title="Other"
+        )
+        self.client.login(**login_data)
+
+    def get_all_pages(self, url):
+        titles = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            titles.extend(
+                training["title"] for training in response.data["results"]
+            )
+            url = response.data["next"]
+        return titles
+
+    def test_pages_cover_all_trainings_once(self):
+        titles = self.get_all_pages(self.url)
+        self.assertEqual(len(titles), 10)
+        self.assertEqual(
+            set(titles), {f"Training {number}" for number in range(10)}
+        )
+        days_ago = [int(title.split()[1]) // 2 for title in titles]
+        self.assertEqual(days_ago, sorted(days_ago))
+
+    def test_pages_with_equal_conducted_times(self):
+        Training.objects.filter(owner=self.user).update(conducted=CONDUCTED)
+        titles = self.get_all_pages(self.url)
+        self.assertEqual(
+            titles, [f"Training {number}" for number in reversed(range(10))]
+        )
+
+    def test_count_is_included_by_default(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], 10)
+        self.assertEqual(len(response.data["results"]), 4)
+        self.assertIsNone(response.data["previous"])
+
+    def test_skip_count(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(self.url, {"count": "false"})
+        self.assertNotIn("count", response.data)
+        self.assertEqual(len(response.data["results"]), 4)
+        self.assertFalse(
+            any("COUNT(" in query["sql"] for query in context.captured_queries)
+        )
+
+    def test_next_link_keeps_skipping_count(self):
+        response = self.client.get(self.url, {"count": "false"})
+        response = self.client.get(response.data["next"])
+        self.assertNotIn("count", response.data)
+
+    def test_deep_page_does_not_use_offset_scan(self):
+        url = self.url + "?count=false"
+        for _ in range(2):
+            url = self.client.get(url).data["next"]
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(len(response.data["results"]), 2)
+        training_queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if 'FROM "training_training"' in query["sql"]
+        ]
+        self.assertEqual(len(training_queries), 1)
+        self.assertIn('"training_training"."conducted" <', training_queries[0])
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {"cursor": "invalid"})
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,88 @@
+import datetime
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from training.tests import CONDUCTED
+from user.tests import login_data, user_data
+
+from ...models import ExerciseTemplate, Training
+from ...serializers import TrainingReadSerializer, TrainingSerializer
+from ..models.test_training import VALID_NOTES
+
+User = get_user_model()
+
+
+class TrainingReadSerializerTestCase(APITestCase):
+    list_url = reverse("training:training-list-create")
+
+    def setUp(self):
+        self.user = User.objects.create_user(**user_data)
+        self.exercise_template = ExerciseTemplate.objects.create(
+            name="Bench press", owner=self.user, fields=["reps", "weight"]
+        )
+        self.training = Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED,
+            title="Push day",
+            description="Heavy",
+            notes=VALID_NOTES,
+            exercises_data=[
+                {
+                    "template": self.exercise_template,
+                    "order": 1,
+                    "units": {"weight": "kg"},
+                    "sets": [{"reps": "5", "weight": "80"}],
+                },
+            ],
+        )
+        Training.objects.create_training(
+            owner=self.user,
+            conducted=CONDUCTED + datetime.timedelta(microseconds=1500),
+        )
+        self.client.login(**login_data)
+
+    def get_trainings(self):
+        return Training.objects.prefetch_related("exercises").filter(
+            owner=self.user
+        )
+
+    def assertSameOutput(self, **kwargs):
+        trainings = self.get_trainings()
+        self.assertEqual(
+            TrainingReadSerializer(trainings, many=True, **kwargs).data,
+            TrainingSerializer(trainings, many=True, **kwargs).data,
+        )
+
+    def test_same_output(self):
+        self.assertSameOutput()
+
+    def test_same_output_single(self):
+        training = self.get_trainings().get(pk=self.training.pk)
+        self.assertEqual(
+            TrainingReadSerializer(training).data,
+            TrainingSerializer(training).data,
+        )
+
+    def test_same_output_with_fields(self):
+        self.assertSameOutput(fields=["title", "id", "exercises"])
+
+    def test_same_api_output(self):
+        urls = [
+            self.list_url,
+            f"{self.list_url}?view=summary",
+            f"{self.list_url}?fields=id,notes",
+            reverse(
+                "training:training-detail", kwargs={"pk": self.training.pk}
+            ),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                with override_settings(TRAINING_FAST_READ_SERIALIZERS=True):
+                    fast = self.client.get(url)
+                with override_settings(TRAINING_FAST_READ_SERIALIZERS=False):
+                    default = self.client.get(url)
+                self.assertEqual(fast.status_code, 200)
+                self.assertEqual(fast.content, default.content)
@@ -0,0 +1,20 @@
+from collections.abc import Iterable
+
+from .constants import CANONICAL_UNITS, UNIT_FACTORS
+
+
+def get_factor(field: str, unit: str | None) -> float:
+    """
+    Return the multiplier that converts values of the field given in the
+    unit to the field's canonical unit.
+    """
+    if field not in CANONICAL_UNITS or not unit:
+        return 1
+    return UNIT_FACTORS[unit]
+
+
+def from_canonical(field: str, values: Iterable[float], unit: str | None):
+    factor = get_factor(field, unit)
+    if factor == 1:
+        return list(values)
+    return [value / factor for value in values]
@@ -15,6 +15,21 @@ urlpatterns = [
         views.ExerciseTemplateRetrieveUpdateDestroyAPIView.as_view(),
         name="exercise-template-detail",
     ),
+    path(
+        "exercises/<int:pk>/statistics/",
+        views.ExerciseStatisticListAPIView.as_view(),
+        name="exercise-statistics",
+    ),
+    path(
+        "records/",
+        views.PersonalRecordListAPIView.as_view(),
+        name="personal-record-list",
+    ),
+    path(
+        "sync/",
+        views.SyncAPIView.as_view(),
+        name="sync",
+    ),
     path(
         "trainings/templates/",
         views.TrainingTemplateListCreateAPIView.as_view(),
@@ -30,6 +45,36 @@ urlpatterns = [
         views.TrainingListCreateAPIView.as_view(),
         name="training-list-create",
     ),
+    path(
+        "trainings/batch/",
+        views.TrainingBatchCreateAPIView.as_view(),
+        name="training-batch",
+    ),
+    path(
+        "trainings/history/",
+        views.TrainingHistoryAPIView.as_view(),
+        name="training-history",
+    ),
+    path(
+        "trainings/export/",
+        views.TrainingExportAPIView.as_view(),
+        name="training-export",
+    ),
+    path(
+        "trainings/import/",
+        views.TrainingImportAPIView.as_view(),
+        name="training-import",
+    ),
+    path(
+        "trainings/import/jobs/",
+        views.ImportJobListCreateAPIView.as_view(),
+        name="import-job-list-create",
+    ),
+    path(
+        "trainings/import/jobs/<int:pk>/",
+        views.ImportJobRetrieveAPIView.as_view(),
+        name="import-job-detail",
+    ),
     path(
         "trainings/<int:pk>/",
         views.TrainingRetrieveUpdateDestroyAPIView.as_view(),
@@ -1,8 +1,14 @@
+from __future__ import annotations
+
+import math
+import re
 from datetime import datetime
 from typing import Literal
 
 from django.core.exceptions import ValidationError
 
+from .constants import EXERCISE_VALUE_MAX
+
 
 def check_note_field(field: str, value: str) -> Literal[True]:
     match field:
@@ -27,16 +33,14 @@ def check_note_field(field: str, value: str) -> Literal[True]:
             else:
                 return True
         case "Duration":
-            for fmt in ("%H:%M:%S", "%M:%S"):
-                try:
-                    datetime.strptime(value, fmt)
-                except ValueError:
-                    continue
-                else:
-                    return True
-            raise ValidationError(
-                f"Value '{value}' do not match type '{field}'"
-            )
+            try:
+                Duration.parse(value)
+            except (TypeError, ValidationError):
+                raise ValidationError(
+                    f"Value '{value}' do not match type '{field}'"
+                )
+            else:
+                return True
         case "5stars":
             try:
                 value = int(value)
@@ -70,37 +74,66 @@ def check_note_field(field: str, value: str) -> Literal[True]:
 
 
 def check_exercise_field(field: str, value: str) -> Literal[True]:
-    match field:
-        case "text":
-            return True
-        case "int":
-            try:
-                int(value)
-            except ValueError:
-                raise ValidationError(
-                    f"Value '{value}' do not match type '{field}'"
-                )
-            else:
-                return True
-        case "float":
-            try:
-                float(value)
-            except ValueError:
-                raise ValidationError(
-                    f"Value '{value}' do not match type '{field}'"
-                )
-            else:
-                return True
-        case "duration":
-            for fmt in ("%H:%M:%S", "%M:%S"):
-                try:
-                    datetime.strptime(value, fmt)
-                except ValueError:
-                    continue
-                else:
-                    return True
+    parser = EXERCISE_FIELD_PARSERS.get(field)
+    if parser is None:
+        raise ValidationError(f"Got unexpected field type '{field}'")
+    try:
+        parser(value)
+    except (TypeError, ValueError, ValidationError):
+        raise ValidationError(f"Value '{value}' do not match type '{field}'")
+    return True
+
+
+class Duration(int):
+    """
+    Duration in whole seconds.
+
+    Parsed from 'H:MM:SS' or 'MM:SS'. Hours are not limited to a day,
+    so '26:15:00' is a valid duration.
+    """
+
+    _pattern = re.compile(r"(?:([0-9]+):)?([0-5]?[0-9]):([0-5]?[0-9])")
+
+    @classmethod
+    def parse(cls, value: str) -> Duration:
+        if isinstance(value, Duration):
+            return value
+        match = cls._pattern.fullmatch(value)
+        if match is None:
             raise ValidationError(
-                f"Value '{value}' do not match type '{field}'"
+                f"Value '{value}' do not match type 'duration'"
             )
-        case _:
-            raise ValidationError(f"Got unexpected field type '{field}'")
+        hours, minutes, seconds = match.groups()
+        total = int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+        if total > EXERCISE_VALUE_MAX:
+            raise ValidationError(f"Duration '{value}' is too long")
+        return cls(total)
+
+    def __str__(self):
+        hours, remainder = divmod(int(self), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{hours:02}:{minutes:02}:{seconds:02}"
+
+
+def parse_count(value) -> int:
+    """Parse a whole non-negative number such as reps or rounds."""
+    number = int(value)
+    if not 0 <= number <= EXERCISE_VALUE_MAX:
+        raise ValueError(f"Value '{value}' is out of range")
+    return number
+
+
+def parse_measure(value) -> float:
+    """Parse a finite float such as weight or distance."""
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"Value '{value}' must be a finite number")
+    return number
+
+
+EXERCISE_FIELD_PARSERS = {
+    "text": str,
+    "int": parse_count,
+    "float": parse_measure,
+    "duration": Duration.parse,
+}
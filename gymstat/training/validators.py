@@ -6,7 +6,111 @@ from training.constants import (
     NOTES_FIELDS,
 )
 
-from .utils import check_exercise_field, check_note_field
+from .utils import EXERCISE_FIELD_PARSERS, check_note_field
+
+
+class ExerciseSchema:
+    """
+    Lookup tables compiled once from ALLOWED_EXERCISE_FIELDS, so exercise
+    sets and units are validated without re-resolving field definitions
+    for every value.
+    """
+
+    def __init__(self, allowed_fields: dict):
+        self.field_types = {}
+        self.parsers = {}
+        self.units = {}
+        for field, definition in allowed_fields.items():
+            if isinstance(definition, list):
+                field_type, units = definition
+                self.units[field] = frozenset(units)
+            else:
+                field_type = definition
+            self.field_types[field] = field_type
+            self.parsers[field] = EXERCISE_FIELD_PARSERS[field_type]
+        self.allowed_fields_message = ", ".join(allowed_fields)
+
+    def get_value_error(self, field: str, value) -> str | None:
+        parser = self.parsers.get(field)
+        if parser is None:
+            return (
+                f"Got unexpected field {field} in 'Sets'. "
+                f"Allowed fields: {self.allowed_fields_message}"
+            )
+        try:
+            parser(value)
+        except (TypeError, ValueError, ValidationError):
+            return (
+                f"Value '{value}' do not match type "
+                f"'{self.field_types[field]}'"
+            )
+        return None
+
+    def get_sets_errors(self, sets) -> list[str]:
+        if not sets:
+            return []
+        if not isinstance(sets, list):
+            return ["'Sets' field must be a list"]
+        errors = []
+        parsers = self.parsers
+        for exercise in sets:
+            if not isinstance(exercise, dict):
+                errors.append("Exercise inside of 'Sets' list must be a dict")
+                continue
+            for field, value in exercise.items():
+                # Fast path: a valid value only costs one parser call
+                parser = parsers.get(field)
+                if parser is not None:
+                    try:
+                        parser(value)
+                        continue
+                    except (TypeError, ValueError, ValidationError):
+                        pass
+                errors.append(self.get_value_error(field, value))
+        return errors
+
+    def get_units_errors(self, units) -> list[str]:
+        if not units:
+            return []
+        if not isinstance(units, dict):
+            return ["'Units' field must be a dict"]
+        errors = []
+        for key, value in units.items():
+            if key not in self.field_types:
+                errors.append(
+                    f"Got unexpected field {key} in 'Unit'. "
+                    f"Allowed fields: {self.allowed_fields_message}"
+                )
+            elif key not in self.units:
+                errors.append(
+                    f"Field {key} don't require unit. Don't put it in 'Unit'"
+                )
+            elif value not in self.units[key]:
+                allowed_units = ", ".join(ALLOWED_EXERCISE_FIELDS[key][1])
+                errors.append(
+                    f"Unit {value} not supported in {key} field. "
+                    f"Allowed units for {key} field: {allowed_units}"
+                )
+        return errors
+
+    def get_missing_units_errors(self, sets, units) -> list[str]:
+        if not isinstance(sets, list):
+            return []
+        units = units if isinstance(units, dict) else {}
+        missing = {
+            field
+            for exercise in sets
+            if isinstance(exercise, dict)
+            for field in exercise
+            if field in self.units and field not in units
+        }
+        return [
+            f"Field {field} in 'Sets' must have unit"
+            for field in sorted(missing)
+        ]
+
+
+EXERCISE_SCHEMA = ExerciseSchema(ALLOWED_EXERCISE_FIELDS)
 
 
 def _validate_json_list(
@@ -104,8 +208,7 @@ def validate_training_template_data(data):
                             "Set dictionaries must not be empty."
                         )
                     for field, value in s.items():
-                        allowed = ALLOWED_EXERCISE_FIELDS.get(field)
-                        if allowed is None:
+                        if field not in EXERCISE_SCHEMA.field_types:
                             raise ValidationError(
                                 f"Field '{field}' is not allowed."
                             )
@@ -114,21 +217,18 @@ def validate_training_template_data(data):
                             continue  # Empty string allowed
 
                         # Validate field types and units
-                        expected_type = (
-                            allowed if isinstance(allowed, str) else allowed[0]
-                        )
-                        allowed_units = (
-                            allowed[1] if isinstance(allowed, list) else None
-                        )
-
-                        check_exercise_field(expected_type, value)
+                        error = EXERCISE_SCHEMA.get_value_error(field, value)
+                        if error:
+                            raise ValidationError(error)
 
                         # Validate units if applicable
+                        allowed_units = EXERCISE_SCHEMA.units.get(field)
                         if allowed_units:
                             unit_value = unit_dict.get(field)
                             if unit_value not in allowed_units:
                                 raise ValidationError(
-                                    f"Field '{field}' must have unit from {allowed_units}."
+                                    f"Field '{field}' must have unit from "
+                                    f"{ALLOWED_EXERCISE_FIELDS[field][1]}."
                                 )
 
 
@@ -188,43 +288,12 @@ def validate_exercise_template_tags(value):
 
 
 def validate_exercise_units(units):
-    if not units:
-        return
-    if not isinstance(units, dict):
-        raise ValidationError("'Units' field must be a dict")
-    for key, value in units.items():
-        if key not in ALLOWED_EXERCISE_FIELDS:
-            raise ValidationError(
-                f"Got unexpected field {key} in 'Unit'. Allowed fields: {', '.join(ALLOWED_EXERCISE_FIELDS)}"
-            )
-        field_type = ALLOWED_EXERCISE_FIELDS[key]
-        if isinstance(field_type, str):
-            raise ValidationError(
-                f"Field {key} don't require unit. Don't put it in 'Unit'"
-            )
-        _, allowed_units = field_type
-        if value not in allowed_units:
-            raise ValidationError(
-                f"Unit {value} not supported in {key} field. Allowed units for {key} field: {', '.join(allowed_units)}"
-            )
+    errors = EXERCISE_SCHEMA.get_units_errors(units)
+    if errors:
+        raise ValidationError(errors)
 
 
 def validate_exercise_sets(sets):
-    if not sets:
-        return
-    if not isinstance(sets, list):
-        raise ValidationError("'Sets' field must be a list")
-    for exercise in sets:
-        if not isinstance(exercise, dict):
-            raise ValidationError(
-                "Exercise inside of 'Sets' list must be a dict"
-            )
-        for field, value in exercise.items():
-            if field not in ALLOWED_EXERCISE_FIELDS:
-                raise ValidationError(
-                    f"Got unexpected field {field} in 'Sets'. Allowed fields: {', '.join(ALLOWED_EXERCISE_FIELDS)}"
-                )
-            field_type = ALLOWED_EXERCISE_FIELDS[field]
-            if isinstance(field_type, list):
-                field_type = field_type[0]
-            check_exercise_field(field_type, value)
+    errors = EXERCISE_SCHEMA.get_sets_errors(sets)
+    if errors:
+        raise ValidationError(errors)
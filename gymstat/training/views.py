@@ -1,25 +1,94 @@
+import csv
+from collections.abc import Iterable, Iterator
+from functools import cached_property
+
+from django.conf import settings
 from django.contrib.postgres.search import (
     SearchQuery,
     SearchRank,
-    SearchVector,
     TrigramSimilarity,
 )
-from django.db.models import Q
-from rest_framework import generics
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import (
+    Count,
+    F,
+    OuterRef,
+    Q,
+    Subquery,
+    prefetch_related_objects,
+)
+from django.db.models.functions import Coalesce
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from rest_framework import generics, status
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from gymstat.mixins import ConditionalGetMixin, make_etag
 
 # from .filters import ExerciseTemplateFilter
-from .models import ExerciseTemplate, Training, TrainingTemplate
+from .cache import (
+    EXERCISE_TEMPLATES_CACHE_TIMEOUT,
+    get_exercise_template_list_key,
+    get_exercise_templates,
+)
+from .constants import (
+    ALLOWED_EXERCISE_FIELDS,
+    CANONICAL_UNITS,
+    STATISTICS_AGGREGATES,
+    STATISTICS_PERIODS,
+    TRAINING_BATCH_MAX_SIZE,
+    TRAINING_SUMMARY_FIELDS,
+)
+from .export import (
+    EXPORT_CONTENT_TYPES,
+    EXPORT_FORMATS,
+    EXPORT_RENDERERS,
+    iter_set_rows,
+)
+from .imports import TrainingImporter, parse_csv_bytes
+from .models import (
+    Exercise,
+    ExerciseStatistic,
+    ExerciseTemplate,
+    ImportJob,
+    PersonalRecord,
+    Tombstone,
+    Training,
+    TrainingTemplate,
+)
+from .pagination import TrainingCursorPagination
 from .permissions import IsAdminObjectReadOnly, IsOwner
 from .serializers import (
+    DATETIME_FIELD,
+    ExerciseStatisticSerializer,
     ExerciseTemplateSerializer,
+    ImportJobSerializer,
+    PersonalRecordSerializer,
+    TrainingReadSerializer,
     TrainingSerializer,
     TrainingTemplateSerializer,
 )
+from .statistics import get_period_start, is_statistic_field
+from .sync import get_changes
+
+TRAINING_COLUMNS = {field.name for field in Training._meta.concrete_fields}
+
 
+class TombstoneDestroyMixin:
+    """Log deletions, so clients learn about them on the next sync."""
 
-class ExerciseTemplateListCreateAPIView(generics.ListCreateAPIView):
+    def perform_destroy(self, instance):
+        Tombstone.objects.delete_object(instance)
+
+
+class ExerciseTemplateListCreateAPIView(
+    ConditionalGetMixin, generics.ListCreateAPIView
+):
     serializer_class = ExerciseTemplateSerializer
     permission_classes = [IsAuthenticated]
     # filter_class = ExerciseTemplateFilter
@@ -54,38 +123,163 @@ class ExerciseTemplateListCreateAPIView(generics.ListCreateAPIView):
                     }
                 )
 
-        for tag in tags:
-            queryset = queryset.filter(tags__contains=tag)
-        for field in fields:
-            queryset = queryset.filter(fields__contains=field)
+        # One jsonb '@>' containment per column, served by the GIN indexes
+        if tags:
+            queryset = queryset.filter(tags__contains=tags)
+        if fields:
+            queryset = queryset.filter(fields__contains=fields)
 
         if search_query:
-            vector = SearchVector("name", weight="A") + SearchVector(
-                "description", weight="B"
-            )
-            query = SearchQuery(search_query)
-            queryset = queryset.annotate(rank=SearchRank(vector, query))
-            queryset = queryset.annotate(
-                similary=TrigramSimilarity("name", search_query)
+            # Matches come from the GIN indexes on the stored vector and on
+            # name trigrams; ranks are computed for the matches only
+            query = SearchQuery(search_query, config="english")
+            queryset = (
+                queryset.filter(
+                    Q(search_vector=query)
+                    | Q(name__trigram_similar=search_query)
+                )
+                .annotate(
+                    rank=SearchRank(F("search_vector"), query),
+                    similarity=TrigramSimilarity("name", search_query),
+                )
+                .order_by("-rank", "-similarity", "name")
             )
-            queryset = queryset.filter(
-                Q(rank__gt=0) | Q(similary__gt=0)
-            ).order_by("-rank", "-similary", "name")
 
         return queryset
 
+    @cached_property
+    def list_cache_key(self):
+        return get_exercise_template_list_key(
+            self.request.user, self.request.query_params
+        )
+
+    def get_validators(self):
+        # The key holds the versions of every template that can be listed,
+        # so a 304 is answered without querying templates
+        return make_etag(self.list_cache_key), None
+
+    def list(self, request, *args, **kwargs):
+        data = cache.get(self.list_cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(
+                self.list_cache_key, data, EXERCISE_TEMPLATES_CACHE_TIMEOUT
+            )
+        return Response(data)
+
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
 
 
 class ExerciseTemplateRetrieveUpdateDestroyAPIView(
-    generics.RetrieveUpdateDestroyAPIView
+    TombstoneDestroyMixin, generics.RetrieveUpdateDestroyAPIView
 ):
     serializer_class = ExerciseTemplateSerializer
     permission_classes = [IsAuthenticated, IsOwner | IsAdminObjectReadOnly]
     queryset = ExerciseTemplate.objects.filter(is_active=True)
 
 
+class ExerciseStatisticListAPIView(generics.ListAPIView):
+    serializer_class = ExerciseStatisticSerializer
+    permission_classes = [IsAuthenticated]
+
+    @cached_property
+    def statistic_params(self):
+        period = self.request.query_params.get("period", "")
+        _period_quantity = self.request.query_params.get("period_quantity", "")
+        field = self.request.query_params.get("field", "")
+        unit = self.request.query_params.get("unit")
+        aggregate = self.request.query_params.get("aggregate", "max")
+
+        if period not in STATISTICS_PERIODS:
+            raise ValidationError(
+                {
+                    "period": f"Invalid period {period}. "
+                    f"Allowed only {', '.join(STATISTICS_PERIODS)}"
+                }
+            )
+        try:
+            period_quantity = int(_period_quantity)
+        except ValueError:
+            period_quantity = 0
+        if period_quantity < 1:
+            raise ValidationError(
+                {"period_quantity": "Must be a positive integer."}
+            )
+        if not is_statistic_field(field):
+            raise ValidationError(
+                {"field": f"Statistics are not available for field {field}."}
+            )
+        if aggregate not in STATISTICS_AGGREGATES:
+            raise ValidationError(
+                {
+                    "aggregate": f"Invalid aggregate {aggregate}. "
+                    f"Allowed only {', '.join(STATISTICS_AGGREGATES)}"
+                }
+            )
+        if field in CANONICAL_UNITS:
+            allowed_units = ALLOWED_EXERCISE_FIELDS[field][1]
+            unit = unit or CANONICAL_UNITS[field]
+            if unit not in allowed_units:
+                raise ValidationError(
+                    {
+                        "unit": f"Unit {unit} not supported in {field} field. "
+                        f"Allowed units: {', '.join(allowed_units)}"
+                    }
+                )
+        elif unit:
+            raise ValidationError({"unit": f"Field {field} has no unit."})
+
+        return {
+            "period": period,
+            "period_quantity": period_quantity,
+            "field": field,
+            "unit": unit,
+            "aggregate": aggregate,
+        }
+
+    def get_queryset(self):
+        user = self.request.user
+        template = get_object_or_404(
+            ExerciseTemplate.objects.filter(Q(owner=user) | Q(is_admin=True)),
+            pk=self.kwargs["pk"],
+        )
+        params = self.statistic_params
+        start = get_period_start(
+            timezone.localdate(), params["period"], params["period_quantity"]
+        )
+        return ExerciseStatistic.objects.filter(
+            owner=user,
+            template=template,
+            field=params["field"],
+            date__gt=start,
+        )
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        params = self.statistic_params
+        context["field"] = params["field"]
+        context["unit"] = params["unit"]
+        context["aggregate"] = params["aggregate"]
+        return context
+
+
+class PersonalRecordListAPIView(generics.ListAPIView):
+    serializer_class = PersonalRecordSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = None
+
+    def get_queryset(self):
+        queryset = PersonalRecord.objects.filter(owner=self.request.user)
+        template = self.request.query_params.get("template")
+        if template:
+            try:
+                queryset = queryset.filter(template=int(template))
+            except ValueError:
+                raise ValidationError({"template": "Must be an integer."})
+        return queryset
+
+
 class TrainingTemplateListCreateAPIView(generics.ListCreateAPIView):
     serializer_class = TrainingTemplateSerializer
     permission_classes = [IsAuthenticated]
@@ -98,32 +292,370 @@ class TrainingTemplateListCreateAPIView(generics.ListCreateAPIView):
 
 
 class TrainingTemplateRetrieveUpdateDestroyAPIView(
-    generics.RetrieveUpdateDestroyAPIView
+    TombstoneDestroyMixin, generics.RetrieveUpdateDestroyAPIView
 ):
     serializer_class = TrainingTemplateSerializer
     permission_classes = [IsAuthenticated, IsOwner]
     queryset = TrainingTemplate.objects.all()
 
 
-class TrainingListCreateAPIView(generics.ListCreateAPIView):
+class TrainingReadSerializerMixin:
+    """
+    Serve GET requests with TrainingReadSerializer when enabled. Schema
+    generation keeps TrainingSerializer, which describes the same output.
+    """
+
+    def get_serializer_class(self):
+        if (
+            self.request.method == "GET"
+            and settings.TRAINING_FAST_READ_SERIALIZERS
+            and not getattr(self, "swagger_fake_view", False)
+        ):
+            return TrainingReadSerializer
+        return super().get_serializer_class()
+
+
+class ExerciseTemplatesContextMixin:
+    """
+    Fetch the exercise templates referenced by a written training with one
+    query and pass them to the serializer, so validating and saving it
+    takes the same number of queries for any number of exercises.
+    """
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.request.method in ("POST", "PUT", "PATCH"):
+            context["exercise_templates"] = get_exercise_templates(
+                get_exercise_template_ids([self.request.data])
+            )
+        return context
+
+
+class TrainingListCreateAPIView(
+    ExerciseTemplatesContextMixin,
+    TrainingReadSerializerMixin,
+    generics.ListCreateAPIView,
+):
     serializer_class = TrainingSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = TrainingCursorPagination
+
+    @cached_property
+    def requested_fields(self) -> list[str] | None:
+        view = self.request.query_params.get("view", "full")
+        _fields = self.request.query_params.get("fields", "")
+
+        if view not in ("full", "summary"):
+            raise ValidationError(
+                {"view": f"Invalid view {view}. Allowed only full, summary"}
+            )
+        if view == "summary":
+            return TRAINING_SUMMARY_FIELDS
+        if not _fields:
+            return None
+
+        fields = _fields.split(",")
+        allowed_fields = TrainingSerializer.Meta.fields
+        invalid_fields = [
+            field for field in fields if field not in allowed_fields
+        ]
+        if invalid_fields:
+            raise ValidationError(
+                {
+                    "fields": f"Invalid fields {', '.join(invalid_fields)}. "
+                    f"Allowed only {', '.join(allowed_fields)}"
+                }
+            )
+        return fields
 
     def get_queryset(self):
-        return Training.objects.prefetch_related("exercises").filter(
-            owner=self.request.user
+        queryset = Training.objects.filter(owner=self.request.user)
+        fields = (
+            self.requested_fields if self.request.method == "GET" else None
         )
+        if fields is None:
+            return queryset.prefetch_related("exercises")
+
+        # Only read the requested columns; 'conducted' is the cursor key
+        columns = {"conducted"} | {
+            field for field in fields if field in TRAINING_COLUMNS
+        }
+        queryset = queryset.only(*columns)
+        if "exercises" in fields:
+            queryset = queryset.prefetch_related("exercises")
+        if "exercises_count" in fields:
+            queryset = queryset.annotate(
+                exercises_count=Coalesce(
+                    Subquery(
+                        Exercise.objects.filter(training=OuterRef("pk"))
+                        .order_by()
+                        .values("training")
+                        .annotate(count=Count("pk"))
+                        .values("count")
+                    ),
+                    0,
+                )
+            )
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        if self.request.method == "GET":
+            kwargs.setdefault("fields", self.requested_fields)
+        return super().get_serializer(*args, **kwargs)
 
     def perform_create(self, serializer):
         serializer.save(owner=self.request.user)
 
 
+class TrainingBatchCreateAPIView(generics.GenericAPIView):
+    """
+    Creates a list of trainings at once. Exercise templates of all trainings
+    are fetched with one query and the trainings are written in a single
+    transaction. If any training is invalid nothing is saved and the
+    errors of every invalid training are returned with its index.
+    """
+
+    serializer_class = TrainingSerializer
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        trainings_data = request.data
+        if not isinstance(trainings_data, list):
+            raise ValidationError(
+                {"trainings": "Expected a list of trainings."}
+            )
+        if len(trainings_data) > TRAINING_BATCH_MAX_SIZE:
+            raise ValidationError(
+                {
+                    "trainings": f"Expected at most "
+                    f"{TRAINING_BATCH_MAX_SIZE} trainings."
+                }
+            )
+
+        context = self.get_serializer_context()
+        context["exercise_templates"] = get_exercise_templates(
+            get_exercise_template_ids(trainings_data)
+        )
+        trainings_exercises = []
+        errors = []
+        for index, training_data in enumerate(trainings_data):
+            serializer = self.get_serializer(
+                data=training_data, context=context
+            )
+            if not serializer.is_valid():
+                errors.append({"index": index, "errors": serializer.errors})
+                continue
+            data = serializer.validated_data
+            try:
+                trainings_exercises.append(
+                    Training.objects.build_training(
+                        owner=request.user,
+                        conducted=data.get("conducted"),
+                        template=data.get("template"),
+                        title=data.get("title"),
+                        description=data.get("description"),
+                        notes=data.get("notes"),
+                        exercises_data=data.get("exercises"),
+                        exercise_templates=context["exercise_templates"],
+                    )
+                )
+            except DjangoValidationError as exc:
+                if hasattr(exc, "error_dict"):
+                    item_errors = exc.message_dict
+                else:
+                    item_errors = {"non_field_errors": exc.messages}
+                errors.append({"index": index, "errors": item_errors})
+            except PermissionDenied as exc:
+                errors.append({"index": index, "errors": {"detail": str(exc)}})
+        if errors:
+            return Response(
+                {"errors": errors},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        trainings = Training.objects.bulk_create_trainings(
+            request.user, trainings_exercises
+        )
+        prefetch_related_objects(trainings, "exercises")
+        serializer = self.get_serializer(trainings, many=True)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+def get_exercise_template_ids(trainings_data: list) -> set[int]:
+    """Collect exercise template ids referenced in raw trainings data."""
+    template_ids = set()
+    for training_data in trainings_data:
+        if not isinstance(training_data, dict):
+            continue
+        exercises_data = training_data.get("exercises")
+        if not isinstance(exercises_data, list):
+            continue
+        for exercise_data in exercises_data:
+            if not isinstance(exercise_data, dict):
+                continue
+            try:
+                template_ids.add(int(exercise_data.get("template")))
+            except (TypeError, ValueError):
+                pass
+    return template_ids
+
+
+class TrainingHistoryAPIView(generics.GenericAPIView):
+    """
+    Streams all trainings of the user as one JSON array rendered by
+    PostgreSQL in the shape of the trainings list results.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        rows = Training.objects.iter_history_json(request.user)
+        return StreamingHttpResponse(
+            stream_json_array(rows), content_type="application/json"
+        )
+
+
+def stream_json_array(rows: Iterable[str]) -> Iterator[str]:
+    yield "["
+    for number, row in enumerate(rows):
+        yield row if number == 0 else "," + row
+    yield "]"
+
+
+class TrainingExportAPIView(generics.GenericAPIView):
+    """
+    Streams one row per set of all trainings of the user as CSV or NDJSON,
+    selected by the 'output' query parameter.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        output = request.query_params.get("output", "csv")
+        if output not in EXPORT_FORMATS:
+            raise ValidationError(
+                {
+                    "output": f"Invalid output {output}. "
+                    f"Allowed only {', '.join(EXPORT_FORMATS)}"
+                }
+            )
+        rows = iter_set_rows(request.user)
+        response = StreamingHttpResponse(
+            EXPORT_RENDERERS[output](rows),
+            content_type=EXPORT_CONTENT_TYPES[output],
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="trainings.{output}"'
+        )
+        return response
+
+
+def get_import_data(request) -> list:
+    """
+    Return trainings data of an import request, given either as a JSON
+    list or as a CSV export uploaded in 'file'.
+    """
+    upload = request.FILES.get("file")
+    if upload is not None:
+        try:
+            trainings_data = parse_csv_bytes(upload.read())
+        except (UnicodeDecodeError, csv.Error) as exc:
+            raise ValidationError({"file": f"Invalid CSV file: {exc}"})
+    else:
+        trainings_data = request.data
+    if not isinstance(trainings_data, list):
+        raise ValidationError(
+            {"trainings": "Expected a list of trainings or a CSV file."}
+        )
+    return trainings_data
+
+
+class TrainingImportAPIView(generics.GenericAPIView):
+    """Imports trainings with exercise templates referenced by name."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, *args, **kwargs):
+        result = TrainingImporter(request.user).import_trainings(
+            get_import_data(request)
+        )
+        return Response(result)
+
+
+class ImportJobListCreateAPIView(generics.ListCreateAPIView):
+    """
+    Queues imports for the background worker. The data is accepted in the
+    same formats as by the synchronous import.
+    """
+
+    serializer_class = ImportJobSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return ImportJob.objects.filter(owner=self.request.user).defer("data")
+
+    def create(self, request, *args, **kwargs):
+        job = ImportJob.objects.create_job(
+            request.user, get_import_data(request)
+        )
+        serializer = self.get_serializer(job)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+class ImportJobRetrieveAPIView(generics.RetrieveAPIView):
+    serializer_class = ImportJobSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        return ImportJob.objects.filter(owner=self.request.user).defer("data")
+
+
+class SyncAPIView(generics.GenericAPIView):
+    """
+    Returns trainings, training templates and exercise templates created,
+    updated or deleted since the 'since' watermark of the previous sync,
+    and the watermark to send next time. Without 'since' everything is
+    returned as created. When deletions after 'since' may already be
+    compacted, everything is returned with 'reset' set and clients have
+    to drop their local copies.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        since = request.query_params.get("since")
+        if since is not None:
+            try:
+                since = DATETIME_FIELD.to_internal_value(since)
+            except ValidationError as exc:
+                raise ValidationError({"since": exc.detail})
+        reset = since is not None and since < Tombstone.objects.get_horizon()
+        if reset:
+            since = None
+        watermark = timezone.now()
+        return Response(
+            {
+                "watermark": DATETIME_FIELD.to_representation(watermark),
+                "reset": reset,
+                **get_changes(request.user, since),
+            }
+        )
+
+
 class TrainingRetrieveUpdateDestroyAPIView(
-    generics.RetrieveUpdateDestroyAPIView
+    ConditionalGetMixin,
+    ExerciseTemplatesContextMixin,
+    TrainingReadSerializerMixin,
+    generics.RetrieveUpdateDestroyAPIView,
 ):
     serializer_class = TrainingSerializer
     permission_classes = [IsAuthenticated, IsOwner]
-    queryset = Training.objects.prefetch_related("exercises").all()
+    # Exercises of one training are read lazily, and only when the
+    # response is not answered with 304
+    queryset = Training.objects.all()
 
     def perform_update(self, serializer):
         serializer.save(owner=self.request.user)
+
+    def perform_destroy(self, instance):
+        Training.objects.delete_training(instance, self.request.user)